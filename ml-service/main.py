@@ -16,6 +16,7 @@ import numpy as np
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 # Configuration
@@ -174,7 +175,8 @@ app = FastAPI(
     title="HedgeAI ML Service",
     description="Machine Learning Microservice for Risk Prediction",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -8,6 +8,7 @@ Usage:
 """
 
 import argparse
+import logging
 from pathlib import Path
 import pandas as pd
 
@@ -17,6 +18,9 @@ from src.agents.evaluator import AgentEvaluator
 from src.environments.hedging_env import OptionHedgingEnv
 
 
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Evaluate trained RL agents against baseline strategies"
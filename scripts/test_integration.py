@@ -3,10 +3,15 @@ Integration Test Script
 Tests the complete backend-frontend integration.
 """
 
+import argparse
 import asyncio
+import base64
+import json
+import os
 import sys
 import time
 from pathlib import Path
+from typing import Optional
 import requests
 from colorama import init, Fore, Style
 
@@ -24,6 +29,44 @@ TEST_USER = {
     "email": "demo@hedgerl.com",
     "password": "demo123"
 }
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "hedgerl" / "test_token.json"
+TOKEN_EXPIRY_MARGIN = 60  # seconds
+
+
+def decode_token_exp(token: str) -> Optional[float]:
+    """Read the `exp` claim from a JWT payload (no signature check)."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def load_cached_token() -> Optional[str]:
+    """Return the cached token if it is still valid for at least a minute."""
+    try:
+        with open(TOKEN_CACHE_PATH) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if cached.get("exp", 0) > time.time() + TOKEN_EXPIRY_MARGIN:
+        return cached.get("token")
+    return None
+
+
+def save_cached_token(token: str):
+    """Atomically write the token and its expiry to the on-disk cache."""
+    exp = decode_token_exp(token)
+    if exp is None:
+        return
+
+    TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = TOKEN_CACHE_PATH.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"token": token, "exp": exp}, f)
+    os.replace(tmp_path, TOKEN_CACHE_PATH)
 
 
 def print_section(title: str):
@@ -61,9 +104,10 @@ def print_warning(message: str):
 class IntegrationTester:
     """Integration test runner."""
     
-    def __init__(self):
+    def __init__(self, use_token_cache: bool = True):
         self.session = requests.Session()
         self.token = None
+        self.use_token_cache = use_token_cache
         self.test_results = {
             "passed": 0,
             "failed": 0,
@@ -117,6 +161,17 @@ class IntegrationTester:
         """Test 2: User authentication."""
         print_test("User Authentication")
         try:
+            # Reuse a cached token to skip the (bcrypt-bound) login round-trip
+            cached_token = load_cached_token() if self.use_token_cache else None
+            if cached_token:
+                self.token = cached_token
+                self.session.headers.update({
+                    "Authorization": f"Bearer {self.token}"
+                })
+                print_success("Reusing cached token")
+                self.test_results["passed"] += 1
+                return True
+            
             # Login
             login_data = {
                 "username": TEST_USER["email"],
@@ -141,6 +196,9 @@ class IntegrationTester:
                         "Authorization": f"Bearer {self.token}"
                     })
                     
+                    if self.use_token_cache:
+                        save_cached_token(self.token)
+                    
                     self.test_results["passed"] += 1
                     return True
                 else:
@@ -317,6 +375,14 @@ class IntegrationTester:
 
 def main():
     """Main test execution."""
+    parser = argparse.ArgumentParser(description="Backend-frontend integration tests")
+    parser.add_argument(
+        "--no-token-cache",
+        action="store_true",
+        help=f"Always log in instead of reusing the token cached in {TOKEN_CACHE_PATH}"
+    )
+    args = parser.parse_args()
+    
     print(f"\n{Fore.CYAN}{'=' * 60}")
     print(f"  Integration Test Script")
     print(f"  Derivative Hedging RL Platform")
@@ -337,7 +403,7 @@ def main():
         sys.exit(1)
     
     # Run tests
-    tester = IntegrationTester()
+    tester = IntegrationTester(use_token_cache=not args.no_token_cache)
     success = tester.run_all_tests()
     
     sys.exit(0 if success else 1)
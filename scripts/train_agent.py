@@ -8,12 +8,23 @@ Usage:
 """
 
 import argparse
+import logging
+import os
 from pathlib import Path
 import json
 
-from src.agents.trainer import AgentTrainer
-from src.agents.evaluator import AgentEvaluator
-from src.environments.hedging_env import OptionHedgingEnv
+# One BLAS/OpenMP thread per process, set before anything imports NumPy or
+# torch; environment worker processes inherit it, so n_envs workers do not
+# each spawn a full set of BLAS threads
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+from src.agents.trainer import AgentTrainer  # noqa: E402
+from src.agents.evaluator import AgentEvaluator  # noqa: E402
+from src.environments.hedging_env import OptionHedgingEnv  # noqa: E402
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 
 def main():
@@ -71,6 +82,13 @@ def main():
         help="Random seed for reproducibility"
     )
     
+    parser.add_argument(
+        "--n_envs",
+        type=int,
+        default=8,
+        help="Number of parallel training environments"
+    )
+    
     # Environment configuration
     parser.add_argument(
         "--volatility",
@@ -100,6 +118,12 @@ def main():
         help="Evaluate trained agent against baselines"
     )
     
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        help="Also write evaluation results as CSV (Parquet is always written)"
+    )
+    
     args = parser.parse_args()
     
     # Create environment configuration
@@ -116,6 +140,7 @@ def main():
         env_config=env_config,
         output_dir=args.output_dir,
         seed=args.seed,
+        n_envs=args.n_envs,
     )
     
     print(f"\n{'='*80}")
@@ -127,6 +152,7 @@ def main():
     print(f"  - Volatility: {args.volatility:.1%}")
     print(f"  - Transaction Cost: {args.transaction_cost:.2%}")
     print(f"  - Seed: {args.seed}")
+    print(f"  - Parallel Envs: {args.n_envs}")
     print(f"  - Output: {args.output_dir}")
     print(f"{'='*80}\n")
     
@@ -187,10 +213,17 @@ def main():
         print(comparison_df.to_string(index=False))
         
         # Save results
-        results_path = Path(args.output_dir) / f"{args.agent.lower()}_evaluation.csv"
-        comparison_df.to_csv(results_path, index=False)
+        results_path = Path(args.output_dir) / f"{args.agent.lower()}_evaluation.parquet"
+        comparison_df.to_parquet(
+            results_path, index=False, compression="zstd", engine="pyarrow"
+        )
         print(f"\nResults saved to {results_path}")
         
+        if args.csv:
+            csv_path = results_path.with_suffix(".csv")
+            comparison_df.to_csv(csv_path, index=False)
+            print(f"CSV copy saved to {csv_path}")
+        
         # Generate plots
         plot_path = Path(args.output_dir) / f"{args.agent.lower()}_comparison.png"
         evaluator.plot_comparison(save_path=str(plot_path))
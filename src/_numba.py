@@ -0,0 +1,22 @@
+"""
+Optional Numba support shared by the kernel modules.
+
+Exports ``njit`` and ``NUMBA_AVAILABLE``. Without Numba, ``njit`` is a no-op
+decorator, so the kernels run as plain Python with identical results.
+"""
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` supporting both decorator forms."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit"]
@@ -4,99 +4,165 @@ Configuration presets for training RL agents.
 Contains recommended hyperparameters for different training scenarios.
 """
 
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, List, Tuple
+
+
+@dataclass(frozen=True)
+class PPOConfig:
+    """Immutable PPO preset. Use ``as_dict`` to get agent keyword arguments."""
+
+    learning_rate: float
+    n_steps: int
+    batch_size: int
+    n_epochs: int
+    gamma: float
+    gae_lambda: float
+    clip_range: float
+    ent_coef: float
+    vf_coef: float
+    max_grad_norm: float
+    pi_arch: Tuple[int, ...]
+    vf_arch: Tuple[int, ...]
+
+    def as_dict(self, **overrides) -> Dict[str, Any]:
+        """
+        Materialize a fresh keyword dict for ``PPOHedgingAgent``.
+
+        Args:
+            **overrides: Values replacing the preset entries
+
+        Returns:
+            config: New dictionary (safe to mutate)
+        """
+        config = _scalar_fields(self, ("pi_arch", "vf_arch"))
+        config["policy_kwargs"] = {
+            "net_arch": dict(pi=list(self.pi_arch), vf=list(self.vf_arch)),
+        }
+        config.update(overrides)
+        return config
+
+
+@dataclass(frozen=True)
+class SACConfig:
+    """Immutable SAC preset. Use ``as_dict`` to get agent keyword arguments."""
+
+    learning_rate: float
+    buffer_size: int
+    learning_starts: int
+    batch_size: int
+    tau: float
+    gamma: float
+    train_freq: int
+    gradient_steps: int
+    ent_coef: str
+    net_arch: Tuple[int, ...]
+
+    def as_dict(self, **overrides) -> Dict[str, Any]:
+        """
+        Materialize a fresh keyword dict for ``SACHedgingAgent``.
+
+        Args:
+            **overrides: Values replacing the preset entries
+
+        Returns:
+            config: New dictionary (safe to mutate)
+        """
+        config = _scalar_fields(self, ("net_arch",))
+        config["policy_kwargs"] = {"net_arch": list(self.net_arch)}
+        config.update(overrides)
+        return config
+
+
+def _scalar_fields(preset, skip: Tuple[str, ...]) -> Dict[str, Any]:
+    """Collect the flat (non-architecture) fields of a preset into a dict."""
+    return {f.name: getattr(preset, f.name) for f in fields(preset) if f.name not in skip}
+
+
 # PPO Configurations
 PPO_CONFIGS = {
-    "default": {
-        "learning_rate": 3e-4,
-        "n_steps": 2048,
-        "batch_size": 64,
-        "n_epochs": 10,
-        "gamma": 0.99,
-        "gae_lambda": 0.95,
-        "clip_range": 0.2,
-        "ent_coef": 0.01,
-        "vf_coef": 0.5,
-        "max_grad_norm": 0.5,
-        "policy_kwargs": {
-            "net_arch": [dict(pi=[256, 256], vf=[256, 256])],
-        },
-    },
-    "fast_learning": {
-        "learning_rate": 1e-3,
-        "n_steps": 1024,
-        "batch_size": 128,
-        "n_epochs": 5,
-        "gamma": 0.98,
-        "gae_lambda": 0.95,
-        "clip_range": 0.2,
-        "ent_coef": 0.02,
-        "vf_coef": 0.5,
-        "max_grad_norm": 0.5,
-        "policy_kwargs": {
-            "net_arch": [dict(pi=[128, 128], vf=[128, 128])],
-        },
-    },
-    "stable": {
-        "learning_rate": 1e-4,
-        "n_steps": 2048,
-        "batch_size": 64,
-        "n_epochs": 15,
-        "gamma": 0.995,
-        "gae_lambda": 0.98,
-        "clip_range": 0.15,
-        "ent_coef": 0.005,
-        "vf_coef": 0.5,
-        "max_grad_norm": 0.3,
-        "policy_kwargs": {
-            "net_arch": [dict(pi=[256, 256, 128], vf=[256, 256, 128])],
-        },
-    },
+    "default": PPOConfig(
+        learning_rate=3e-4,
+        n_steps=2048,
+        batch_size=64,
+        n_epochs=10,
+        gamma=0.99,
+        gae_lambda=0.95,
+        clip_range=0.2,
+        ent_coef=0.01,
+        vf_coef=0.5,
+        max_grad_norm=0.5,
+        pi_arch=(256, 256),
+        vf_arch=(256, 256),
+    ),
+    "fast_learning": PPOConfig(
+        learning_rate=1e-3,
+        n_steps=1024,
+        batch_size=128,
+        n_epochs=5,
+        gamma=0.98,
+        gae_lambda=0.95,
+        clip_range=0.2,
+        ent_coef=0.02,
+        vf_coef=0.5,
+        max_grad_norm=0.5,
+        pi_arch=(128, 128),
+        vf_arch=(128, 128),
+    ),
+    "stable": PPOConfig(
+        learning_rate=1e-4,
+        n_steps=2048,
+        batch_size=64,
+        n_epochs=15,
+        gamma=0.995,
+        gae_lambda=0.98,
+        clip_range=0.15,
+        ent_coef=0.005,
+        vf_coef=0.5,
+        max_grad_norm=0.3,
+        pi_arch=(256, 256, 128),
+        vf_arch=(256, 256, 128),
+    ),
 }
 
 # SAC Configurations
 SAC_CONFIGS = {
-    "default": {
-        "learning_rate": 3e-4,
-        "buffer_size": 1000000,
-        "learning_starts": 100,
-        "batch_size": 256,
-        "tau": 0.005,
-        "gamma": 0.99,
-        "train_freq": 1,
-        "gradient_steps": 1,
-        "ent_coef": "auto",
-        "policy_kwargs": {
-            "net_arch": [256, 256],
-        },
-    },
-    "sample_efficient": {
-        "learning_rate": 5e-4,
-        "buffer_size": 500000,
-        "learning_starts": 500,
-        "batch_size": 512,
-        "tau": 0.01,
-        "gamma": 0.99,
-        "train_freq": 4,
-        "gradient_steps": 4,
-        "ent_coef": "auto",
-        "policy_kwargs": {
-            "net_arch": [256, 256],
-        },
-    },
-    "deep": {
-        "learning_rate": 1e-4,
-        "buffer_size": 2000000,
-        "learning_starts": 1000,
-        "batch_size": 256,
-        "tau": 0.002,
-        "gamma": 0.995,
-        "train_freq": 1,
-        "gradient_steps": 1,
-        "ent_coef": "auto",
-        "policy_kwargs": {
-            "net_arch": [512, 512, 256],
-        },
-    },
+    "default": SACConfig(
+        learning_rate=3e-4,
+        buffer_size=1000000,
+        learning_starts=100,
+        batch_size=256,
+        tau=0.005,
+        gamma=0.99,
+        train_freq=1,
+        gradient_steps=1,
+        ent_coef="auto",
+        net_arch=(256, 256),
+    ),
+    "sample_efficient": SACConfig(
+        learning_rate=5e-4,
+        buffer_size=500000,
+        learning_starts=500,
+        batch_size=512,
+        tau=0.01,
+        gamma=0.99,
+        train_freq=4,
+        gradient_steps=4,
+        ent_coef="auto",
+        net_arch=(256, 256),
+    ),
+    "deep": SACConfig(
+        learning_rate=1e-4,
+        buffer_size=2000000,
+        learning_starts=1000,
+        batch_size=256,
+        tau=0.002,
+        gamma=0.995,
+        train_freq=1,
+        gradient_steps=1,
+        ent_coef="auto",
+        net_arch=(512, 512, 256),
+    ),
 }
 
 # Environment Configurations
@@ -189,20 +255,67 @@ OPTUNA_SEARCH_SPACES = {
 }
 
 
-def get_config(agent_type: str, config_name: str = "default"):
+def _compile_param(name: str, spec: Dict[str, Any]) -> Callable[[Any], Any]:
+    """
+    Specialize one search-space entry into a ``trial -> value`` sampler.
+
+    Args:
+        name: Hyperparameter name
+        spec: Search-space specification ({"type": ..., ...})
+
+    Returns:
+        sample: Callable drawing the parameter from an Optuna trial
+    """
+    kind = spec.get("type")
+
+    if kind in ("loguniform", "uniform", "int"):
+        low, high = spec["low"], spec["high"]
+        if not low < high:
+            raise ValueError(f"Invalid range for '{name}': low={low} must be < high={high}")
+        if kind == "loguniform":
+            if low <= 0:
+                raise ValueError(f"Log-uniform range for '{name}' must be positive, got {low}")
+            return lambda trial: trial.suggest_float(name, low, high, log=True)
+        if kind == "uniform":
+            return lambda trial: trial.suggest_float(name, low, high)
+        return lambda trial: trial.suggest_int(name, low, high)
+
+    if kind == "categorical":
+        choices = list(spec["choices"])
+        if not choices:
+            raise ValueError(f"Categorical search space for '{name}' has no choices")
+        return lambda trial: trial.suggest_categorical(name, choices)
+
+    raise ValueError(f"Unknown search space type for '{name}': {kind}")
+
+
+# Samplers compiled (and validated) once at import time; each trial just calls them
+COMPILED_SEARCH_SPACES: Dict[str, List[Tuple[str, Callable[[Any], Any]]]] = {
+    agent_type: [(name, _compile_param(name, spec)) for name, spec in space.items()]
+    for agent_type, space in OPTUNA_SEARCH_SPACES.items()
+}
+
+
+def get_config(agent_type: str, config_name: str = "default", **overrides) -> Dict[str, Any]:
     """
     Get configuration for agent.
 
+    Presets are immutable; a new dictionary is built on every call so callers
+    (e.g. Optuna trials) can mutate the result without affecting other runs.
+
     Args:
         agent_type: 'PPO' or 'SAC'
         config_name: Configuration name
+        **overrides: Values replacing the preset entries
 
     Returns:
         config: Configuration dictionary
     """
     if agent_type.upper() == "PPO":
-        return PPO_CONFIGS.get(config_name, PPO_CONFIGS["default"])
+        preset = PPO_CONFIGS.get(config_name, PPO_CONFIGS["default"])
     elif agent_type.upper() == "SAC":
-        return SAC_CONFIGS.get(config_name, SAC_CONFIGS["default"])
+        preset = SAC_CONFIGS.get(config_name, SAC_CONFIGS["default"])
     else:
         raise ValueError(f"Unknown agent type: {agent_type}")
+
+    return preset.as_dict(**overrides)
@@ -2,16 +2,19 @@
 Evaluation framework for comparing RL agents with baseline strategies.
 """
 
+import io
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv, VecEnv
 
 from src.agents.ppo_agent import PPOHedgingAgent
 from src.agents.sac_agent import SACHedgingAgent
+from src.baselines._numba_kernels import delta_gamma_hedge_action, delta_hedge_action
 from src.baselines.hedging_strategies import (
     DeltaGammaHedging,
     DeltaGammaVegaHedging,
@@ -19,8 +22,27 @@ from src.baselines.hedging_strategies import (
     MinimumVarianceHedging,
 )
 from src.environments.hedging_env import OptionHedgingEnv
+from src.environments.vectorized import batch_reset, batch_step
 from src.evaluation.metrics import HedgingEvaluator
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+logger = logging.getLogger(__name__)
+
+_COMPARISON_DTYPE = np.dtype(
+    [
+        ("Strategy", object),
+        ("Mean Reward", "f8"),
+        ("Std Reward", "f8"),
+        ("Mean PnL", "f8"),
+        ("Std PnL", "f8"),
+        ("Mean Costs", "f8"),
+        ("Sharpe Ratio", "f8"),
+        ("Success Rate", "f8"),
+    ]
+)
+
 
 class AgentEvaluator:
     """
@@ -38,6 +60,9 @@ class AgentEvaluator:
         env: OptionHedgingEnv,
         n_episodes: int = 100,
         seed: Optional[int] = None,
+        env_fn: Optional[Callable[[], OptionHedgingEnv]] = None,
+        n_envs: int = 1,
+        use_subprocess: bool = False,
     ):
         """
         Initialize evaluator.
@@ -46,11 +71,44 @@ class AgentEvaluator:
             env: Environment for evaluation
             n_episodes: Number of episodes to evaluate
             seed: Random seed
+            env_fn: Factory building fresh environments for parallel RL evaluation
+            n_envs: Number of environment copies stepped in lockstep (requires env_fn if > 1)
+            use_subprocess: Run environment copies in worker processes (SubprocVecEnv)
         """
+        if n_envs < 1:
+            raise ValueError(f"n_envs must be >= 1, got {n_envs}")
+        if n_envs > 1 and env_fn is None:
+            raise ValueError("env_fn is required when n_envs > 1")
+
         self.env = env
         self.n_episodes = n_episodes
         self.seed = seed
+        self.env_fn = env_fn
+        self.n_envs = n_envs
+        self.use_subprocess = use_subprocess
         self.results = {}
+        self._vec_env: Optional[VecEnv] = None
+        self._figure: Optional["Figure"] = None
+        self._ranked_names: Optional[List[str]] = None
+
+    def _get_vec_env(self) -> VecEnv:
+        """Build (once) the vectorized environment used for RL agent evaluation."""
+        if self._vec_env is None:
+            if self.env_fn is None:
+                env_fns = [lambda: self.env]
+            else:
+                env_fns = [self.env_fn] * self.n_envs
+
+            vec_env_cls = SubprocVecEnv if self.use_subprocess else DummyVecEnv
+            self._vec_env = vec_env_cls(env_fns)
+
+        return self._vec_env
+
+    def close(self) -> None:
+        """Close the vectorized evaluation environment (and its worker processes)."""
+        if self._vec_env is not None:
+            self._vec_env.close()
+            self._vec_env = None
 
     def evaluate_rl_agent(
         self,
@@ -69,62 +127,196 @@ class AgentEvaluator:
         Returns:
             results: Dictionary of metrics
         """
-        print(f"\nEvaluating {agent_name}...")
+        logger.info("\nEvaluating %s...", agent_name)
+
+        episode_rewards = np.empty(self.n_episodes, dtype=np.float32)
+        episode_costs = np.empty(self.n_episodes, dtype=np.float32)
+        episode_pnls = np.empty(self.n_episodes, dtype=np.float32)
+        episode_sharpes = np.empty(self.n_episodes, dtype=np.float32)
+        n_done = 0
+
+        # Step all environment copies in lockstep so each predict() call is batched
+        vec_env = self._get_vec_env()
+        vec_env.seed(self.seed)
+        obs = vec_env.reset()
+        running_rewards = np.zeros(vec_env.num_envs)
+
+        # On GPU, replay the policy forward pass from a captured CUDA graph
+        if (
+            deterministic
+            and hasattr(agent, "enable_cuda_graph")
+            and agent.model.device.type == "cuda"
+        ):
+            agent.enable_cuda_graph(vec_env.num_envs)
+
+        # Bind the per-step callables once outside the loop
+        predict = _batch_predict_fn(agent)
+        env_step = vec_env.step
+
+        while n_done < self.n_episodes:
+            actions = predict(obs, deterministic)
+            obs, rewards, dones, infos = env_step(actions)
+            running_rewards += rewards
+
+            if not dones.any():
+                continue
+
+            # Finished environments are auto-reset by the VecEnv; parallel envs can
+            # finish together, so stop filling once n_episodes are recorded
+            finished = np.flatnonzero(dones)[: self.n_episodes - n_done]
+            slots = slice(n_done, n_done + len(finished))
+            episode_rewards[slots] = running_rewards[finished]
+            for slot, i in enumerate(finished, start=n_done):
+                metrics = infos[i]["episode_metrics"]
+                episode_costs[slot] = metrics["total_costs"]
+                episode_pnls[slot] = metrics["total_pnl"]
+                episode_sharpes[slot] = metrics["sharpe_ratio"]
+            n_done += len(finished)
+            running_rewards[dones] = 0.0
+
+        return self._aggregate_results(
+            agent_name, episode_rewards, episode_costs, episode_pnls, episode_sharpes
+        )
+
+    def evaluate_rl_agent_batched(
+        self,
+        agent: Union[PPOHedgingAgent, SACHedgingAgent],
+        agent_name: str = "RL Agent",
+        deterministic: bool = True,
+        n_parallel: int = 1024,
+    ) -> Dict[str, Any]:
+        """
+        Evaluate an RL agent by rolling out up to ``n_parallel`` episodes as arrays.
+
+        Uses the batched dynamics in ``src.environments.vectorized`` instead of
+        stepping environment objects, so each timestep is one policy forward
+        pass plus one vectorized environment update for the whole chunk.
+
+        Args:
+            agent: Trained RL agent
+            agent_name: Name for results
+            deterministic: Whether to use deterministic policy
+            n_parallel: Maximum number of episodes rolled out together
+
+        Returns:
+            results: Dictionary of metrics
+        """
+        logger.info("\nEvaluating %s (batched)...", agent_name)
 
-        episode_rewards = []
-        episode_costs = []
-        episode_pnls = []
-        episode_sharpes = []
+        episode_rewards = np.empty(self.n_episodes, dtype=np.float32)
+        episode_costs = np.empty(self.n_episodes, dtype=np.float32)
+        episode_pnls = np.empty(self.n_episodes, dtype=np.float32)
+        episode_sharpes = np.empty(self.n_episodes, dtype=np.float32)
 
-        for episode in range(self.n_episodes):
-            obs, _ = self.env.reset(seed=self.seed + episode if self.seed else None)
+        rng = np.random.default_rng(self.seed)
+        env = self.env
+        predict = _batch_predict_fn(agent)
+        standard_normal = rng.standard_normal
 
-            episode_reward = 0
-            done = False
+        for start in range(0, self.n_episodes, n_parallel):
+            stop = min(start + n_parallel, self.n_episodes)
+            state, obs = batch_reset(env, stop - start)
+            running_rewards = np.zeros(stop - start)
 
+            done = False
             while not done:
-                action, _ = agent.predict(obs, deterministic=deterministic)
-                obs, reward, terminated, truncated, info = self.env.step(action)
-                episode_reward += reward
-                done = terminated or truncated
+                actions = predict(obs, deterministic)
+                noise = standard_normal(stop - start)
+                obs, rewards, done = batch_step(env, state, actions, noise)
+                running_rewards += rewards
+
+            metrics = state.episode_metrics()
+            episode_rewards[start:stop] = running_rewards
+            episode_costs[start:stop] = metrics["total_costs"]
+            episode_pnls[start:stop] = metrics["total_pnl"]
+            episode_sharpes[start:stop] = metrics["sharpe_ratio"]
+
+        return self._aggregate_results(
+            agent_name, episode_rewards, episode_costs, episode_pnls, episode_sharpes
+        )
 
-            # Get episode metrics
-            metrics = self.env.get_episode_metrics()
+    def _simulate_shared_paths(self) -> Dict[str, np.ndarray]:
+        """
+        Simulate the stock path of every evaluation episode once.
 
-            episode_rewards.append(episode_reward)
-            episode_costs.append(metrics["total_costs"])
-            episode_pnls.append(metrics["total_pnl"])
-            episode_sharpes.append(metrics["sharpe_ratio"])
+        Draws from a single generator seeded like the environment in
+        ``evaluate_baseline``, so the paths are the ones the environment would
+        generate episode after episode.
 
-        # Aggregate results
-        results = {
-            "agent_name": agent_name,
-            "mean_reward": np.mean(episode_rewards),
-            "std_reward": np.std(episode_rewards),
-            "mean_pnl": np.mean(episode_pnls),
-            "std_pnl": np.std(episode_pnls),
-            "mean_costs": np.mean(episode_costs),
-            "sharpe_ratio": np.mean(episode_sharpes),
-            "success_rate": np.mean([p > 0 for p in episode_pnls]),
-            "episode_rewards": episode_rewards,
-            "episode_costs": episode_costs,
-            "episode_pnls": episode_pnls,
-        }
+        Returns:
+            paths: ``noise`` (n_episodes, n_steps) standard normals,
+                ``S_path`` (n_episodes, n_steps + 1) prices and
+                ``tau_grid`` (n_steps + 1,) times to maturity
+        """
+        env = self.env
+        noise = np.random.default_rng(self.seed).standard_normal((self.n_episodes, env.n_steps))
 
-        self.results[agent_name] = results
+        S_path = np.empty((self.n_episodes, env.n_steps + 1))
+        S_path[:, 0] = env.S0
+        drift = (env.r - 0.5 * env.sigma**2) * env.dt
+        vol = env.sigma * np.sqrt(env.dt)
+        for t in range(env.n_steps):
+            S_path[:, t + 1] = S_path[:, t] * np.exp(drift + vol * noise[:, t])
 
-        print(f"  Mean Reward: {results['mean_reward']:.2f} ± {results['std_reward']:.2f}")
-        print(f"  Mean PnL: {results['mean_pnl']:.2f} ± {results['std_pnl']:.2f}")
-        print(f"  Mean Costs: {results['mean_costs']:.2f}")
-        print(f"  Sharpe Ratio: {results['sharpe_ratio']:.3f}")
-        print(f"  Success Rate: {results['success_rate']*100:.1f}%")
+        tau_grid = np.maximum(env.T - np.arange(env.n_steps + 1) * env.dt, 0.0)
 
-        return results
+        return {"noise": noise, "S_path": S_path, "tau_grid": tau_grid}
+
+    def _baseline_actions_on_paths(
+        self,
+        strategy_class,
+        S_path: np.ndarray,
+        tau_grid: np.ndarray,
+        **strategy_kwargs,
+    ) -> np.ndarray:
+        """
+        Target positions of a baseline along precomputed stock paths.
+
+        Args:
+            strategy_class: Baseline strategy class
+            S_path: Stock paths of shape (n_episodes, n_steps + 1)
+            tau_grid: Times to maturity of shape (n_steps + 1,)
+            **strategy_kwargs: Arguments for strategy initialization
+
+        Returns:
+            actions: Target positions of shape (n_episodes, n_steps)
+        """
+        env = self.env
+        strategy = strategy_class(
+            S0=env.S0,
+            K=env.K,
+            T=env.T,
+            r=env.r,
+            sigma=env.sigma,
+            option_type=env.option_type,
+            transaction_cost=env.transaction_cost,
+            **strategy_kwargs,
+        )
+        S_grid = S_path[:, :-1]
+        tau_steps = tau_grid[:-1]
+
+        # Delta hedging is stateless and array-aware: one call for the whole grid
+        if strategy_class is DeltaHedging:
+            positions = strategy.get_hedge_positions(
+                S_grid, np.broadcast_to(tau_steps, S_grid.shape)
+            )
+            return positions["stock"]
+
+        actions = np.empty_like(S_grid)
+        for episode in range(S_grid.shape[0]):
+            strategy.reset()
+            strategy.initialize()
+            for t, tau in enumerate(tau_steps):
+                positions = strategy.get_hedge_positions(S=S_grid[episode, t], tau=tau)
+                actions[episode, t] = positions["stock"]
+
+        return actions
 
     def evaluate_baseline(
         self,
         strategy_class,
         strategy_name: str,
+        cached_paths: Optional[Dict[str, np.ndarray]] = None,
         **strategy_kwargs,
     ) -> Dict[str, Any]:
         """
@@ -133,99 +325,238 @@ class AgentEvaluator:
         Args:
             strategy_class: Baseline strategy class
             strategy_name: Name for results
+            cached_paths: Shared stock paths from ``_simulate_shared_paths``; used when
+                the environment is path independent to skip stepping it
             **strategy_kwargs: Arguments for strategy initialization
 
         Returns:
             results: Dictionary of metrics
         """
-        print(f"\nEvaluating {strategy_name}...")
-
-        episode_pnls = []
-        episode_costs = []
-        episode_sharpes = []
-        episode_rewards = []
+        logger.info("\nEvaluating %s...", strategy_name)
 
-        for episode in range(self.n_episodes):
-            # Reset environment
-            obs, info = self.env.reset(seed=self.seed + episode if self.seed else None)
-
-            # Create strategy
-            strategy = strategy_class(
-                S0=info["S0"],
-                K=info["K"],
-                T=info["T"],
-                r=self.env.r,
-                sigma=self.env.sigma,
-                option_type=self.env.option_type,
-                transaction_cost=self.env.transaction_cost,
-                **strategy_kwargs,
+        if cached_paths is not None and getattr(self.env, "is_path_independent", False):
+            actions = self._baseline_actions_on_paths(
+                strategy_class, cached_paths["S_path"], cached_paths["tau_grid"], **strategy_kwargs
             )
 
-            # Initialize strategy
-            strategy.initialize()
-
-            episode_reward = 0
-            done = False
-            step = 0
+            state, _ = batch_reset(self.env, self.n_episodes)
+            running_rewards = np.zeros(self.n_episodes)
+            for t in range(self.env.n_steps):
+                _, rewards, _ = batch_step(
+                    self.env, state, actions[:, t], cached_paths["noise"][:, t]
+                )
+                running_rewards += rewards
+
+            metrics = state.episode_metrics()
+            return self._aggregate_results(
+                strategy_name,
+                running_rewards.astype(np.float32),
+                metrics["total_costs"].astype(np.float32),
+                metrics["total_pnl"].astype(np.float32),
+                metrics["sharpe_ratio"].astype(np.float32),
+            )
 
-            while not done:
-                # Get baseline action
-                tau = max(info["T"] - step * self.env.dt, 0)
-                positions = strategy.get_hedge_positions(S=info["S"], tau=tau)
+        episode_rewards = np.empty(self.n_episodes, dtype=np.float32)
+        episode_costs = np.empty(self.n_episodes, dtype=np.float32)
+        episode_pnls = np.empty(self.n_episodes, dtype=np.float32)
+        episode_sharpes = np.empty(self.n_episodes, dtype=np.float32)
 
-                # Convert to environment action (target position)
-                target_position = positions.get("stock", 0.0)
-                action = np.array([target_position])
+        # One strategy per contract (S0, K, T); reset between episodes instead of rebuilding
+        strategies = {}
 
-                # Step environment
-                obs, reward, terminated, truncated, info = self.env.step(action)
-                episode_reward += reward
-                done = terminated or truncated
-                step += 1
+        for episode in range(self.n_episodes):
+            # Seed only the first reset; later episodes continue the same random stream
+            obs, info = self.env.reset(seed=self.seed) if episode == 0 else self.env.reset()
+
+            # Analytic baselines take the compiled fast path
+            if strategy_class in (DeltaHedging, DeltaGammaHedging):
+                episode_reward = self._rollout_compiled_baseline(strategy_class)
+            else:
+                contract = (info["S0"], info["K"], info["T"])
+                strategy = strategies.get(contract)
+                if strategy is None:
+                    strategy = strategy_class(
+                        S0=info["S0"],
+                        K=info["K"],
+                        T=info["T"],
+                        r=self.env.r,
+                        sigma=self.env.sigma,
+                        option_type=self.env.option_type,
+                        transaction_cost=self.env.transaction_cost,
+                        **strategy_kwargs,
+                    )
+                    strategies[contract] = strategy
+                else:
+                    strategy.reset()
+
+                # Initialize strategy
+                strategy.initialize()
+
+                episode_reward = 0
+                done = False
+                step = 0
+
+                # Bind loop invariants to locals and reuse one action buffer
+                action = np.empty(1, dtype=np.float64)
+                env_step = self.env.step
+                dt = self.env.dt
+                T_opt = info["T"]
+                get_positions = strategy.get_hedge_positions
+
+                while not done:
+                    # Get baseline action
+                    tau = max(T_opt - step * dt, 0)
+                    positions = get_positions(S=info["S"], tau=tau)
+
+                    # Convert to environment action (target position)
+                    action[0] = positions["stock"]
+
+                    # Step environment
+                    obs, reward, terminated, truncated, info = env_step(action)
+                    episode_reward += reward
+                    done = terminated or truncated
+                    step += 1
 
             # Get episode metrics
             metrics = self.env.get_episode_metrics()
 
-            episode_rewards.append(episode_reward)
-            episode_pnls.append(metrics["total_pnl"])
-            episode_costs.append(metrics["total_costs"])
-            episode_sharpes.append(metrics["sharpe_ratio"])
+            episode_rewards[episode] = episode_reward
+            episode_pnls[episode] = metrics["total_pnl"]
+            episode_costs[episode] = metrics["total_costs"]
+            episode_sharpes[episode] = metrics["sharpe_ratio"]
 
-        # Aggregate results
+        return self._aggregate_results(
+            strategy_name, episode_rewards, episode_costs, episode_pnls, episode_sharpes
+        )
+
+    def _aggregate_results(
+        self,
+        name: str,
+        episode_rewards: np.ndarray,
+        episode_costs: np.ndarray,
+        episode_pnls: np.ndarray,
+        episode_sharpes: np.ndarray,
+    ) -> Dict[str, Any]:
+        """
+        Summarize per-episode metric arrays, store and print the results.
+
+        Args:
+            name: Agent or strategy name
+            episode_rewards: Total reward per episode
+            episode_costs: Transaction costs per episode
+            episode_pnls: Final PnL per episode
+            episode_sharpes: Sharpe ratio per episode
+
+        Returns:
+            results: Dictionary of metrics
+        """
         results = {
-            "agent_name": strategy_name,
-            "mean_reward": np.mean(episode_rewards),
-            "std_reward": np.std(episode_rewards),
-            "mean_pnl": np.mean(episode_pnls),
-            "std_pnl": np.std(episode_pnls),
-            "mean_costs": np.mean(episode_costs),
-            "sharpe_ratio": np.mean(episode_sharpes),
-            "success_rate": np.mean([p > 0 for p in episode_pnls]),
+            "agent_name": name,
+            "mean_reward": float(episode_rewards.mean()),
+            "std_reward": float(episode_rewards.std()),
+            "mean_pnl": float(episode_pnls.mean()),
+            "std_pnl": float(episode_pnls.std()),
+            "mean_costs": float(episode_costs.mean()),
+            "sharpe_ratio": float(episode_sharpes.mean()),
+            "success_rate": float((episode_pnls > 0).mean()),
             "episode_rewards": episode_rewards,
             "episode_costs": episode_costs,
             "episode_pnls": episode_pnls,
         }
 
-        self.results[strategy_name] = results
-
-        print(f"  Mean Reward: {results['mean_reward']:.2f} ± {results['std_reward']:.2f}")
-        print(f"  Mean PnL: {results['mean_pnl']:.2f} ± {results['std_pnl']:.2f}")
-        print(f"  Mean Costs: {results['mean_costs']:.2f}")
-        print(f"  Sharpe Ratio: {results['sharpe_ratio']:.3f}")
-        print(f"  Success Rate: {results['success_rate']*100:.1f}%")
+        self.results[name] = results
+        self._ranked_names = None
+
+        logger.info(
+            "  Mean Reward: %.2f ± %.2f\n"
+            "  Mean PnL: %.2f ± %.2f\n"
+            "  Mean Costs: %.2f\n"
+            "  Sharpe Ratio: %.3f\n"
+            "  Success Rate: %.1f%%",
+            results["mean_reward"],
+            results["std_reward"],
+            results["mean_pnl"],
+            results["std_pnl"],
+            results["mean_costs"],
+            results["sharpe_ratio"],
+            results["success_rate"] * 100,
+        )
 
         return results
 
-    def evaluate_all_baselines(self) -> Dict[str, Dict[str, Any]]:
+    def _rollout_compiled_baseline(self, strategy_class) -> float:
+        """
+        Run one episode of Delta / Delta-Gamma hedging using the compiled kernels.
+
+        Reads the state straight from the environment and reuses one action
+        buffer, avoiding strategy objects and Greek dictionaries in the loop.
+
+        Args:
+            strategy_class: DeltaHedging or DeltaGammaHedging
+
+        Returns:
+            episode_reward: Total episode reward
+        """
+        env = self.env
+        is_call = env.option_type == "call"
+        use_gamma = strategy_class is DeltaGammaHedging
+        action = np.empty(1, dtype=np.float32)
+
+        # Contract parameters are fixed for the episode; only env.S changes
+        env_step = env.step
+        S0, K, T, r, sigma, dt = env.S0, env.K, env.T, env.r, env.sigma, env.dt
+
+        episode_reward = 0.0
+        done = False
+        step = env.current_step
+
+        while not done:
+            tau = max(T - step * dt, 0.0)
+            if use_gamma:
+                action[0] = delta_gamma_hedge_action(env.S, S0, K, tau, r, sigma, is_call)
+            else:
+                action[0] = delta_hedge_action(env.S, K, tau, r, sigma, is_call)
+
+            _, reward, terminated, truncated, _ = env_step(action)
+            episode_reward += reward
+            done = terminated or truncated
+            step += 1
+
+        return episode_reward
+
+    def _env_spec(self) -> Optional[Dict[str, Any]]:
+        """Constructor arguments that rebuild ``self.env`` in a worker process, if possible."""
+        if type(self.env) is not OptionHedgingEnv:
+            return None
+
+        return {
+            name: getattr(self.env, name)
+            for name in (
+                "S0",
+                "K",
+                "T",
+                "r",
+                "sigma",
+                "n_steps",
+                "option_type",
+                "action_mode",
+                "transaction_cost",
+                "risk_penalty",
+            )
+        }
+
+    def evaluate_all_baselines(self, n_workers: int = 1) -> Dict[str, Dict[str, Any]]:
         """
         Evaluate all baseline strategies.
 
+        Args:
+            n_workers: Number of worker processes; baselines are independent, so with
+                more than one worker they are evaluated in parallel
+
         Returns:
             results: Dictionary of results for each baseline
         """
-        print(f"\n{'='*60}")
-        print("Evaluating All Baseline Strategies")
-        print(f"{'='*60}")
+        logger.info("\n%s\nEvaluating All Baseline Strategies\n%s", "=" * 60, "=" * 60)
 
         baselines = [
             (DeltaHedging, "Delta Hedging", {}),
@@ -238,8 +569,40 @@ class AgentEvaluator:
             (MinimumVarianceHedging, "Minimum Variance Hedging", {"lookback_window": 20}),
         ]
 
-        for strategy_class, strategy_name, kwargs in baselines:
-            self.evaluate_baseline(strategy_class, strategy_name, **kwargs)
+        # Stock paths do not depend on the hedge, so simulate them once for all baselines
+        cached_paths = None
+        if getattr(self.env, "is_path_independent", False):
+            cached_paths = self._simulate_shared_paths()
+
+        env_spec = self._env_spec() if n_workers > 1 else None
+        if env_spec is None:
+            for strategy_class, strategy_name, kwargs in baselines:
+                self.evaluate_baseline(strategy_class, strategy_name, cached_paths, **kwargs)
+            return self.results
+
+        # Each worker rebuilds the environment from its parameters
+        completed = {}
+        with ProcessPoolExecutor(max_workers=min(n_workers, len(baselines))) as executor:
+            futures = {
+                executor.submit(
+                    _eval_baseline_worker,
+                    strategy_class,
+                    strategy_name,
+                    kwargs,
+                    env_spec,
+                    self.n_episodes,
+                    self.seed,
+                    cached_paths,
+                ): strategy_name
+                for strategy_class, strategy_name, kwargs in baselines
+            }
+            for future in as_completed(futures):
+                completed[futures[future]] = future.result()
+
+        # Keep the baseline order stable regardless of completion order
+        for _, strategy_name, _ in baselines:
+            self.results[strategy_name] = completed[strategy_name]
+        self._ranked_names = None
 
         return self.results
 
@@ -264,54 +627,76 @@ class AgentEvaluator:
         # Evaluate baselines
         self.evaluate_all_baselines()
 
-        # Create comparison DataFrame
-        comparison_data = []
-        for name, results in self.results.items():
-            comparison_data.append(
-                {
-                    "Strategy": name,
-                    "Mean Reward": results["mean_reward"],
-                    "Std Reward": results["std_reward"],
-                    "Mean PnL": results["mean_pnl"],
-                    "Std PnL": results["std_pnl"],
-                    "Mean Costs": results["mean_costs"],
-                    "Sharpe Ratio": results["sharpe_ratio"],
-                    "Success Rate": results["success_rate"] * 100,
-                }
-            )
+        # Create comparison DataFrame from a typed record array (no dtype inference)
+        records = np.array(
+            [
+                (
+                    name,
+                    results["mean_reward"],
+                    results["std_reward"],
+                    results["mean_pnl"],
+                    results["std_pnl"],
+                    results["mean_costs"],
+                    results["sharpe_ratio"],
+                    results["success_rate"] * 100,
+                )
+                for name, results in self.results.items()
+            ],
+            dtype=_COMPARISON_DTYPE,
+        )
 
-        df = pd.DataFrame(comparison_data)
-        df = df.sort_values("Mean Reward", ascending=False)
+        # Order by mean reward (descending) before building the frame
+        order = np.argsort(-records["Mean Reward"], kind="stable")
+        df = pd.DataFrame.from_records(records[order], index=order)
 
         return df
 
     def plot_comparison(
         self,
         save_path: Optional[str] = None,
+        dpi: int = 150,
     ) -> None:
         """
         Create comparison plots.
 
         Args:
             save_path: Path to save plots
+            dpi: Resolution of the saved image
         """
         if not self.results:
-            print("No results to plot. Run evaluation first.")
+            logger.warning("No results to plot. Run evaluation first.")
             return
 
+        # Plotting libraries are imported lazily so headless training never pays for them
+        import matplotlib
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         # Set style
         sns.set_style("whitegrid")
 
-        # Create subplots
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        # Reuse the figure across calls instead of opening a new window each time
+        if self._figure is None or not plt.fignum_exists(self._figure.number):
+            self._figure = plt.figure(figsize=(15, 10))
+        fig = self._figure
+        fig.clf()
+        axes = fig.subplots(2, 2)
         fig.suptitle("RL Agent vs Baseline Strategies Comparison", fontsize=16, fontweight="bold")
 
-        # Extract data
+        # Extract data in a single pass over the results
         names = list(self.results.keys())
-        mean_rewards = [self.results[name]["mean_reward"] for name in names]
-        mean_costs = [self.results[name]["mean_costs"] for name in names]
-        sharpe_ratios = [self.results[name]["sharpe_ratio"] for name in names]
-        success_rates = [self.results[name]["success_rate"] * 100 for name in names]
+        data = np.fromiter(
+            (
+                (r["mean_reward"], r["mean_costs"], r["sharpe_ratio"], r["success_rate"] * 100)
+                for r in self.results.values()
+            ),
+            dtype=[("reward", "f8"), ("costs", "f8"), ("sharpe", "f8"), ("success", "f8")],
+            count=len(self.results),
+        )
+        mean_rewards = data["reward"]
+        mean_costs = data["costs"]
+        sharpe_ratios = data["sharpe"]
+        success_rates = data["success"]
 
         # Color RL agents differently
         colors = ["#2ecc71" if "PPO" in name or "SAC" in name else "#3498db" for name in names]
@@ -340,13 +725,32 @@ class AgentEvaluator:
         axes[1, 1].set_title("Profitable Episodes", fontsize=13, fontweight="bold")
         axes[1, 1].set_xlim(0, 100)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches="tight")
-            print(f"Plot saved to {save_path}")
+            save_kwargs = {"pil_kwargs": {"optimize": True}} if save_path.endswith(".png") else {}
+            fig.savefig(save_path, dpi=dpi, bbox_inches="tight", **save_kwargs)
+            logger.info("Plot saved to %s", save_path)
+
+        # Headless backends cannot show a window; just flush the canvas
+        if save_path and matplotlib.get_backend().lower() == "agg":
+            fig.canvas.draw_idle()
+        else:
+            plt.show()
+
+    def _ranked_result_names(self) -> List[str]:
+        """Result names ordered by mean reward (descending), cached until results change."""
+        if self._ranked_names is None or len(self._ranked_names) != len(self.results):
+            names = list(self.results)
+            mean_rewards = np.fromiter(
+                (results["mean_reward"] for results in self.results.values()),
+                dtype=np.float64,
+                count=len(names),
+            )
+            order = np.argsort(-mean_rewards, kind="stable")
+            self._ranked_names = [names[i] for i in order]
 
-        plt.show()
+        return self._ranked_names
 
     def generate_report(
         self,
@@ -361,57 +765,95 @@ class AgentEvaluator:
         Returns:
             report: Report text
         """
-        report = []
-        report.append("=" * 80)
-        report.append("RL AGENT EVALUATION REPORT")
-        report.append("=" * 80)
-        report.append("")
-
-        report.append(f"Evaluation Settings:")
-        report.append(f"  - Episodes: {self.n_episodes}")
-        report.append(f"  - Environment: {self.env.__class__.__name__}")
-        report.append(f"  - Option Type: {self.env.option_type}")
-        report.append(f"  - Volatility: {self.env.sigma:.1%}")
-        report.append(f"  - Transaction Cost: {self.env.transaction_cost:.2%}")
-        report.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w("=" * 80 + "\n")
+        w("RL AGENT EVALUATION REPORT\n")
+        w("=" * 80 + "\n")
+        w("\n")
+
+        w(f"Evaluation Settings:\n")
+        w(f"  - Episodes: {self.n_episodes}\n")
+        w(f"  - Environment: {self.env.__class__.__name__}\n")
+        w(f"  - Option Type: {self.env.option_type}\n")
+        w(f"  - Volatility: {self.env.sigma:.1%}\n")
+        w(f"  - Transaction Cost: {self.env.transaction_cost:.2%}\n")
+        w("\n")
 
         # Sort by mean reward
-        sorted_results = sorted(
-            self.results.items(), key=lambda x: x[1]["mean_reward"], reverse=True
-        )
+        sorted_results = [(name, self.results[name]) for name in self._ranked_result_names()]
 
-        report.append("Results Summary (sorted by Mean Reward):")
-        report.append("-" * 80)
+        w("Results Summary (sorted by Mean Reward):\n")
+        w("-" * 80 + "\n")
 
         for name, results in sorted_results:
-            report.append(f"\n{name}:")
-            report.append(
-                f"  Mean Reward:     {results['mean_reward']:>10.2f} ± {results['std_reward']:.2f}"
-            )
-            report.append(
-                f"  Mean PnL:        {results['mean_pnl']:>10.2f} ± {results['std_pnl']:.2f}"
-            )
-            report.append(f"  Mean Costs:      {results['mean_costs']:>10.2f}")
-            report.append(f"  Sharpe Ratio:    {results['sharpe_ratio']:>10.3f}")
-            report.append(f"  Success Rate:    {results['success_rate']*100:>10.1f}%")
+            w(f"\n{name}:\n")
+            w(f"  Mean Reward:     {results['mean_reward']:>10.2f} ± {results['std_reward']:.2f}\n")
+            w(f"  Mean PnL:        {results['mean_pnl']:>10.2f} ± {results['std_pnl']:.2f}\n")
+            w(f"  Mean Costs:      {results['mean_costs']:>10.2f}\n")
+            w(f"  Sharpe Ratio:    {results['sharpe_ratio']:>10.3f}\n")
+            w(f"  Success Rate:    {results['success_rate']*100:>10.1f}%\n")
 
         # Best strategy
         best_name = sorted_results[0][0]
         best_results = sorted_results[0][1]
 
-        report.append("")
-        report.append("=" * 80)
-        report.append(f"BEST STRATEGY: {best_name}")
-        report.append(f"  Outperforms baseline by: {best_results['mean_reward']:.2f} reward")
-        report.append("=" * 80)
+        w("\n")
+        w("=" * 80 + "\n")
+        w(f"BEST STRATEGY: {best_name}\n")
+        w(f"  Outperforms baseline by: {best_results['mean_reward']:.2f} reward\n")
+        w("=" * 80 + "\n")
 
-        report_text = "\n".join(report)
+        report_text = buf.getvalue().rstrip("\n")
 
         if output_path:
             with open(output_path, "w") as f:
                 f.write(report_text)
-            print(f"\nReport saved to {output_path}")
+            logger.info("\nReport saved to %s", output_path)
 
-        print("\n" + report_text)
+        logger.info("\n%s", report_text)
 
         return report_text
+
+
+def _batch_predict_fn(
+    agent: Union[PPOHedgingAgent, SACHedgingAgent],
+) -> Callable[[np.ndarray, bool], np.ndarray]:
+    """Return a callable mapping a batch of observations to actions for ``agent``."""
+    if hasattr(agent, "predict_batch"):
+        return agent.predict_batch
+
+    def predict(obs: np.ndarray, deterministic: bool) -> np.ndarray:
+        return agent.predict(obs, deterministic=deterministic)[0]
+
+    return predict
+
+
+def _eval_baseline_worker(
+    strategy_class: type,
+    strategy_name: str,
+    strategy_kwargs: Dict[str, Any],
+    env_spec: Dict[str, Any],
+    n_episodes: int,
+    seed: Optional[int],
+    cached_paths: Optional[Dict[str, np.ndarray]],
+) -> Dict[str, Any]:
+    """
+    Evaluate one baseline in a worker process.
+
+    Args:
+        strategy_class: Baseline strategy class
+        strategy_name: Name for results
+        strategy_kwargs: Additional strategy parameters
+        env_spec: Constructor arguments for ``OptionHedgingEnv``
+        n_episodes: Number of episodes to evaluate
+        seed: Random seed
+        cached_paths: Shared stock paths from ``AgentEvaluator._simulate_shared_paths``
+
+    Returns:
+        results: Dictionary of metrics
+    """
+    evaluator = AgentEvaluator(OptionHedgingEnv(**env_spec), n_episodes=n_episodes, seed=seed)
+    return evaluator.evaluate_baseline(
+        strategy_class, strategy_name, cached_paths, **strategy_kwargs
+    )
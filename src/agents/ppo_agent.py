@@ -5,7 +5,7 @@ PPO is a policy gradient method that's stable and sample-efficient,
 making it ideal for learning hedging strategies.
 """
 
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import gymnasium as gym
 import numpy as np
@@ -73,7 +73,7 @@ class PPOHedgingAgent:
         # Default policy network architecture
         if policy_kwargs is None:
             policy_kwargs = {
-                "net_arch": [dict(pi=[256, 256], vf=[256, 256])],
+                "net_arch": dict(pi=[256, 256], vf=[256, 256]),
                 "activation_fn": torch.nn.ReLU,
             }
 
@@ -99,6 +99,20 @@ class PPOHedgingAgent:
 
         self.training_history = []
 
+        # Reusable device buffer for predict_batch
+        self._obs_buf: Optional[torch.Tensor] = None
+
+        # Compiled action path (see compile_policy)
+        self._compiled_predict: Optional[Callable[..., torch.Tensor]] = None
+
+        # Traced mean-action network for deterministic inference (see build_eval_policy)
+        self._fast_actor: Optional[torch.jit.ScriptModule] = None
+
+        # Captured deterministic forward pass (see enable_cuda_graph)
+        self._cuda_graph: Optional["torch.cuda.CUDAGraph"] = None
+        self._static_obs: Optional[torch.Tensor] = None
+        self._static_action: Optional[torch.Tensor] = None
+
     def train(
         self,
         total_timesteps: int,
@@ -175,9 +189,147 @@ class PPOHedgingAgent:
             action: Predicted action
             state: Updated RNN state (None for MLP)
         """
+        if self._fast_actor is not None and deterministic and state is None:
+            obs = np.asarray(observation, dtype=np.float32)
+            if obs.ndim == len(self.model.observation_space.shape):
+                return self.predict_batch(obs[None])[0], None
+            return self.predict_batch(obs), None
+
         action, state = self.model.predict(observation, deterministic=deterministic, state=state)
         return action, state
 
+    def predict_batch(
+        self,
+        obs_batch: np.ndarray,
+        deterministic: bool = True,
+    ) -> np.ndarray:
+        """
+        Predict actions for a batch of observations (e.g. one per vectorized env).
+
+        Copies observations into a persistent device tensor and calls the policy
+        directly, skipping the per-call tensor allocation of ``predict``. If a CUDA
+        graph was captured for this batch size, deterministic calls replay it.
+
+        Args:
+            obs_batch: Observations of shape (n_envs, obs_dim)
+            deterministic: Whether to use deterministic policy
+
+        Returns:
+            actions: Actions of shape (n_envs, action_dim)
+        """
+        policy = self.model.policy
+        n_envs = obs_batch.shape[0]
+        obs_host = torch.from_numpy(np.asarray(obs_batch, dtype=np.float32))
+
+        if self._cuda_graph is not None and deterministic and n_envs == self._static_obs.shape[0]:
+            self._static_obs.copy_(obs_host, non_blocking=True)
+            self._cuda_graph.replay()
+            actions = self._static_action
+        else:
+            if (
+                self._obs_buf is None
+                or self._obs_buf.shape[0] < n_envs
+                or self._obs_buf.device != policy.device
+            ):
+                self._obs_buf = torch.empty(
+                    (n_envs, *obs_batch.shape[1:]), dtype=torch.float32, device=policy.device
+                )
+
+            obs_tensor = self._obs_buf[:n_envs]
+            obs_tensor.copy_(obs_host, non_blocking=True)
+
+            policy.set_training_mode(False)
+            with torch.no_grad():
+                if deterministic and self._fast_actor is not None:
+                    actions = self._fast_actor(obs_tensor)
+                else:
+                    predict_fn = self._compiled_predict or policy._predict
+                    actions = predict_fn(obs_tensor, deterministic=deterministic)
+        actions = actions.cpu().numpy().reshape((-1, *self.model.action_space.shape))
+
+        if isinstance(self.model.action_space, gym.spaces.Box):
+            if policy.squash_output:
+                actions = policy.unscale_action(actions)
+            else:
+                actions = np.clip(
+                    actions, self.model.action_space.low, self.model.action_space.high
+                )
+
+        return actions
+
+    def build_eval_policy(self) -> None:
+        """
+        Trace the deterministic actor path for evaluation.
+
+        Deterministic predictions then run only the feature extractor, the policy
+        MLP and the action head, skipping the value network and the action
+        distribution. The traced module shares parameters with the policy.
+        """
+        policy = self.model.policy
+        if not isinstance(self.model.action_space, gym.spaces.Box) or policy.squash_output:
+            raise ValueError("build_eval_policy requires an unsquashed continuous action space")
+
+        actor = torch.nn.Sequential(
+            policy.pi_features_extractor, policy.mlp_extractor.policy_net, policy.action_net
+        ).eval()
+        example_obs = torch.zeros(
+            (1, *self.model.observation_space.shape), dtype=torch.float32, device=policy.device
+        )
+
+        with torch.no_grad():
+            self._fast_actor = torch.jit.trace(actor, example_obs)
+
+    def compile_policy(
+        self, mode: Optional[str] = "reduce-overhead", backend: str = "inductor"
+    ) -> None:
+        """
+        Compile the policy's action path with ``torch.compile`` for faster inference.
+
+        The compiled function is used by ``predict_batch``; the policy module itself
+        is left untouched, so training and saving are unaffected.
+
+        Args:
+            mode: ``torch.compile`` mode
+            backend: ``torch.compile`` backend
+        """
+        self._compiled_predict = torch.compile(
+            self.model.policy._predict, mode=mode, backend=backend
+        )
+
+    def enable_cuda_graph(self, batch_size: int) -> None:
+        """
+        Capture the deterministic policy forward pass in a CUDA graph.
+
+        Later deterministic ``predict_batch`` calls with exactly ``batch_size``
+        observations replay the graph instead of dispatching every kernel.
+
+        Args:
+            batch_size: Number of observations per call (e.g. number of envs)
+        """
+        policy = self.model.policy
+        if policy.device.type != "cuda":
+            raise ValueError(f"CUDA graphs require a CUDA device, got {policy.device}")
+
+        policy.set_training_mode(False)
+        self._static_obs = torch.zeros(
+            (batch_size, *self.model.observation_space.shape),
+            dtype=torch.float32,
+            device=policy.device,
+        )
+
+        # Warm up on a side stream so lazy allocations happen before capture
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream), torch.no_grad():
+            for _ in range(3):
+                policy._predict(self._static_obs, deterministic=True)
+        torch.cuda.current_stream().wait_stream(stream)
+
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph), torch.no_grad():
+            self._static_action = policy._predict(self._static_obs, deterministic=True)
+        self._cuda_graph = graph
+
     def save(self, path: str) -> None:
         """Save model to disk."""
         self.model.save(path)
@@ -185,6 +337,9 @@ class PPOHedgingAgent:
     def load(self, path: str) -> "PPOHedgingAgent":
         """Load model from disk."""
         self.model = PPO.load(path, env=self.env)
+        self._compiled_predict = None
+        self._fast_actor = None
+        self._cuda_graph = None
         return self
 
     @staticmethod
@@ -0,0 +1,189 @@
+"""
+Device-resident replay buffer for off-policy agents.
+
+SB3's ``ReplayBuffer`` keeps transitions in NumPy arrays and copies every
+sampled minibatch to the training device. This variant stores them in torch
+tensors so that, with the storage on the GPU, sampling and gathering never
+leave the device.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import torch
+from gymnasium import spaces
+from stable_baselines3.common.buffers import BaseBuffer, ReplayBuffer
+from stable_baselines3.common.type_aliases import ReplayBufferSamples
+from stable_baselines3.common.utils import get_device
+from stable_baselines3.common.vec_env import VecNormalize
+
+
+class TorchReplayBuffer(ReplayBuffer):
+    """
+    Replay buffer backed by torch tensors on a chosen storage device.
+
+    Layout and sampling rules follow SB3's ``ReplayBuffer`` (including the
+    memory-optimized variant sharing ``obs`` and ``next_obs``), but indices are
+    drawn with ``torch.randint`` on the storage device and minibatches are
+    gathered there.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int,
+        observation_space: spaces.Space,
+        action_space: spaces.Space,
+        device: Union[torch.device, str] = "auto",
+        n_envs: int = 1,
+        optimize_memory_usage: bool = False,
+        handle_timeout_termination: bool = True,
+        storage_device: Optional[Union[torch.device, str]] = None,
+    ):
+        """
+        Initialize the replay buffer.
+
+        Args:
+            buffer_size: Max number of transitions in the buffer
+            observation_space: Observation space
+            action_space: Action space
+            device: Device the sampled minibatches are returned on
+            n_envs: Number of parallel environments
+            optimize_memory_usage: Store observations once and read next
+                observations from the following slot
+            handle_timeout_termination: Do not treat time-limit truncations as terminal
+            storage_device: Device holding the transitions (defaults to ``device``)
+        """
+        BaseBuffer.__init__(
+            self, buffer_size, observation_space, action_space, device, n_envs=n_envs
+        )
+        self.buffer_size = max(buffer_size // n_envs, 1)
+
+        if optimize_memory_usage and handle_timeout_termination:
+            raise ValueError(
+                "optimize_memory_usage and handle_timeout_termination cannot both be enabled"
+            )
+        self.optimize_memory_usage = optimize_memory_usage
+        self.handle_timeout_termination = handle_timeout_termination
+        self.storage_device = self.device if storage_device is None else get_device(storage_device)
+
+        def zeros(*shape: int, dtype: Any = np.float32) -> torch.Tensor:
+            torch_dtype = torch.from_numpy(np.zeros(0, dtype=dtype)).dtype
+            return torch.zeros(shape, dtype=torch_dtype, device=self.storage_device)
+
+        rows = (self.buffer_size, self.n_envs)
+        self.observations = zeros(*rows, *self.obs_shape, dtype=observation_space.dtype)
+        if not optimize_memory_usage:
+            self.next_observations = zeros(*rows, *self.obs_shape, dtype=observation_space.dtype)
+        self.actions = zeros(
+            *rows, self.action_dim, dtype=self._maybe_cast_dtype(action_space.dtype)
+        )
+        self.rewards = zeros(*rows)
+        self.dones = zeros(*rows)
+        self.timeouts = zeros(*rows)
+
+    @staticmethod
+    def _store(storage: torch.Tensor, index: int, value: Any) -> None:
+        """Copy ``value`` into row ``index`` of ``storage``."""
+        row = storage[index]
+        row.copy_(torch.as_tensor(np.asarray(value)).reshape(row.shape))
+
+    def add(
+        self,
+        obs: np.ndarray,
+        next_obs: np.ndarray,
+        action: np.ndarray,
+        reward: np.ndarray,
+        done: np.ndarray,
+        infos: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Add one vectorized transition to the buffer.
+
+        Args:
+            obs: Observations, one per environment
+            next_obs: Next observations
+            action: Actions taken
+            reward: Rewards received
+            done: Episode end flags
+            infos: Step info dictionaries
+        """
+        self._store(self.observations, self.pos, obs)
+        if self.optimize_memory_usage:
+            self._store(self.observations, (self.pos + 1) % self.buffer_size, next_obs)
+        else:
+            self._store(self.next_observations, self.pos, next_obs)
+
+        self._store(self.actions, self.pos, action)
+        self._store(self.rewards, self.pos, reward)
+        self._store(self.dones, self.pos, done)
+
+        if self.handle_timeout_termination:
+            truncated = [info.get("TimeLimit.truncated", False) for info in infos]
+            self._store(self.timeouts, self.pos, np.array(truncated, dtype=np.float32))
+
+        self.pos += 1
+        if self.pos == self.buffer_size:
+            self.full = True
+            self.pos = 0
+
+    def sample(self, batch_size: int, env: Optional[VecNormalize] = None) -> ReplayBufferSamples:
+        """
+        Sample a minibatch of transitions.
+
+        Args:
+            batch_size: Number of transitions to sample
+            env: Optional VecNormalize used to normalize observations and rewards
+
+        Returns:
+            samples: Minibatch tensors on ``self.device``
+        """
+        if self.optimize_memory_usage and self.full:
+            # Slot ``pos`` holds a next observation whose transition is not stored yet
+            offsets = torch.randint(1, self.buffer_size, (batch_size,), device=self.storage_device)
+            batch_inds = (offsets + self.pos) % self.buffer_size
+        else:
+            upper_bound = self.buffer_size if self.full else self.pos
+            batch_inds = torch.randint(0, upper_bound, (batch_size,), device=self.storage_device)
+        return self._get_samples(batch_inds, env=env)
+
+    def _get_samples(
+        self, batch_inds: torch.Tensor, env: Optional[VecNormalize] = None
+    ) -> ReplayBufferSamples:
+        """
+        Gather the transitions at ``batch_inds`` for randomly chosen environments.
+
+        Args:
+            batch_inds: Buffer rows to gather
+            env: Optional VecNormalize used to normalize observations and rewards
+
+        Returns:
+            samples: Minibatch tensors on ``self.device``
+        """
+        env_inds = torch.randint(0, self.n_envs, (len(batch_inds),), device=self.storage_device)
+
+        if self.optimize_memory_usage:
+            next_obs = self.observations[(batch_inds + 1) % self.buffer_size, env_inds]
+        else:
+            next_obs = self.next_observations[batch_inds, env_inds]
+        # Only use dones that are not due to timeouts
+        dones = self.dones[batch_inds, env_inds] * (1 - self.timeouts[batch_inds, env_inds])
+
+        return ReplayBufferSamples(
+            observations=self._normalized(
+                self.observations[batch_inds, env_inds], self._normalize_obs, env
+            ),
+            actions=self.actions[batch_inds, env_inds].to(self.device),
+            next_observations=self._normalized(next_obs, self._normalize_obs, env),
+            dones=dones.reshape(-1, 1).to(self.device),
+            rewards=self._normalized(
+                self.rewards[batch_inds, env_inds].reshape(-1, 1), self._normalize_reward, env
+            ),
+        )
+
+    def _normalized(
+        self, values: torch.Tensor, normalize: Any, env: Optional[VecNormalize]
+    ) -> torch.Tensor:
+        """Move ``values`` to ``self.device``, normalizing on the host if ``env`` is given."""
+        if env is None:
+            return values.to(self.device)
+        return self.to_torch(normalize(values.cpu().numpy(), env))
@@ -6,6 +6,7 @@ maximizing both expected return and entropy, making it robust and
 sample-efficient for continuous control tasks.
 """
 
+import logging
 from typing import Any, Dict, Optional, Tuple
 
 import gymnasium as gym
@@ -15,8 +16,13 @@ from stable_baselines3 import SAC
 from stable_baselines3.common.callbacks import BaseCallback, CheckpointCallback, EvalCallback
 from stable_baselines3.common.monitor import Monitor
 from stable_baselines3.common.noise import NormalActionNoise
+from stable_baselines3.common.utils import get_device
 from stable_baselines3.common.vec_env import DummyVecEnv, VecNormalize
 
+from src.agents.replay_buffer import TorchReplayBuffer
+
+logger = logging.getLogger(__name__)
+
 
 class SACHedgingAgent:
     """
@@ -47,6 +53,10 @@ class SACHedgingAgent:
         verbose: int = 1,
         seed: Optional[int] = None,
         device: str = "auto",
+        amp: bool = False,
+        optimize_memory_usage: bool = True,
+        buffer_device: Optional[str] = None,
+        compile: bool = True,
     ):
         """
         Initialize SAC agent for hedging.
@@ -69,10 +79,24 @@ class SACHedgingAgent:
             verbose: Verbosity level
             seed: Random seed
             device: Device to use ('cpu', 'cuda', or 'auto')
+            amp: Run the critics in BF16 autocast (CUDA only; ignored on CPU)
+            optimize_memory_usage: Store observations once in the replay buffer and read
+                next observations from the following slot, halving its memory
+            buffer_device: Device holding the replay buffer as torch tensors (e.g. 'cuda')
+                so minibatches are sampled without host-to-device copies; None keeps
+                SB3's host-memory buffer
+            compile: Compile the actor and critic networks with ``torch.compile``
+                (CUDA only; ignored on CPU)
         """
         self.env = env
         self.seed = seed
 
+        # Let float32 matmuls use TF32 tensor cores on GPU
+        use_cuda = get_device(device).type == "cuda"
+        if use_cuda:
+            torch.set_float32_matmul_precision("high")
+            torch.backends.cudnn.benchmark = True
+
         # Default policy network architecture
         if policy_kwargs is None:
             policy_kwargs = {
@@ -80,6 +104,14 @@ class SACHedgingAgent:
                 "activation_fn": torch.nn.ReLU,
             }
 
+        # The hedging env only terminates (never truncates), so timeout
+        # handling is not needed by the memory-optimized buffer
+        replay_buffer_kwargs: Dict[str, Any] = {}
+        if optimize_memory_usage:
+            replay_buffer_kwargs["handle_timeout_termination"] = False
+        if buffer_device is not None:
+            replay_buffer_kwargs["storage_device"] = buffer_device
+
         self.model = SAC(
             policy=policy,
             env=env,
@@ -94,14 +126,27 @@ class SACHedgingAgent:
             ent_coef=ent_coef,
             target_entropy=target_entropy,
             use_sde=use_sde,
+            optimize_memory_usage=optimize_memory_usage,
+            replay_buffer_class=TorchReplayBuffer if buffer_device is not None else None,
+            replay_buffer_kwargs=replay_buffer_kwargs or None,
             policy_kwargs=policy_kwargs,
             verbose=verbose,
             seed=seed,
             device=device,
         )
 
+        if amp and use_cuda:
+            _autocast_bf16(self.model.critic)
+            _autocast_bf16(self.model.critic_target)
+        if compile and use_cuda:
+            self.compile_networks()
+
         self.training_history = []
 
+        # Pinned host staging and device buffers for predict_batch (CUDA only)
+        self._obs_host: Optional[torch.Tensor] = None
+        self._obs_buf: Optional[torch.Tensor] = None
+
     def train(
         self,
         total_timesteps: int,
@@ -178,9 +223,82 @@ class SACHedgingAgent:
             action: Predicted action
             state: Updated RNN state (None for MLP)
         """
+        if state is None:
+            obs = np.asarray(observation, dtype=np.float32)
+            if obs.ndim == len(self.model.observation_space.shape):
+                return self.predict_batch(obs[None], deterministic)[0], None
+            return self.predict_batch(obs, deterministic), None
+
         action, state = self.model.predict(observation, deterministic=deterministic, state=state)
         return action, state
 
+    def predict_batch(
+        self,
+        obs_batch: np.ndarray,
+        deterministic: bool = True,
+    ) -> np.ndarray:
+        """
+        Predict actions for a batch of observations (e.g. one per vectorized env).
+
+        Calls the actor directly under ``torch.inference_mode``. On GPU the
+        observations are staged through a persistent pinned host buffer into a
+        persistent device tensor, so no tensors are allocated per call.
+
+        Args:
+            obs_batch: Observations of shape (n_envs, obs_dim)
+            deterministic: Whether to use the mean action
+
+        Returns:
+            actions: Actions of shape (n_envs, action_dim)
+        """
+        policy = self.model.policy
+        n_envs = obs_batch.shape[0]
+        obs_host = torch.from_numpy(np.asarray(obs_batch, dtype=np.float32))
+
+        if policy.device.type == "cuda":
+            if (
+                self._obs_buf is None
+                or self._obs_buf.shape[0] < n_envs
+                or self._obs_buf.device != policy.device
+            ):
+                shape = (n_envs, *obs_batch.shape[1:])
+                self._obs_host = torch.empty(shape, dtype=torch.float32, pin_memory=True)
+                self._obs_buf = torch.empty(shape, dtype=torch.float32, device=policy.device)
+
+            staged = self._obs_host[:n_envs]
+            staged.copy_(obs_host)
+            obs_tensor = self._obs_buf[:n_envs]
+            obs_tensor.copy_(staged, non_blocking=True)
+        else:
+            obs_tensor = obs_host
+
+        policy.set_training_mode(False)
+        with torch.inference_mode():
+            actions = policy.actor(obs_tensor, deterministic=deterministic)
+        actions = actions.cpu().numpy().reshape((-1, *self.model.action_space.shape))
+
+        # The actor's tanh output lies in [-1, 1]; map it onto the action bounds
+        return policy.unscale_action(actions)
+
+    def compile_networks(self, mode: Optional[str] = "reduce-overhead") -> None:
+        """
+        Compile the actor body and both critics with ``torch.compile``.
+
+        Modules are compiled in place, so parameter names, optimizers and saved
+        models are unchanged. Falls back to eager execution if compilation fails.
+
+        Args:
+            mode: ``torch.compile`` mode
+        """
+        policy = self.model.policy
+        try:
+            # The actor's training path (action_log_prob) bypasses forward(),
+            # so compile its MLP body rather than the actor module itself
+            for module in (policy.actor.latent_pi, policy.critic, policy.critic_target):
+                module.compile(mode=mode)
+        except Exception as exc:
+            logger.warning("torch.compile failed, running SAC networks eagerly: %s", exc)
+
     def save(self, path: str) -> None:
         """Save model to disk."""
         self.model.save(path)
@@ -223,3 +341,15 @@ class SACHedgingAgent:
             "train_freq": self.model.train_freq,
             "gradient_steps": self.model.gradient_steps,
         }
+
+
+def _autocast_bf16(module: torch.nn.Module) -> None:
+    """Run ``module.forward`` under CUDA BF16 autocast, returning float32 outputs."""
+    forward = module.forward
+
+    def forward_bf16(*args, **kwargs):
+        with torch.autocast(device_type="cuda", dtype=torch.bfloat16):
+            outputs = forward(*args, **kwargs)
+        return tuple(output.float() for output in outputs)
+
+    module.forward = forward_bf16
@@ -4,18 +4,28 @@ Training pipeline for RL agents with curriculum learning and hyperparameter tuni
 
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
 import optuna
+import torch
+from stable_baselines3.common.callbacks import EvalCallback
+from stable_baselines3.common.env_util import make_vec_env
 from stable_baselines3.common.monitor import Monitor
-from stable_baselines3.common.vec_env import DummyVecEnv, VecNormalize
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv, VecEnv, VecNormalize
 
-from src.agents.config import ENV_CONFIGS
+from src.agents.config import COMPILED_SEARCH_SPACES, ENV_CONFIGS
 from src.agents.ppo_agent import PPOHedgingAgent
 from src.agents.sac_agent import SACHedgingAgent
 from src.environments.hedging_env import OptionHedgingEnv
+from src.environments.shmem_vec_env import SharedMemoryVecEnv
+from src.environments.vectorized import OptionHedgingVecEnv
+
+# Environment parameters that can be changed on an existing environment
+# (they only enter the dynamics and reward, and the premium set on reset)
+_RECONFIGURABLE_ENV_PARAMS = ("sigma", "r", "transaction_cost", "risk_penalty")
 
 
 class AgentTrainer:
@@ -35,6 +45,11 @@ class AgentTrainer:
         env_config: Optional[Dict[str, Any]] = None,
         output_dir: str = "models",
         seed: Optional[int] = None,
+        n_envs: int = 1,
+        use_subprocess: bool = True,
+        vectorized: bool = False,
+        torch_threads: Optional[int] = 4,
+        shared_memory: bool = False,
     ):
         """
         Initialize trainer.
@@ -44,11 +59,30 @@ class AgentTrainer:
             env_config: Environment configuration
             output_dir: Directory for saving models and logs
             seed: Random seed for reproducibility
+            n_envs: Number of parallel training environments
+            use_subprocess: Step parallel environments in worker processes (SubprocVecEnv);
+                ignored when n_envs == 1
+            vectorized: Simulate all training environments as NumPy arrays in one
+                process (OptionHedgingVecEnv) instead of stepping env objects
+            torch_threads: Number of threads torch uses for training (capped at the
+                CPU count); None leaves the torch setting unchanged
+            shared_memory: Have worker processes return observations through shared
+                memory (SharedMemoryVecEnv) instead of pipes
         """
+        if n_envs < 1:
+            raise ValueError(f"n_envs must be >= 1, got {n_envs}")
+
         self.agent_type = agent_type.upper()
         self.env_config = env_config or {}
         self.output_dir = Path(output_dir)
         self.seed = seed
+        self.n_envs = n_envs
+        self.use_subprocess = use_subprocess
+        self.vectorized = vectorized
+        self.shared_memory = shared_memory
+
+        if torch_threads is not None:
+            torch.set_num_threads(max(min(torch_threads, os.cpu_count() or 1), 1))
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -56,21 +90,16 @@ class AgentTrainer:
         # Training history
         self.history = []
 
-    def create_env(
-        self,
-        difficulty: str = "medium",
-        monitor_wrapper: bool = True,
-    ) -> OptionHedgingEnv:
-        """
-        Create training environment with curriculum difficulty.
+        # Evaluation environments reused across curriculum stages and trials
+        self._eval_envs: Dict[tuple, Monitor] = {}
 
-        Args:
-            difficulty: 'easy', 'medium', or 'hard'
-            monitor_wrapper: Whether to wrap with Monitor
+        # First CPU for the next batch of pinned workers, so vector environments
+        # of concurrent Optuna trials do not all start on the same core
+        self._next_cpu = 0
+        self._cpu_lock = threading.Lock()
 
-        Returns:
-            env: Configured environment
-        """
+    def _difficulty_config(self, difficulty: str) -> Dict[str, Any]:
+        """Environment keyword arguments for a curriculum difficulty."""
         # Base configuration
         config = self.env_config.copy()
 
@@ -100,7 +129,24 @@ class AgentTrainer:
                 }
             )
 
-        env = OptionHedgingEnv(**config)
+        return config
+
+    def create_env(
+        self,
+        difficulty: str = "medium",
+        monitor_wrapper: bool = True,
+    ) -> OptionHedgingEnv:
+        """
+        Create training environment with curriculum difficulty.
+
+        Args:
+            difficulty: 'easy', 'medium', or 'hard'
+            monitor_wrapper: Whether to wrap with Monitor
+
+        Returns:
+            env: Configured environment
+        """
+        env = OptionHedgingEnv(**self._difficulty_config(difficulty))
 
         if monitor_wrapper:
             log_dir = self.output_dir / "monitor_logs"
@@ -109,6 +155,86 @@ class AgentTrainer:
 
         return env
 
+    def _make_vec_env(self, env_kwargs: Dict[str, Any], monitor_dir: Optional[Path]) -> VecEnv:
+        """Batch ``self.n_envs`` hedging environments for rollout collection."""
+        if self.vectorized:
+            # Episode statistics are reported directly, no Monitor wrapper needed
+            return OptionHedgingVecEnv(OptionHedgingEnv(**env_kwargs), self.n_envs, seed=self.seed)
+
+        # Worker processes only pay off with more than one environment
+        use_subprocess = self.use_subprocess and self.n_envs > 1
+        if not use_subprocess:
+            vec_env_cls = DummyVecEnv
+        elif self.shared_memory:
+            vec_env_cls = SharedMemoryVecEnv
+        else:
+            vec_env_cls = SubprocVecEnv
+
+        vec_env = make_vec_env(
+            OptionHedgingEnv,
+            n_envs=self.n_envs,
+            seed=self.seed,
+            env_kwargs=env_kwargs,
+            monitor_dir=str(monitor_dir) if monitor_dir is not None else None,
+            vec_env_cls=vec_env_cls,
+        )
+        if use_subprocess:
+            with self._cpu_lock:
+                first_cpu = self._next_cpu
+                self._next_cpu += self.n_envs
+            _pin_workers(vec_env, first_cpu)
+        return vec_env
+
+    def create_vec_env(
+        self,
+        difficulty: str = "medium",
+        monitor_wrapper: bool = True,
+    ) -> VecEnv:
+        """
+        Create ``n_envs`` training environments with curriculum difficulty.
+
+        Args:
+            difficulty: 'easy', 'medium', or 'hard'
+            monitor_wrapper: Whether to wrap each environment with Monitor
+
+        Returns:
+            vec_env: Vectorized environment
+        """
+        monitor_dir = None
+        if monitor_wrapper:
+            monitor_dir = self.output_dir / "monitor_logs" / f"difficulty_{difficulty}"
+
+        return self._make_vec_env(self._difficulty_config(difficulty), monitor_dir)
+
+    def _eval_env(self, env_config: Dict[str, Any]) -> Monitor:
+        """
+        Evaluation environment for ``env_config``, reused across stages and trials.
+
+        Environments are cached per thread, so parallel Optuna trials never share
+        one. A cached environment that differs only in reconfigurable parameters
+        (volatility, rate, costs, risk penalty) is updated in place and reset.
+
+        Args:
+            env_config: OptionHedgingEnv keyword arguments
+
+        Returns:
+            env: Monitor-wrapped evaluation environment (no log file)
+        """
+        structure = {k: v for k, v in env_config.items() if k not in _RECONFIGURABLE_ENV_PARAMS}
+        overrides = {k: v for k, v in env_config.items() if k in _RECONFIGURABLE_ENV_PARAMS}
+        key = (threading.get_ident(), tuple(sorted(structure.items())), tuple(sorted(overrides)))
+
+        env = self._eval_envs.get(key)
+        if env is None:
+            env = Monitor(OptionHedgingEnv(**env_config))
+            self._eval_envs[key] = env
+        else:
+            for name, value in overrides.items():
+                setattr(env.unwrapped, name, value)
+            env.reset()
+
+        return env
+
     def train_with_curriculum(
         self,
         agent_config: Optional[Dict[str, Any]] = None,
@@ -161,8 +287,8 @@ class AgentTrainer:
             env_config = ENV_CONFIGS[difficulty].copy()
             env_config["n_steps"] = max_n_steps  # Override to ensure consistent obs space
 
-            train_env = OptionHedgingEnv(**env_config)
-            eval_env = OptionHedgingEnv(**env_config)
+            train_env = self._make_vec_env(env_config, monitor_dir=None)
+            eval_env = self._eval_env(env_config)
 
             # Create or update agent
             if agent is None:
@@ -175,6 +301,7 @@ class AgentTrainer:
                     raise ValueError(f"Unknown agent type: {self.agent_type}")
             else:
                 # Subsequent stages: update environment
+                agent.env.close()
                 agent.env = train_env
                 agent.model.set_env(train_env)
 
@@ -209,86 +336,94 @@ class AgentTrainer:
         n_startup_trials: int = 10,
         n_timesteps: int = 50000,
         study_name: Optional[str] = None,
+        n_jobs: int = 4,
     ) -> Dict[str, Any]:
         """
         Hyperparameter optimization using Optuna.
 
+        Trials run ``n_jobs`` at a time and are recorded in a SQLite study under
+        ``output_dir``, so an interrupted search resumes where it left off.
+        Each trial is evaluated five times while training and pruned early if
+        its reward falls below the median of earlier trials at that point.
+
         Args:
             n_trials: Number of trials to run
             n_startup_trials: Number of random trials before TPE
             n_timesteps: Timesteps per trial
             study_name: Name for the study
+            n_jobs: Number of trials to run in parallel
 
         Returns:
             best_params: Best hyperparameters found
         """
         study_name = study_name or f"{self.agent_type}_hyperopt"
 
+        if self.agent_type not in COMPILED_SEARCH_SPACES:
+            raise ValueError(f"Unknown agent type: {self.agent_type}")
+        search_space = COMPILED_SEARCH_SPACES[self.agent_type]
+
         print(f"\n{'='*60}")
         print(f"Hyperparameter search for {self.agent_type}")
         print(f"Trials: {n_trials}, Timesteps per trial: {n_timesteps:,}")
         print(f"{'='*60}\n")
 
+        # Training environments are built once per worker thread and reused by
+        # later trials; each new agent re-seeds its environment
+        train_envs: Dict[int, VecEnv] = {}
+
         def objective(trial: optuna.Trial) -> float:
             """Objective function for optimization."""
             # Sample hyperparameters
-            if self.agent_type == "PPO":
-                params = {
-                    "learning_rate": trial.suggest_float("learning_rate", 1e-5, 1e-3, log=True),
-                    "n_steps": trial.suggest_categorical("n_steps", [512, 1024, 2048]),
-                    "batch_size": trial.suggest_categorical("batch_size", [32, 64, 128, 256]),
-                    "n_epochs": trial.suggest_categorical("n_epochs", [5, 10, 20]),
-                    "gamma": trial.suggest_float("gamma", 0.95, 0.9999),
-                    "gae_lambda": trial.suggest_float("gae_lambda", 0.9, 0.99),
-                    "clip_range": trial.suggest_float("clip_range", 0.1, 0.3),
-                    "ent_coef": trial.suggest_float("ent_coef", 0.0, 0.1),
-                }
-            else:  # SAC
-                params = {
-                    "learning_rate": trial.suggest_float("learning_rate", 1e-5, 1e-3, log=True),
-                    "batch_size": trial.suggest_categorical("batch_size", [64, 128, 256, 512]),
-                    "tau": trial.suggest_float("tau", 0.001, 0.02),
-                    "gamma": trial.suggest_float("gamma", 0.95, 0.9999),
-                    "learning_starts": trial.suggest_int("learning_starts", 100, 1000),
-                    "train_freq": trial.suggest_categorical("train_freq", [1, 4, 8]),
-                }
+            params = {name: sample(trial) for name, sample in search_space}
 
-            # Create environment
-            env = self.create_env(difficulty="medium")
-            eval_env = self.create_env(difficulty="medium")
+            # Concurrent trials must not share environments or monitor log files
+            env = train_envs.get(threading.get_ident())
+            if env is None:
+                env = self.create_vec_env(difficulty="medium", monitor_wrapper=False)
+                train_envs[threading.get_ident()] = env
+            eval_env = self._eval_env(self._difficulty_config("medium"))
+
+            # Distinct seed per trial; spread trials over the available GPUs
+            seed = None if self.seed is None else self.seed + trial.number
+            device = "auto"
+            if torch.cuda.is_available():
+                device = f"cuda:{trial.number % torch.cuda.device_count()}"
 
             # Create agent
             try:
                 if self.agent_type == "PPO":
-                    agent = PPOHedgingAgent(env=env, seed=self.seed, **params)
+                    agent = PPOHedgingAgent(env=env, seed=seed, device=device, **params)
                 else:
-                    agent = SACHedgingAgent(env=env, seed=self.seed, **params)
+                    agent = SACHedgingAgent(env=env, seed=seed, device=device, **params)
 
-                # Train
-                agent.train(
-                    total_timesteps=n_timesteps,
-                    eval_env=eval_env,
-                    eval_freq=max(1000, n_timesteps // 10),
+                # Train, reporting intermediate rewards to the pruner
+                pruning_callback = _TrialPruningCallback(
+                    trial,
+                    eval_env,
+                    eval_freq=max(n_timesteps // (5 * env.num_envs), 1),
                     n_eval_episodes=3,
                 )
-
-                # Evaluate
-                eval_rewards = []
-                for _ in range(5):
-                    obs, _ = eval_env.reset()
-                    episode_reward = 0
-                    done = False
-
-                    while not done:
-                        action, _ = agent.predict(obs, deterministic=True)
-                        obs, reward, terminated, truncated, _ = eval_env.step(action)
-                        episode_reward += reward
-                        done = terminated or truncated
-
-                    eval_rewards.append(episode_reward)
+                agent.train(total_timesteps=n_timesteps, callbacks=[pruning_callback])
+                if pruning_callback.is_pruned:
+                    raise optuna.TrialPruned()
+
+                # Evaluate five episodes as one batched rollout; they have equal
+                # length and finish on the same step
+                eval_vec_env = OptionHedgingVecEnv(eval_env.unwrapped, n_envs=5, seed=seed)
+                obs = eval_vec_env.reset()
+                eval_rewards = np.zeros(eval_vec_env.num_envs)
+                done = False
+
+                while not done:
+                    actions = agent.predict_batch(obs, deterministic=True)
+                    obs, rewards, dones, _ = eval_vec_env.step(actions)
+                    eval_rewards += rewards
+                    done = dones.all()
 
                 mean_reward = np.mean(eval_rewards)
 
+            except optuna.TrialPruned:
+                raise
             except Exception as e:
                 print(f"Trial {trial.number} failed: {e}")
                 mean_reward = -1e6  # Penalty for failed trials
@@ -298,11 +433,18 @@ class AgentTrainer:
         # Run optimization
         study = optuna.create_study(
             study_name=study_name,
+            storage=f"sqlite:///{self.output_dir}/optuna_{study_name}.db",
+            load_if_exists=True,
             direction="maximize",
             sampler=optuna.samplers.TPESampler(n_startup_trials=n_startup_trials),
+            pruner=optuna.pruners.MedianPruner(n_warmup_steps=n_timesteps // 5),
         )
 
-        study.optimize(objective, n_trials=n_trials, show_progress_bar=True)
+        try:
+            study.optimize(objective, n_trials=n_trials, n_jobs=n_jobs, show_progress_bar=True)
+        finally:
+            for env in train_envs.values():
+                env.close()
 
         # Save results
         results = {
@@ -344,7 +486,7 @@ class AgentTrainer:
         print(f"\nQuick training {self.agent_type} agent for {total_timesteps:,} steps...")
 
         # Create environments
-        train_env = self.create_env(difficulty="medium")
+        train_env = self.create_vec_env(difficulty="medium")
         eval_env = self.create_env(difficulty="medium")
 
         # Create agent
@@ -374,3 +516,59 @@ class AgentTrainer:
         print(f"✓ Model saved to {model_path}")
 
         return agent
+
+
+def _pin_workers(vec_env: SubprocVecEnv, first_cpu: int = 0) -> None:
+    """
+    Pin each environment worker process to its own CPU (Linux only).
+
+    Args:
+        vec_env: Vector environment whose worker processes are pinned
+        first_cpu: Index of the CPU for rank 0; later ranks take the following
+            CPUs, wrapping around the available set
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+
+    cpus = sorted(os.sched_getaffinity(0))
+    for rank, process in enumerate(vec_env.processes):
+        os.sched_setaffinity(process.pid, {cpus[(first_cpu + rank) % len(cpus)]})
+
+
+class _TrialPruningCallback(EvalCallback):
+    """Evaluate an Optuna trial while training and stop it once it is pruned."""
+
+    def __init__(
+        self,
+        trial: optuna.Trial,
+        eval_env: Monitor,
+        eval_freq: int,
+        n_eval_episodes: int = 3,
+    ):
+        """
+        Initialize the callback.
+
+        Args:
+            trial: Trial receiving the intermediate rewards
+            eval_env: Environment for evaluation
+            eval_freq: Evaluate every ``eval_freq`` calls (vectorized steps)
+            n_eval_episodes: Number of episodes per evaluation
+        """
+        super().__init__(
+            eval_env,
+            eval_freq=eval_freq,
+            n_eval_episodes=n_eval_episodes,
+            deterministic=True,
+            verbose=0,
+        )
+        self.trial = trial
+        self.is_pruned = False
+
+    def _on_step(self) -> bool:
+        if self.eval_freq > 0 and self.n_calls % self.eval_freq == 0:
+            super()._on_step()
+            self.trial.report(self.last_mean_reward, step=self.num_timesteps)
+            if self.trial.should_prune():
+                self.is_pruned = True
+                return False
+        return True
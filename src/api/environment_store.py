@@ -0,0 +1,165 @@
+"""Bounded in-memory store for live hedging environments."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from src.environments.hedging_env import OptionHedgingEnv
+
+
+@dataclass
+class EnvSlot:
+    """A stored environment with its serialized config, creation and last access times."""
+
+    env: OptionHedgingEnv
+    created_at_iso: str
+    last_step_ts: float
+    config_json: bytes = b"{}"
+    # Reused for continuous actions. Not thread-safe: concurrent steps on the
+    # same environment would race on it, as they already do on the env itself
+    action_buf: np.ndarray = field(default_factory=lambda: np.empty(1))
+
+
+class EnvironmentStore:
+    """
+    LRU store with a sliding TTL for environments created through the API.
+
+    Entries are kept in access order, so the least recently used slot is
+    always at the front: evicting for size and expiring idle slots both pop
+    from the front and never scan live entries.
+
+    All methods hold a lock: sync routes call them from Starlette's threadpool
+    while the reaper sweeps from the event loop.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        """
+        Initialize the store.
+
+        Args:
+            maxsize: Maximum number of environments kept at once
+            ttl: Seconds an environment may stay idle before it is dropped
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._slots: "OrderedDict[str, EnvSlot]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._slots)
+
+    def __contains__(self, env_id: str) -> bool:
+        with self._lock:
+            return env_id in self._slots
+
+    def add(
+        self, env_id: str, env: OptionHedgingEnv, created_at_iso: str, config_json: bytes = b"{}"
+    ) -> EnvSlot:
+        """
+        Store a new environment, evicting the least recently used one if full.
+
+        Args:
+            env_id: Environment ID
+            env: Environment instance
+            created_at_iso: Creation time as an ISO string
+            config_json: Environment config, already encoded as JSON
+
+        Returns:
+            The stored slot
+        """
+        now = time.monotonic()
+        slot = EnvSlot(
+            env=env, created_at_iso=created_at_iso, last_step_ts=now, config_json=config_json
+        )
+        with self._lock:
+            self._expire(now)
+            while len(self._slots) >= self.maxsize:
+                self._slots.popitem(last=False)
+            self._slots[env_id] = slot
+        return slot
+
+    def get(self, env_id: str) -> Optional[EnvSlot]:
+        """
+        Look up an environment and mark it as recently used.
+
+        Args:
+            env_id: Environment ID
+
+        Returns:
+            The slot, or None if it is unknown or has expired
+        """
+        now = time.monotonic()
+        with self._lock:
+            slot = self._slots.get(env_id)
+            if slot is None:
+                return None
+            if now - slot.last_step_ts >= self.ttl:
+                del self._slots[env_id]
+                return None
+            slot.last_step_ts = now
+            self._slots.move_to_end(env_id)
+            return slot
+
+    def pop(self, env_id: str) -> Optional[EnvSlot]:
+        """Remove an environment, returning its slot if it was stored."""
+        with self._lock:
+            return self._slots.pop(env_id, None)
+
+    def items(self) -> Iterator[Tuple[str, EnvSlot]]:
+        """Iterate over stored environments without touching their access time."""
+        with self._lock:
+            return iter(list(self._slots.items()))
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """
+        Drop environments idle for longer than the TTL.
+
+        Args:
+            now: Current ``time.monotonic()`` value
+
+        Returns:
+            Number of environments dropped
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return self._expire(now)
+
+    def _expire(self, now: float) -> int:
+        """Drop idle environments from the front; the caller holds the lock."""
+        dropped = 0
+        while self._slots:
+            slot = next(iter(self._slots.values()))
+            if now - slot.last_step_ts < self.ttl:
+                break
+            self._slots.popitem(last=False)
+            dropped += 1
+        return dropped
+
+    def evict_completed(self, grace: float = 60.0) -> int:
+        """
+        Drop finished episodes that have not been accessed for ``grace`` seconds.
+
+        Args:
+            grace: Seconds a completed environment is kept for metric reads
+
+        Returns:
+            Number of environments dropped (including expired ones)
+        """
+        now = time.monotonic()
+        with self._lock:
+            dropped = self._expire(now)
+            finished = [
+                env_id
+                for env_id, slot in self._slots.items()
+                if slot.env.current_step >= slot.env.n_steps and now - slot.last_step_ts >= grace
+            ]
+            for env_id in finished:
+                del self._slots[env_id]
+        return dropped + len(finished)
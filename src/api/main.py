@@ -1,5 +1,6 @@
 """Main FastAPI application."""
 
+import asyncio
 import time
 from contextlib import asynccontextmanager
 
@@ -8,6 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from prometheus_client import make_asgi_app
 
+from src.api.responses import ORJSONResponse
 from src.api.routes import (
     auth,
     baselines,
@@ -19,6 +21,7 @@ from src.api.routes import (
     models,
 )
 from src.api.websocket import get_connection_info, get_socket_app, sio
+from src.api.workers import shutdown_process_pool, start_process_pool
 from src.utils.config import get_settings
 from src.utils.logger import setup_logger
 
@@ -32,8 +35,15 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting Derivative Hedging RL API...")
     logger.info(f"📊 Environment: {settings.ENVIRONMENT}")
     logger.info(f"🔒 Debug mode: {settings.DEBUG}")
+    start_process_pool()
+    reaper = asyncio.create_task(environments.reap_environments())
+    if app.openapi_url:
+        # Build the schema now rather than on the first /openapi.json request
+        app.openapi()
     yield
     logger.info("🛑 Shutting down Derivative Hedging RL API...")
+    reaper.cancel()
+    shutdown_process_pool()
 
 
 # Create FastAPI app
@@ -43,7 +53,9 @@ app = FastAPI(
     version="0.3.0",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    openapi_url="/openapi.json" if settings.DEBUG else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add middleware
@@ -57,14 +69,22 @@ app.add_middleware(
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 
+# Frequently polled paths (Prometheus scrapes, health probes) are not logged
+UNLOGGED_PATH_PREFIXES = ("/metrics", "/api/v1/health")
+
+
 # Add request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all incoming requests and responses."""
+    path = request.url.path
+    if path.startswith(UNLOGGED_PATH_PREFIXES):
+        return await call_next(request)
+
     start_time = time.time()
 
     # Log request
-    logger.info(f"→ {request.method} {request.url.path}")
+    logger.info("→ %s %s", request.method, path)
 
     # Process request
     response = await call_next(request)
@@ -73,9 +93,7 @@ async def log_requests(request: Request, call_next):
     process_time = time.time() - start_time
 
     # Log response
-    logger.info(
-        f"← {request.method} {request.url.path} " f"[{response.status_code}] {process_time:.3f}s"
-    )
+    logger.info("← %s %s [%d] %.3fs", request.method, path, response.status_code, process_time)
 
     # Add custom header
     response.headers["X-Process-Time"] = str(process_time)
@@ -135,10 +153,14 @@ async def websocket_test():
 if __name__ == "__main__":
     import uvicorn
 
+    # loop/http "auto" pick uvloop and httptools when installed (uvicorn[standard])
     uvicorn.run(
         "src.api.main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        workers=None if settings.DEBUG else settings.WORKERS,
+        loop="auto",
+        http="auto",
         log_level="info",
     )
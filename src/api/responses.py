@@ -0,0 +1,170 @@
+"""Response classes shared by the API."""
+
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterable, List, Optional, Tuple, Type, Union
+
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import AliasChoices, BaseModel, TypeAdapter
+from sqlalchemy import Executable
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.schemas import FastSchema
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
+def _default(obj: Any) -> Any:
+    """Encode types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson, including NumPy arrays and scalars."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """Return a cached ``TypeAdapter`` for a list of ``schema``."""
+    return TypeAdapter(List[schema])
+
+
+def orm_response(
+    schema: Type[BaseModel],
+    rows: Union[Any, Iterable[Any]],
+    status_code: int = 200,
+    many: bool = False,
+) -> ORJSONResponse:
+    """
+    Validate ORM rows against a schema and serialize them.
+
+    Returning a response directly skips FastAPI's ``response_model`` pass and
+    ``jsonable_encoder``. Validated objects are dumped and encoded with
+    orjson, like ``trusted_response`` and ``stream_response``, so a record
+    serializes identically whichever path returns it. ``FastSchema``
+    subclasses leave out None fields.
+
+    Args:
+        schema: Pydantic schema with ``from_attributes`` enabled
+        rows: A single ORM object, or an iterable of them when ``many`` is set
+        status_code: HTTP status code of the response
+        many: Whether ``rows`` is a collection
+
+    Returns:
+        JSON response with the serialized schema(s)
+    """
+    exclude_none = issubclass(schema, FastSchema)
+    if many:
+        adapter = list_adapter(schema)
+        items = adapter.validate_python(rows, from_attributes=True)
+        content = adapter.dump_python(items, exclude_none=exclude_none)
+    else:
+        obj = schema.model_validate(rows, from_attributes=True)
+        content = obj.model_dump(exclude_none=exclude_none)
+    return ORJSONResponse(content, status_code=status_code)
+
+
+@lru_cache(maxsize=None)
+def _row_attributes(schema: Type[BaseModel]) -> Tuple[Tuple[str, str], ...]:
+    """Map each schema field to the ORM attribute it is read from."""
+    attributes = []
+    for name, field in schema.model_fields.items():
+        alias = field.validation_alias
+        if isinstance(alias, AliasChoices):
+            alias = alias.choices[0]
+        attributes.append((name, alias if isinstance(alias, str) else name))
+    return tuple(attributes)
+
+
+def trusted_response(
+    schema: Type[BaseModel],
+    rows: Union[Any, Iterable[Any]],
+    many: bool = False,
+) -> ORJSONResponse:
+    """
+    Serialize ORM rows read back from the database without revalidating them.
+
+    Rows are trusted: every write goes through a validated ``*Create`` or
+    ``*Update`` schema and the columns are typed by SQLAlchemy, so reads only
+    pick the schema's fields off each row. As with ``orm_response``, None
+    fields are left out for ``FastSchema`` subclasses.
+
+    Args:
+        schema: Pydantic schema describing the response fields
+        rows: A single ORM object, or an iterable of them when ``many`` is set
+        many: Whether ``rows`` is a collection
+
+    Returns:
+        ORJSONResponse with one dict per row
+    """
+    attributes = _row_attributes(schema)
+    pick = _pick_set_fields if issubclass(schema, FastSchema) else _pick_fields
+    if many:
+        content = [pick(row, attributes) for row in rows]
+    else:
+        content = pick(rows, attributes)
+    return ORJSONResponse(content)
+
+
+def _pick_fields(row: Any, attributes: Tuple[Tuple[str, str], ...]) -> dict:
+    """Read every schema field off an ORM row."""
+    return {name: getattr(row, attr) for name, attr in attributes}
+
+
+def _pick_set_fields(row: Any, attributes: Tuple[Tuple[str, str], ...]) -> dict:
+    """Read the schema fields of an ORM row that are not None."""
+    values = ((name, getattr(row, attr)) for name, attr in attributes)
+    return {name: value for name, value in values if value is not None}
+
+
+def stream_response(
+    db: AsyncSession,
+    statement: Executable,
+    params: Optional[dict],
+    schema: Type[BaseModel],
+    chunk_size: int = 100,
+) -> StreamingResponse:
+    """
+    Stream the rows of a query as a JSON array, a chunk of rows at a time.
+
+    Rows are fetched through a server-side cursor and encoded as they
+    arrive, so neither the full result set nor the full JSON body is held
+    in memory. Rows are trusted, as in ``trusted_response``.
+
+    Args:
+        db: Database session, kept open until the body has been sent
+        statement: SELECT returning ORM rows
+        params: Bound parameters for the statement
+        schema: Pydantic schema describing the response fields
+        chunk_size: Rows fetched and written per chunk
+
+    Returns:
+        StreamingResponse with a JSON array body
+    """
+    attributes = _row_attributes(schema)
+    pick = _pick_set_fields if issubclass(schema, FastSchema) else _pick_fields
+
+    async def body() -> AsyncIterator[bytes]:
+        yield b"["
+        separator = b""
+        result = await db.stream_scalars(
+            statement, params, execution_options={"yield_per": chunk_size}
+        )
+        async for rows in result.partitions():
+            encoded = b",".join(
+                orjson.dumps(pick(row, attributes), default=_default, option=_ORJSON_OPTIONS)
+                for row in rows
+            )
+            yield separator + encoded
+            separator = b","
+        yield b"]"
+
+    return StreamingResponse(body(), media_type="application/json")
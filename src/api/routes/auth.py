@@ -1,10 +1,12 @@
 """Authentication routes."""
 
 from datetime import timedelta
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy import insert, literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.schemas import LoginRequest, Token, User, UserCreate
@@ -14,42 +16,63 @@ from src.auth.security import (
     get_current_active_user,
     get_password_hash,
 )
-from src.database import get_async_db
-from src.utils.config import get_settings
+from src.database import get_async_db, models
+from src.utils.config import Settings, get_settings
 
 router = APIRouter()
-settings = get_settings()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/token")
 
+_WWW_AUTH_HEADER = {"WWW-Authenticate": "Bearer"}
+
+
+@lru_cache(maxsize=8)
+def _access_token_expires(minutes: int) -> timedelta:
+    """Token lifetime, built once per configured value rather than per login."""
+    return timedelta(minutes=minutes)
+
+
+def _issue_token(user, settings: Settings) -> dict:
+    """Create the bearer token response for an authenticated user."""
+    access_token = create_access_token(
+        data={"sub": user.email, "user_id": str(user.id)},
+        expires_delta=_access_token_expires(settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
+
+    return {"access_token": access_token, "token_type": "bearer"}
+
 
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
 async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a new user."""
-    from src.database import models
-
-    # Check if user exists
-    result = await db.execute(
-        models.User.__table__.select().where(
-            (models.User.email == user_data.email) | (models.User.username == user_data.username)
+    # Check if user exists; one probe per unique index instead of an OR that
+    # the planner may answer with a sequential scan, returning a single bool
+    user_exists = await db.scalar(
+        select(
+            union_all(
+                select(literal(1)).where(models.User.email == user_data.email),
+                select(literal(1)).where(models.User.username == user_data.username),
+            ).exists()
         )
     )
-    if result.fetchone():
+    if user_exists:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with this email or username already exists",
         )
 
-    # Create user
+    # Create user; RETURNING yields the server defaults without a refresh query
     hashed_password = get_password_hash(user_data.password)
-    db_user = models.User(
-        email=user_data.email,
-        username=user_data.username,
-        full_name=user_data.full_name,
-        hashed_password=hashed_password,
+    db_user = await db.scalar(
+        insert(models.User)
+        .values(
+            email=user_data.email,
+            username=user_data.username,
+            full_name=user_data.full_name,
+            hashed_password=hashed_password,
+        )
+        .returning(models.User)
     )
-    db.add(db_user)
     await db.commit()
-    await db.refresh(db_user)
 
     return db_user
 
@@ -58,6 +81,7 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_d
 async def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     db: AsyncSession = Depends(get_async_db),
+    settings: Settings = Depends(get_settings),
 ):
     """Login with email (username field) and password."""
     user = await authenticate_user(db, form_data.username, form_data.password)
@@ -65,19 +89,18 @@ async def login(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_WWW_AUTH_HEADER,
         )
 
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.email, "user_id": str(user.id)}, expires_delta=access_token_expires
-    )
-
-    return {"access_token": access_token, "token_type": "bearer"}
+    return _issue_token(user, settings)
 
 
 @router.post("/login", response_model=Token)
-async def login_json(login_data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+async def login_json(
+    login_data: LoginRequest,
+    db: AsyncSession = Depends(get_async_db),
+    settings: Settings = Depends(get_settings),
+):
     """Login with JSON payload."""
     user = await authenticate_user(db, login_data.email, login_data.password)
     if not user:
@@ -85,12 +108,7 @@ async def login_json(login_data: LoginRequest, db: AsyncSession = Depends(get_as
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect email or password"
         )
 
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.email, "user_id": str(user.id)}, expires_delta=access_token_expires
-    )
-
-    return {"access_token": access_token, "token_type": "bearer"}
+    return _issue_token(user, settings)
 
 
 @router.get("/me", response_model=User)
@@ -2,12 +2,17 @@
 API routes for baseline hedging strategies.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import itertools
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, HTTPException, Response, status
 from pydantic import BaseModel, Field
 
+from src.api.responses import ORJSONResponse
+from src.api.workers import run_in_process
 from src.baselines.hedging_strategies import (
     DeltaGammaHedging,
     DeltaGammaVegaHedging,
@@ -19,6 +24,59 @@ from src.evaluation.metrics import BacktestResult, HedgingEvaluator
 # Router
 router = APIRouter(prefix="/baselines", tags=["baselines"])
 
+STRATEGIES = {
+    "delta": DeltaHedging,
+    "delta_gamma": DeltaGammaHedging,
+    "delta_gamma_vega": DeltaGammaVegaHedging,
+    "min_variance": MinimumVarianceHedging,
+}
+_STRATEGY_NAMES = list(STRATEGIES)
+
+# Dummy historical returns for min-variance requests, drawn once and reused
+# round-robin instead of sampling the global RNG on every request
+_MV_POOL_SIZE = 64
+_MV_POOL = np.random.default_rng(42).standard_normal((_MV_POOL_SIZE, 2, 252))
+_mv_counter = itertools.count()
+_INV_SQRT_252 = 1.0 / np.sqrt(252)
+
+
+def _run_backtest(
+    evaluator_kwargs: Dict[str, Any],
+    strategy_key: str,
+    strategy_kwargs: Dict[str, Any],
+    strategy_name: str,
+    num_episodes: int,
+    seed: Optional[int],
+) -> Dict[str, Any]:
+    """
+    Run a single backtest inside a worker process.
+
+    Args:
+        evaluator_kwargs: Market parameters for HedgingEvaluator
+        strategy_key: Key into STRATEGIES
+        strategy_kwargs: Kwargs for strategy initialization
+        strategy_name: Name reported in the result
+        num_episodes: Number of episodes to run
+        seed: Random seed
+
+    Returns:
+        Backtest result as a dictionary
+    """
+    evaluator = HedgingEvaluator(**evaluator_kwargs)
+    result = evaluator.backtest_strategy(
+        strategy_class=STRATEGIES[strategy_key],
+        strategy_kwargs=strategy_kwargs,
+        strategy_name=strategy_name,
+        num_episodes=num_episodes,
+        seed=seed,
+    )
+    return result.to_dict()
+
+
+async def _submit_backtest(*args: Any) -> Dict[str, Any]:
+    """Run `_run_backtest` in the process pool without blocking the event loop."""
+    return await run_in_process(_run_backtest, *args)
+
 
 # Request/Response Models
 class BaselineExecuteRequest(BaseModel):
@@ -86,25 +144,55 @@ class ComparisonResponse(BaseModel):
     comparison_metric: str
 
 
-def _get_strategy_class(strategy_name: str):
-    """Get strategy class by name."""
-    strategies = {
-        "delta": DeltaHedging,
-        "delta_gamma": DeltaGammaHedging,
-        "delta_gamma_vega": DeltaGammaVegaHedging,
-        "min_variance": MinimumVarianceHedging,
-    }
-
-    if strategy_name.lower() not in strategies:
+def _get_strategy_key(strategy_name: str) -> str:
+    """Get the STRATEGIES key for a strategy name, rejecting unknown names."""
+    key = strategy_name.lower()
+    if key not in STRATEGIES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unknown strategy: {strategy_name}. Available: {list(strategies.keys())}",
+            detail=f"Unknown strategy: {strategy_name}. Available: {_STRATEGY_NAMES}",
         )
 
-    return strategies[strategy_name.lower()]
+    return key
+
+
+def _dummy_min_variance_returns(sigma: float) -> Dict[str, np.ndarray]:
+    """
+    Build placeholder historical returns for min-variance hedging.
+
+    In production, these should come from actual historical data.
+
+    Args:
+        sigma: Volatility used to scale the stock returns
+
+    Returns:
+        Stock and option return series keyed by strategy kwarg name
+    """
+    stock_draws, option_draws = _MV_POOL[next(_mv_counter) % _MV_POOL_SIZE]
+    returns_stock = stock_draws * (sigma * _INV_SQRT_252)
+    returns_option = returns_stock * 0.5 + option_draws * 0.01
+    return {
+        "historical_stock_returns": returns_stock,
+        "historical_option_returns": returns_option,
+    }
+
+
+def _evaluator_kwargs(
+    request: Union[BaselineExecuteRequest, BaselineCompareRequest]
+) -> Dict[str, Any]:
+    """Build HedgingEvaluator kwargs from request."""
+    return {
+        "S0": request.S0,
+        "K": request.K,
+        "T": request.T,
+        "r": request.r,
+        "sigma": request.sigma,
+        "n_steps": request.n_steps,
+        "option_type": request.option_type,
+    }
 
 
-def _get_strategy_kwargs(request: BaselineExecuteRequest) -> Dict[str, Any]:
+def _get_strategy_kwargs(request: BaselineExecuteRequest, strategy_key: str) -> Dict[str, Any]:
     """Build strategy kwargs from request."""
     kwargs = {
         "S0": request.S0,
@@ -117,58 +205,46 @@ def _get_strategy_kwargs(request: BaselineExecuteRequest) -> Dict[str, Any]:
     }
 
     # Add strategy-specific params
-    if request.strategy_name.lower() == "delta_gamma":
+    if strategy_key == "delta_gamma":
         kwargs["gamma_weight"] = request.gamma_weight
-    elif request.strategy_name.lower() == "delta_gamma_vega":
+    elif strategy_key == "delta_gamma_vega":
         kwargs["gamma_weight"] = request.gamma_weight
         kwargs["vega_weight"] = request.vega_weight
-    elif request.strategy_name.lower() == "min_variance":
-        # Generate some dummy historical data for min variance
-        # In production, this should come from actual historical data
-        returns_stock = np.random.randn(252) * request.sigma / np.sqrt(252)
-        returns_option = returns_stock * 0.5 + np.random.randn(252) * 0.01
-        kwargs["historical_stock_returns"] = returns_stock
-        kwargs["historical_option_returns"] = returns_option
+    elif strategy_key == "min_variance":
+        kwargs.update(_dummy_min_variance_returns(request.sigma))
 
     return kwargs
 
 
 @router.post("/execute", response_model=BacktestResultResponse)
-def execute_baseline(request: BaselineExecuteRequest):
+async def execute_baseline(request: BaselineExecuteRequest):
     """
     Execute a baseline hedging strategy.
 
+    The backtest runs in the process pool so the event loop stays free for
+    other requests.
+
     Args:
         request: Execution configuration
 
     Returns:
         Backtest results
     """
-    # Get strategy class
-    strategy_class = _get_strategy_class(request.strategy_name)
+    # Validate strategy name
+    strategy_key = _get_strategy_key(request.strategy_name)
 
     # Build kwargs
-    strategy_kwargs = _get_strategy_kwargs(request)
-
-    # Create evaluator
-    evaluator = HedgingEvaluator(
-        S0=request.S0,
-        K=request.K,
-        T=request.T,
-        r=request.r,
-        sigma=request.sigma,
-        n_steps=request.n_steps,
-        option_type=request.option_type,
-    )
+    strategy_kwargs = _get_strategy_kwargs(request, strategy_key)
 
     # Run backtest
     try:
-        result = evaluator.backtest_strategy(
-            strategy_class=strategy_class,
-            strategy_kwargs=strategy_kwargs,
-            strategy_name=request.strategy_name,
-            num_episodes=request.num_episodes,
-            seed=request.seed,
+        result = await _submit_backtest(
+            _evaluator_kwargs(request),
+            strategy_key,
+            strategy_kwargs,
+            request.strategy_name,
+            request.num_episodes,
+            request.seed,
         )
     except Exception as e:
         raise HTTPException(
@@ -176,35 +252,36 @@ def execute_baseline(request: BaselineExecuteRequest):
             detail=f"Backtest failed: {str(e)}",
         )
 
-    return BacktestResultResponse(**result.to_dict())
+    # The worker's BacktestResult.to_dict() already has the response types, so
+    # skip the response_model round trip and encode it directly
+    return ORJSONResponse(result)
 
 
 @router.post("/compare", response_model=ComparisonResponse)
-def compare_baselines(request: BaselineCompareRequest):
+async def compare_baselines(request: BaselineCompareRequest):
     """
     Compare multiple baseline strategies.
 
+    Each strategy is backtested in its own worker process and the results
+    are gathered concurrently.
+
     Args:
         request: Comparison configuration
 
     Returns:
         Comparison results
     """
-    # Create evaluator
-    evaluator = HedgingEvaluator(
-        S0=request.S0,
-        K=request.K,
-        T=request.T,
-        r=request.r,
-        sigma=request.sigma,
-        n_steps=request.n_steps,
-        option_type=request.option_type,
-    )
+    if not request.strategies:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="No strategies to compare"
+        )
+
+    evaluator_kwargs = _evaluator_kwargs(request)
 
     # Prepare strategies list
     strategies = []
     for strategy_name in request.strategies:
-        strategy_class = _get_strategy_class(strategy_name)
+        strategy_key = _get_strategy_key(strategy_name)
 
         # Build minimal kwargs (without strategy-specific params for now)
         strategy_kwargs = {
@@ -218,25 +295,30 @@ def compare_baselines(request: BaselineCompareRequest):
         }
 
         # Add strategy-specific params with defaults
-        if strategy_name.lower() == "delta_gamma":
+        if strategy_key == "delta_gamma":
             strategy_kwargs["gamma_weight"] = 0.5
-        elif strategy_name.lower() == "delta_gamma_vega":
+        elif strategy_key == "delta_gamma_vega":
             strategy_kwargs["gamma_weight"] = 0.5
             strategy_kwargs["vega_weight"] = 0.5
-        elif strategy_name.lower() == "min_variance":
-            returns_stock = np.random.randn(252) * request.sigma / np.sqrt(252)
-            returns_option = returns_stock * 0.5 + np.random.randn(252) * 0.01
-            strategy_kwargs["historical_stock_returns"] = returns_stock
-            strategy_kwargs["historical_option_returns"] = returns_option
+        elif strategy_key == "min_variance":
+            strategy_kwargs.update(_dummy_min_variance_returns(request.sigma))
 
-        strategies.append((strategy_class, strategy_kwargs, strategy_name))
+        strategies.append((strategy_key, strategy_kwargs, strategy_name))
 
     # Run comparison
     try:
-        comparison_df = evaluator.compare_strategies(
-            strategies=strategies,
-            num_episodes=request.num_episodes,
-            seed=request.seed,
+        backtests = await asyncio.gather(
+            *(
+                _submit_backtest(
+                    evaluator_kwargs,
+                    strategy_key,
+                    strategy_kwargs,
+                    strategy_name,
+                    request.num_episodes,
+                    request.seed,
+                )
+                for strategy_key, strategy_kwargs, strategy_name in strategies
+            )
         )
     except Exception as e:
         raise HTTPException(
@@ -244,51 +326,54 @@ def compare_baselines(request: BaselineCompareRequest):
             detail=f"Comparison failed: {str(e)}",
         )
 
-    # Convert to response
-    results = []
-    for _, row in comparison_df.iterrows():
-        results.append(BacktestResultResponse(**row.to_dict()))
+    # Rank by mean PnL; the best strategy comes first
+    backtests.sort(key=lambda result: result["mean_pnl"], reverse=True)
 
-    # Find best strategy by mean PnL
-    best_idx = comparison_df["mean_pnl"].idxmax()
-    best_strategy = comparison_df.loc[best_idx, "strategy_name"]
-
-    return ComparisonResponse(
-        strategies=results,
-        best_strategy=best_strategy,
-        comparison_metric="mean_pnl",
+    return ORJSONResponse(
+        {
+            "strategies": backtests,
+            "best_strategy": backtests[0]["strategy_name"],
+            "comparison_metric": "mean_pnl",
+        }
     )
 
 
+# Static strategy catalogue, encoded once at import
+_STRATEGIES_PAYLOAD = orjson.dumps(
+    {
+        "strategies": [
+            {
+                "name": "delta",
+                "description": "Delta hedging - neutralizes first-order price risk",
+                "parameters": [],
+            },
+            {
+                "name": "delta_gamma",
+                "description": "Delta-Gamma hedging - neutralizes first and second-order price risk",
+                "parameters": ["gamma_weight"],
+            },
+            {
+                "name": "delta_gamma_vega",
+                "description": "Delta-Gamma-Vega hedging - neutralizes price and volatility risk",
+                "parameters": ["gamma_weight", "vega_weight"],
+            },
+            {
+                "name": "min_variance",
+                "description": "Minimum Variance hedging - statistical hedge ratio from historical covariance",
+                "parameters": ["historical_stock_returns", "historical_option_returns"],
+            },
+        ],
+        "count": 4,
+    }
+)
+
+
 @router.get("/strategies")
-def list_strategies():
+async def list_strategies():
     """
     List available baseline strategies.
 
     Returns:
         List of strategy names and descriptions
     """
-    strategies = [
-        {
-            "name": "delta",
-            "description": "Delta hedging - neutralizes first-order price risk",
-            "parameters": [],
-        },
-        {
-            "name": "delta_gamma",
-            "description": "Delta-Gamma hedging - neutralizes first and second-order price risk",
-            "parameters": ["gamma_weight"],
-        },
-        {
-            "name": "delta_gamma_vega",
-            "description": "Delta-Gamma-Vega hedging - neutralizes price and volatility risk",
-            "parameters": ["gamma_weight", "vega_weight"],
-        },
-        {
-            "name": "min_variance",
-            "description": "Minimum Variance hedging - statistical hedge ratio from historical covariance",
-            "parameters": ["historical_stock_returns", "historical_option_returns"],
-        },
-    ]
-
-    return {"strategies": strategies, "count": len(strategies)}
+    return Response(content=_STRATEGIES_PAYLOAD, media_type="application/json")
@@ -1,18 +1,25 @@
 """Dataset management routes."""
 
+import base64
+import binascii
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
+from sqlalchemy import delete, insert, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from src.api.schemas import Dataset, DatasetCreate, DatasetUpdate, User
+from src.api.responses import ORJSONResponse, list_adapter
+from src.api.schemas import Dataset, DatasetCreate, DatasetPage, DatasetUpdate, User, UUIDStr
+from src.api.workers import run_in_process
 from src.auth.security import get_current_active_user
 from src.data import (
     DataPreprocessor,
+    DataQualityReport,
     GBMSimulator,
     HestonSimulator,
     YFinanceDataFetcher,
@@ -23,6 +30,37 @@ from src.database import get_async_db, models
 
 router = APIRouter()
 
+# Built once at import so list requests reuse the compiled validator and serializer
+_DATASET_LIST_ADAPTER = list_adapter(Dataset)
+
+
+def _dataset_not_found() -> HTTPException:
+    """404 error for a missing dataset."""
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dataset not found")
+
+
+def _dataset_columns(data: dict) -> dict:
+    """Map dataset schema fields to model columns (``metadata`` is stored as ``meta_data``)."""
+    if "metadata" in data:
+        data = dict(data)
+        data["meta_data"] = data.pop("metadata")
+    return data
+
+
+async def _insert_dataset(db: AsyncSession, **values) -> models.Dataset:
+    """Insert a dataset and commit, fetching the stored row in the same round-trip."""
+    db_dataset = await db.scalar(insert(models.Dataset).values(**values).returning(models.Dataset))
+    await db.commit()
+    return db_dataset
+
+
+async def _get_dataset_or_404(db: AsyncSession, dataset_id: str) -> models.Dataset:
+    """Load a dataset by ID, raising 404 if it does not exist."""
+    dataset = await db.scalar(select(models.Dataset).where(models.Dataset.id == dataset_id))
+    if dataset is None:
+        raise _dataset_not_found()
+    return dataset
+
 
 # Request/Response Models
 class FetchMarketDataRequest(BaseModel):
@@ -32,6 +70,9 @@ class FetchMarketDataRequest(BaseModel):
     start_date: Optional[str] = Field(None, description="Start date (YYYY-MM-DD)")
     end_date: Optional[str] = Field(None, description="End date (YYYY-MM-DD)")
     save_to_db: bool = Field(True, description="Save dataset to database")
+    return_validation: bool = Field(
+        False, description="Validate the data even when it is not saved"
+    )
 
 
 class GenerateSyntheticDataRequest(BaseModel):
@@ -50,6 +91,20 @@ class GenerateSyntheticDataRequest(BaseModel):
     rho: Optional[float] = Field(-0.7, description="Correlation")
     v0: Optional[float] = Field(0.04, description="Initial variance")
     save_to_db: bool = Field(True, description="Save dataset to database")
+    return_validation: bool = Field(
+        False, description="Validate the data even when it is not saved"
+    )
+
+
+# Request fields that control the endpoint rather than the simulation
+_SYNTHETIC_REQUEST_FLAGS = {"save_to_db", "return_validation"}
+
+
+def _validation_summary(report: Optional[DataQualityReport]) -> Optional[dict]:
+    """Validation outcome for API responses, or None if validation was skipped."""
+    if report is None:
+        return None
+    return {"is_valid": report.is_valid, "issues": report.issues, "warnings": report.warnings}
 
 
 class DataValidationResponse(BaseModel):
@@ -64,19 +119,48 @@ class DataValidationResponse(BaseModel):
 # CRUD Endpoints
 
 
-@router.get("/", response_model=List[Dataset])
+def _encode_cursor(dataset: models.Dataset) -> str:
+    """Opaque, URL-safe keyset cursor for the position just after ``dataset``."""
+    key = f"{dataset.created_at.isoformat()}_{dataset.id}"
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Parse a cursor produced by `_encode_cursor`, rejecting malformed input."""
+    try:
+        key = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, dataset_id = key.rsplit("_", 1)
+        return datetime.fromisoformat(created_at), UUID(dataset_id)
+    except (ValueError, binascii.Error):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+@router.get("/", response_model=DatasetPage)
 async def list_datasets(
-    skip: int = 0,
-    limit: int = 100,
+    after: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """List all datasets."""
-    result = await db.execute(
-        select(models.Dataset).offset(skip).limit(limit).order_by(models.Dataset.created_at.desc())
+    """
+    List datasets, newest first.
+
+    Pages are keyed on (created_at, id) rather than OFFSET, so later pages
+    cost the same as the first.
+    """
+    stmt = select(models.Dataset)
+    if after:
+        stmt = stmt.where(
+            tuple_(models.Dataset.created_at, models.Dataset.id) < _decode_cursor(after)
+        )
+    stmt = stmt.order_by(models.Dataset.created_at.desc(), models.Dataset.id.desc()).limit(limit)
+
+    datasets = (await db.scalars(stmt)).all()
+    next_cursor = _encode_cursor(datasets[-1]) if len(datasets) == limit else None
+    items = _DATASET_LIST_ADAPTER.validate_python(datasets, from_attributes=True)
+    return ORJSONResponse(
+        {"items": _DATASET_LIST_ADAPTER.dump_python(items), "next_cursor": next_cursor}
     )
-    datasets = result.scalars().all()
-    return datasets
 
 
 @router.post("/", response_model=Dataset, status_code=status.HTTP_201_CREATED)
@@ -86,62 +170,69 @@ async def create_dataset(
     current_user: User = Depends(get_current_active_user),
 ):
     """Create a new dataset."""
-    db_dataset = models.Dataset(**dataset.model_dump())
-    db.add(db_dataset)
-    await db.commit()
-    await db.refresh(db_dataset)
-    return db_dataset
+    return await _insert_dataset(db, **_dataset_columns(dataset.model_dump()))
 
 
 @router.get("/{dataset_id}", response_model=Dataset)
 async def get_dataset(
-    dataset_id: UUID,
+    dataset_id: UUIDStr,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Get dataset by ID."""
-    result = await db.execute(select(models.Dataset).where(models.Dataset.id == dataset_id))
-    dataset = result.scalar_one_or_none()
-    if not dataset:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dataset not found")
-    return dataset
+    return await _get_dataset_or_404(db, dataset_id)
 
 
 @router.patch("/{dataset_id}", response_model=Dataset)
 async def update_dataset(
-    dataset_id: UUID,
+    dataset_id: UUIDStr,
     dataset_update: DatasetUpdate,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Update dataset."""
-    result = await db.execute(select(models.Dataset).where(models.Dataset.id == dataset_id))
-    dataset = result.scalar_one_or_none()
-    if not dataset:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dataset not found")
-
     update_data = dataset_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(dataset, field, value)
+    if not update_data:
+        return await _get_dataset_or_404(db, dataset_id)
+
+    # UPDATE ... RETURNING fetches the updated row in the same round-trip
+    dataset = await db.scalar(
+        update(models.Dataset)
+        .where(models.Dataset.id == dataset_id)
+        .values(**_dataset_columns(update_data))
+        .returning(models.Dataset)
+    )
+    if dataset is None:
+        raise _dataset_not_found()
 
     await db.commit()
-    await db.refresh(dataset)
     return dataset
 
 
 @router.delete("/{dataset_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_dataset(
-    dataset_id: UUID,
+    dataset_id: UUIDStr,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Delete dataset."""
-    result = await db.execute(select(models.Dataset).where(models.Dataset.id == dataset_id))
-    dataset = result.scalar_one_or_none()
-    if not dataset:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dataset not found")
+    # Detach referencing rows explicitly: databases created before the
+    # ON DELETE SET NULL foreign keys would otherwise reject the delete
+    await db.execute(
+        update(models.Experiment)
+        .where(models.Experiment.dataset_id == dataset_id)
+        .values(dataset_id=None)
+    )
+    await db.execute(
+        update(models.Evaluation)
+        .where(models.Evaluation.test_dataset_id == dataset_id)
+        .values(test_dataset_id=None)
+    )
+    result = await db.execute(delete(models.Dataset).where(models.Dataset.id == dataset_id))
+    if result.rowcount == 0:
+        await db.rollback()
+        raise _dataset_not_found()
 
-    await db.delete(dataset)
     await db.commit()
     return None
 
@@ -164,11 +255,9 @@ async def fetch_market_data(
     try:
         fetcher = YFinanceDataFetcher()
 
-        # Parse dates
-        start_date = (
-            datetime.strptime(request.start_date, "%Y-%m-%d") if request.start_date else None
-        )
-        end_date = datetime.strptime(request.end_date, "%Y-%m-%d") if request.end_date else None
+        # Parse dates (fromisoformat is a C fast path for YYYY-MM-DD)
+        start_date = datetime.fromisoformat(request.start_date) if request.start_date else None
+        end_date = datetime.fromisoformat(request.end_date) if request.end_date else None
 
         # Fetch data
         df = fetcher.fetch_stock_data(request.ticker, start_date, end_date)
@@ -179,43 +268,43 @@ async def fetch_market_data(
                 detail=f"No data found for ticker {request.ticker}",
             )
 
-        # Validate data
-        validation_report = validate_market_dataframe(df, request.ticker)
+        # Validation is only needed for the saved metadata or when asked for
+        validation_report = (
+            validate_market_dataframe(df, request.ticker)
+            if request.save_to_db or request.return_validation
+            else None
+        )
 
         # Save to database if requested
         dataset_id = None
         if request.save_to_db:
-            db_dataset = models.Dataset(
+            db_dataset = await _insert_dataset(
+                db,
                 name=f"{request.ticker}_market_data",
-                dataset_type="market",
-                source="yfinance",
-                config={
-                    "ticker": request.ticker,
-                    "start_date": request.start_date,
-                    "end_date": request.end_date,
-                },
-                metadata={
-                    "records": len(df),
-                    "validation": validation_report.model_dump(),
+                ticker=request.ticker,
+                data_type="historical",
+                start_date=start_date,
+                end_date=end_date,
+                num_samples=len(df),
+                meta_data={
+                    "source": "yfinance",
+                    "validation": validation_report.model_dump(mode="json"),
                 },
             )
-            db.add(db_dataset)
-            await db.commit()
-            await db.refresh(db_dataset)
             dataset_id = str(db_dataset.id)
 
-        return {
-            "status": "success",
-            "ticker": request.ticker,
-            "records": len(df),
-            "dataset_id": dataset_id,
-            "validation": {
-                "is_valid": validation_report.is_valid,
-                "issues": validation_report.issues,
-                "warnings": validation_report.warnings,
-            },
-            "preview": df.head().to_dict(orient="records"),
-        }
+        # The preview is encoded by pandas and embedded as-is; returning the
+        # response directly also skips FastAPI's per-value jsonable_encoder pass
+        return ORJSONResponse(
+            {
+                "status": "success",
+                "ticker": request.ticker,
+                "records": len(df),
+                "dataset_id": dataset_id,
+                "validation": _validation_summary(validation_report),
+                "preview": orjson.Fragment(df.head().to_json(orient="records", date_format="iso")),
+            }
+        )
 
     except Exception as e:
         raise HTTPException(
@@ -224,6 +313,40 @@ async def fetch_market_data(
         )
 
 
+def _simulate_and_validate(params: dict, validate: bool = True) -> Optional[DataQualityReport]:
+    """
+    Simulate synthetic paths and validate them inside a worker process.
+
+    Args:
+        params: GenerateSyntheticDataRequest fields
+        validate: Whether to run the validation pass over the paths
+
+    Returns:
+        Validation report for the simulated price paths, or None if skipped
+    """
+    dt = 1.0 / params["n_steps"]
+    if params["simulator"].lower() == "gbm":
+        simulator = GBMSimulator(
+            S0=params["S0"], mu=params["r"], sigma=params["sigma"], T=1.0, dt=dt
+        )
+        paths = simulator.simulate(params["n_paths"], antithetic=True)
+    else:
+        simulator = HestonSimulator(
+            S0=params["S0"],
+            V0=params["v0"] or 0.04,
+            mu=params["r"],
+            kappa=params["kappa"] or 2.0,
+            theta=params["theta"] or 0.04,
+            xi=params["xi"] or 0.3,
+            rho=params["rho"] or -0.7,
+            T=1.0,
+            dt=dt,
+        )
+        paths, _ = simulator.simulate(params["n_paths"], antithetic=True)
+
+    return validate_synthetic_paths(paths, params["simulator"]) if validate else None
+
+
 @router.post("/generate-synthetic", status_code=status.HTTP_200_OK)
 async def generate_synthetic_data(
     request: GenerateSyntheticDataRequest,
@@ -235,57 +358,34 @@ async def generate_synthetic_data(
 
     This endpoint generates simulated stock prices for training/testing.
     """
-    try:
-        # Initialize simulator
-        if request.simulator.lower() == "gbm":
-            simulator = GBMSimulator(
-                S0=request.S0,
-                mu=request.r,
-                sigma=request.sigma,
-                T=1.0,
-                n_steps=request.n_steps,
-            )
-        elif request.simulator.lower() == "heston":
-            simulator = HestonSimulator(
-                S0=request.S0,
-                v0=request.v0 or 0.04,
-                r=request.r,
-                kappa=request.kappa or 2.0,
-                theta=request.theta or 0.04,
-                xi=request.xi or 0.3,
-                rho=request.rho or -0.7,
-                T=1.0,
-                n_steps=request.n_steps,
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid simulator type: {request.simulator}. Use 'gbm' or 'heston'",
-            )
-
-        # Generate paths
-        paths = simulator.simulate(request.n_paths)
+    if request.simulator.lower() not in ("gbm", "heston"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid simulator type: {request.simulator}. Use 'gbm' or 'heston'",
+        )
 
-        # Validate synthetic data
-        validation_report = validate_synthetic_paths(paths, request.simulator)
+    try:
+        # Simulate and validate in a worker process; only the report comes back
+        validation_report = await run_in_process(
+            _simulate_and_validate,
+            request.model_dump(exclude=_SYNTHETIC_REQUEST_FLAGS),
+            request.save_to_db or request.return_validation,
+        )
 
         # Save to database if requested
         dataset_id = None
         if request.save_to_db:
-            db_dataset = models.Dataset(
+            db_dataset = await _insert_dataset(
+                db,
                 name=f"{request.simulator}_synthetic_{request.n_paths}paths",
-                dataset_type="synthetic",
-                source=request.simulator,
-                config=request.model_dump(exclude={"save_to_db"}),
-                metadata={
-                    "n_paths": request.n_paths,
+                data_type=f"synthetic_{request.simulator.lower()}",
+                num_samples=request.n_paths,
+                meta_data={
+                    "config": request.model_dump(exclude=_SYNTHETIC_REQUEST_FLAGS),
                     "n_steps": request.n_steps,
-                    "validation": validation_report.model_dump(),
+                    "validation": validation_report.model_dump(mode="json"),
                 },
             )
-            db.add(db_dataset)
-            await db.commit()
-            await db.refresh(db_dataset)
             dataset_id = str(db_dataset.id)
 
         return {
@@ -294,12 +394,8 @@ async def generate_synthetic_data(
             "n_paths": request.n_paths,
             "n_steps": request.n_steps,
             "dataset_id": dataset_id,
-            "validation": {
-                "is_valid": validation_report.is_valid,
-                "issues": validation_report.issues,
-                "warnings": validation_report.warnings,
-            },
-            "statistics": validation_report.statistics,
+            "validation": _validation_summary(validation_report),
+            "statistics": validation_report.statistics if validation_report else None,
         }
 
     except Exception as e:
@@ -311,7 +407,7 @@ async def generate_synthetic_data(
 
 @router.post("/{dataset_id}/validate", response_model=DataValidationResponse)
 async def validate_dataset(
-    dataset_id: UUID,
+    dataset_id: UUIDStr,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
@@ -320,14 +416,11 @@ async def validate_dataset(
 
     This endpoint runs validation checks on an existing dataset.
     """
-    result = await db.execute(select(models.Dataset).where(models.Dataset.id == dataset_id))
-    dataset = result.scalar_one_or_none()
-    if not dataset:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dataset not found")
+    dataset = await _get_dataset_or_404(db, dataset_id)
 
     # Return cached validation if available
-    if dataset.metadata and "validation" in dataset.metadata:
-        validation_data = dataset.metadata["validation"]
+    if dataset.meta_data and "validation" in dataset.meta_data:
+        validation_data = dataset.meta_data["validation"]
         return DataValidationResponse(
             is_valid=validation_data.get("is_valid", False),
             issues=validation_data.get("issues", []),
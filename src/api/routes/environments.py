@@ -2,20 +2,65 @@
 API routes for RL environment management.
 """
 
+import asyncio
+import logging
+import queue
+import secrets
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
+import orjson
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
+from src.api.environment_store import EnvironmentStore, EnvSlot
+from src.api.responses import ORJSONResponse
 from src.environments.hedging_env import OptionHedgingEnv
+from src.utils.config import get_settings
+
+logger = logging.getLogger(__name__)
 
 # Router
 router = APIRouter(prefix="/environments", tags=["environments"])
 
-# In-memory storage for active environments
-_active_environments: Dict[str, OptionHedgingEnv] = {}
+# Scratch lists reused by list_environments; the response is encoded before
+# a list goes back to the pool
+_RESPONSE_POOL: "queue.LifoQueue[list]" = queue.LifoQueue(maxsize=64)
+
+# Bounded in-memory storage for active environments
+_settings = get_settings()
+_active_environments = EnvironmentStore(
+    maxsize=_settings.ENV_STORE_MAXSIZE, ttl=_settings.ENV_STORE_TTL_SECONDS
+)
+
+
+def _get_slot(env_id: str) -> EnvSlot:
+    """Return the stored environment or raise a 404."""
+    slot = _active_environments.get(env_id)
+    if slot is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Environment {env_id} not found",
+        )
+    return slot
+
+
+async def reap_environments(interval: float = 30.0, grace: float = 60.0) -> None:
+    """
+    Periodically drop expired environments and finished episodes.
+
+    Args:
+        interval: Seconds between sweeps
+        grace: Seconds a completed environment is kept after its last access
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            _active_environments.evict_completed(grace)
+        except Exception:
+            # Keep sweeping; a failed pass must not stop eviction for good
+            logger.exception("Environment reaper sweep failed")
 
 
 # Request/Response Models
@@ -65,6 +110,25 @@ class StepResponse(BaseModel):
     current_step: int
 
 
+class StepBatchRequest(BaseModel):
+    """Request to take several steps in one call."""
+
+    actions: List[float] = Field(min_length=1, description="Actions to take in order")
+    include_info: bool = Field(default=False, description="Return the info dict of every step")
+
+
+class StepBatchResponse(BaseModel):
+    """Response from a batch of environment steps."""
+
+    observations: List[List[float]]
+    rewards: List[float]
+    terminated: bool
+    truncated: bool
+    steps: int
+    current_step: int
+    infos: Optional[List[Dict[str, Any]]] = None
+
+
 class EpisodeMetricsResponse(BaseModel):
     """Episode performance metrics."""
 
@@ -77,6 +141,9 @@ class EpisodeMetricsResponse(BaseModel):
     max_drawdown: float
 
 
+_EPISODE_METRIC_FIELDS = tuple(EpisodeMetricsResponse.model_fields)
+
+
 @router.post("/create", response_model=EnvironmentResponse, status_code=status.HTTP_201_CREATED)
 def create_environment(request: CreateEnvironmentRequest):
     """
@@ -97,8 +164,8 @@ def create_environment(request: CreateEnvironmentRequest):
         sigma=request.sigma,
         n_steps=request.n_steps,
         option_type=request.option_type,
-        action_type=request.action_type,
-        transaction_cost_pct=request.transaction_cost_pct,
+        action_mode=request.action_type,
+        transaction_cost=request.transaction_cost_pct,
         risk_penalty=request.risk_penalty,
     )
 
@@ -106,15 +173,12 @@ def create_environment(request: CreateEnvironmentRequest):
     env.reset(seed=request.seed)
 
     # Generate unique ID
-    env_id = f"env_{len(_active_environments)}_{datetime.utcnow().timestamp()}"
-    _active_environments[env_id] = env
-
-    return EnvironmentResponse(
-        env_id=env_id,
-        status="active",
-        current_step=env.current_step,
-        total_steps=env.n_steps,
-        config={
+    env_id = "env_" + secrets.token_hex(8)
+    created_at = datetime.utcnow().isoformat()
+
+    # The config never changes, so it is encoded once and embedded as-is on reads
+    config_json = orjson.dumps(
+        {
             "S0": request.S0,
             "K": request.K,
             "T": request.T,
@@ -123,8 +187,20 @@ def create_environment(request: CreateEnvironmentRequest):
             "n_steps": request.n_steps,
             "option_type": request.option_type,
             "action_type": request.action_type,
+        }
+    )
+    _active_environments.add(env_id, env, created_at, config_json)
+
+    return ORJSONResponse(
+        {
+            "env_id": env_id,
+            "status": "active",
+            "current_step": env.current_step,
+            "total_steps": env.n_steps,
+            "config": orjson.Fragment(config_json),
+            "created_at": created_at,
         },
-        created_at=datetime.utcnow().isoformat(),
+        status_code=status.HTTP_201_CREATED,
     )
 
 
@@ -139,30 +215,18 @@ def get_environment(env_id: str):
     Returns:
         Environment details
     """
-    if env_id not in _active_environments:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Environment {env_id} not found",
-        )
-
-    env = _active_environments[env_id]
-
-    return EnvironmentResponse(
-        env_id=env_id,
-        status="active" if env.current_step < env.n_steps else "completed",
-        current_step=env.current_step,
-        total_steps=env.n_steps,
-        config={
-            "S0": env.S0,
-            "K": env.K,
-            "T": env.T,
-            "r": env.r,
-            "sigma": env.sigma,
-            "n_steps": env.n_steps,
-            "option_type": env.option_type,
-            "action_type": env.action_type,
+    slot = _get_slot(env_id)
+    env = slot.env
+
+    return ORJSONResponse(
+        {
+            "env_id": env_id,
+            "status": "active" if env.current_step < env.n_steps else "completed",
+            "current_step": env.current_step,
+            "total_steps": env.n_steps,
+            "config": orjson.Fragment(slot.config_json),
+            "created_at": slot.created_at_iso,
         },
-        created_at=datetime.utcnow().isoformat(),
     )
 
 
@@ -178,22 +242,18 @@ def reset_environment(env_id: str, seed: Optional[int] = None):
     Returns:
         Initial observation
     """
-    if env_id not in _active_environments:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Environment {env_id} not found",
-        )
-
-    env = _active_environments[env_id]
+    env = _get_slot(env_id).env
     obs, info = env.reset(seed=seed)
 
-    return StepResponse(
-        observation=obs.tolist(),
-        reward=0.0,
-        terminated=False,
-        truncated=False,
-        info=info,
-        current_step=env.current_step,
+    return ORJSONResponse(
+        {
+            "observation": obs,
+            "reward": 0.0,
+            "terminated": False,
+            "truncated": False,
+            "info": info,
+            "current_step": env.current_step,
+        },
     )
 
 
@@ -209,17 +269,13 @@ def step_environment(env_id: str, request: StepRequest):
     Returns:
         Step result with observation, reward, done flags
     """
-    if env_id not in _active_environments:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Environment {env_id} not found",
-        )
-
-    env = _active_environments[env_id]
+    slot = _get_slot(env_id)
+    env = slot.env
 
     # Convert action based on action type
-    if env.action_type == "continuous":
-        action = np.array([request.action])
+    if env.action_mode == "continuous":
+        action = slot.action_buf
+        action[0] = request.action
     else:
         action = int(request.action)
 
@@ -231,13 +287,76 @@ def step_environment(env_id: str, request: StepRequest):
             detail=f"Step failed: {str(e)}",
         )
 
-    return StepResponse(
-        observation=obs.tolist(),
-        reward=float(reward),
-        terminated=bool(terminated),
-        truncated=bool(truncated),
-        info=info,
-        current_step=env.current_step,
+    return ORJSONResponse(
+        {
+            "observation": obs,
+            "reward": float(reward),
+            "terminated": bool(terminated),
+            "truncated": bool(truncated),
+            "info": info,
+            "current_step": env.current_step,
+        },
+    )
+
+
+@router.post("/{env_id}/step_batch", response_model=StepBatchResponse)
+def step_environment_batch(env_id: str, request: StepBatchRequest):
+    """
+    Take several steps in the environment in a single request.
+
+    Stepping stops early when the episode terminates or is truncated, so
+    ``steps`` may be smaller than the number of actions sent.
+
+    Args:
+        env_id: Environment ID
+        request: Actions to take and whether to return per-step info
+
+    Returns:
+        Stacked observations and rewards of the steps taken
+    """
+    slot = _get_slot(env_id)
+    env = slot.env
+
+    n_actions = len(request.actions)
+    observations = np.empty((n_actions, env.observation_space.shape[0]), dtype=np.float32)
+    rewards = np.empty(n_actions, dtype=np.float64)
+    infos: Optional[List[Dict[str, Any]]] = [] if request.include_info else None
+    continuous = env.action_mode == "continuous"
+    action_buf = slot.action_buf
+
+    steps = 0
+    terminated = truncated = False
+    try:
+        for value in request.actions:
+            if continuous:
+                action_buf[0] = value
+                action = action_buf
+            else:
+                action = int(value)
+            obs, reward, terminated, truncated, info = env.step(action)
+            observations[steps] = obs
+            rewards[steps] = reward
+            steps += 1
+            if infos is not None:
+                infos.append(info)
+            if terminated or truncated:
+                break
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Step {steps} failed: {str(e)}",
+        )
+
+    return ORJSONResponse(
+        {
+            "observations": observations[:steps],
+            "rewards": rewards[:steps],
+            "terminated": bool(terminated),
+            "truncated": bool(truncated),
+            "steps": steps,
+            "current_step": env.current_step,
+            "infos": infos,
+        }
     )
 
 
@@ -252,16 +371,10 @@ def get_episode_metrics(env_id: str):
     Returns:
         Episode metrics
     """
-    if env_id not in _active_environments:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Environment {env_id} not found",
-        )
-
-    env = _active_environments[env_id]
+    env = _get_slot(env_id).env
     metrics = env.get_episode_metrics()
 
-    return EpisodeMetricsResponse(**metrics)
+    return ORJSONResponse({field: metrics[field] for field in _EPISODE_METRIC_FIELDS})
 
 
 @router.delete("/{env_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -272,13 +385,11 @@ def delete_environment(env_id: str):
     Args:
         env_id: Environment ID
     """
-    if env_id not in _active_environments:
+    if _active_environments.pop(env_id) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Environment {env_id} not found",
         )
-
-    del _active_environments[env_id]
     return None
 
 
@@ -290,15 +401,30 @@ def list_environments():
     Returns:
         List of environment IDs and their status
     """
-    envs = []
-    for env_id, env in _active_environments.items():
-        envs.append(
-            {
-                "env_id": env_id,
-                "status": "active" if env.current_step < env.n_steps else "completed",
-                "current_step": env.current_step,
-                "total_steps": env.n_steps,
-            }
-        )
+    try:
+        envs = _RESPONSE_POOL.get_nowait()
+    except queue.Empty:
+        envs = []
 
-    return {"environments": envs, "count": len(envs)}
+    try:
+        for env_id, slot in _active_environments.items():
+            env = slot.env
+            envs.append(
+                {
+                    "env_id": env_id,
+                    "status": "active" if env.current_step < env.n_steps else "completed",
+                    "current_step": env.current_step,
+                    "total_steps": env.n_steps,
+                    "created_at": slot.created_at_iso,
+                }
+            )
+        # The body is rendered here, so the list can be reused right after
+        response = ORJSONResponse({"environments": envs, "count": len(envs)})
+    finally:
+        envs.clear()
+        try:
+            _RESPONSE_POOL.put_nowait(envs)
+        except queue.Full:
+            pass
+
+    return response
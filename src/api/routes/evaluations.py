@@ -1,18 +1,31 @@
 """Evaluation results routes."""
 
 from typing import List
-from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import bindparam, exists, insert, literal, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from src.api.schemas import Evaluation, EvaluationCreate, EvaluationUpdate, User
+from src.api.responses import orm_response, stream_response, trusted_response
+from src.api.schemas import Evaluation, EvaluationCreate, EvaluationUpdate, User, UUIDStr
 from src.auth.security import get_current_active_user
 from src.database import get_async_db, models
 
 router = APIRouter()
 
+# Statements are built once; per-request values are passed as bound parameters
+_LIST_EVALUATIONS = (
+    select(models.Evaluation)
+    .order_by(models.Evaluation.created_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_GET_EVALUATION = select(models.Evaluation).where(
+    models.Evaluation.id == bindparam("evaluation_id")
+)
+_EVALUATION_COLUMNS = models.Evaluation.__table__.c
+
 
 @router.get("/", response_model=List[Evaluation])
 async def list_evaluations(
@@ -21,78 +34,73 @@ async def list_evaluations(
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """List all evaluations."""
-    result = await db.execute(
-        select(models.Evaluation)
-        .offset(skip)
-        .limit(limit)
-        .order_by(models.Evaluation.created_at.desc())
-    )
-    evaluations = result.scalars().all()
-    return evaluations
+    """List all evaluations, streamed as they are read."""
+    return stream_response(db, _LIST_EVALUATIONS, {"skip": skip, "limit": limit}, Evaluation)
 
 
 @router.post("/", response_model=Evaluation, status_code=status.HTTP_201_CREATED)
 async def create_evaluation(
     evaluation: EvaluationCreate,
-    experiment_id: UUID,
+    experiment_id: UUIDStr,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Create a new evaluation."""
-    # Check if experiment exists and belongs to user
-    exp_result = await db.execute(
-        select(models.Experiment).where(
-            models.Experiment.id == experiment_id,
-            models.Experiment.user_id == current_user.id,
-        )
+    # INSERT ... SELECT ... WHERE EXISTS checks that the experiment belongs to the
+    # user and inserts in one round-trip; no row comes back if it does not
+    values = {"experiment_id": experiment_id, **evaluation.model_dump()}
+    owned_experiment = exists().where(
+        models.Experiment.id == experiment_id,
+        models.Experiment.user_id == current_user.id,
     )
-    experiment = exp_result.scalar_one_or_none()
-    if not experiment:
+    row = select(
+        *(literal(value, _EVALUATION_COLUMNS[name].type) for name, value in values.items())
+    ).where(owned_experiment)
+    db_evaluation = await db.scalar(
+        insert(models.Evaluation).from_select(list(values), row).returning(models.Evaluation)
+    )
+    if db_evaluation is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Experiment not found")
 
-    db_evaluation = models.Evaluation(experiment_id=experiment_id, **evaluation.model_dump())
-    db.add(db_evaluation)
     await db.commit()
-    await db.refresh(db_evaluation)
-    return db_evaluation
+    return orm_response(Evaluation, db_evaluation, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/{evaluation_id}", response_model=Evaluation)
 async def get_evaluation(
-    evaluation_id: UUID,
+    evaluation_id: UUIDStr,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Get evaluation by ID."""
-    result = await db.execute(
-        select(models.Evaluation).where(models.Evaluation.id == evaluation_id)
-    )
+    result = await db.execute(_GET_EVALUATION, {"evaluation_id": evaluation_id})
     evaluation = result.scalar_one_or_none()
     if not evaluation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
-    return evaluation
+    return trusted_response(Evaluation, evaluation)
 
 
 @router.patch("/{evaluation_id}", response_model=Evaluation)
 async def update_evaluation(
-    evaluation_id: UUID,
+    evaluation_id: UUIDStr,
     evaluation_update: EvaluationUpdate,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Update evaluation."""
-    result = await db.execute(
-        select(models.Evaluation).where(models.Evaluation.id == evaluation_id)
-    )
-    evaluation = result.scalar_one_or_none()
+    update_data = evaluation_update.model_dump(exclude_unset=True)
+    if update_data:
+        # UPDATE ... RETURNING fetches the updated row in the same round-trip
+        evaluation = await db.scalar(
+            update(models.Evaluation)
+            .where(models.Evaluation.id == evaluation_id)
+            .values(**update_data)
+            .returning(models.Evaluation)
+        )
+    else:
+        evaluation = await db.scalar(_GET_EVALUATION, {"evaluation_id": evaluation_id})
     if not evaluation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
 
-    update_data = evaluation_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(evaluation, field, value)
-
     await db.commit()
-    await db.refresh(evaluation)
-    return evaluation
+    return orm_response(Evaluation, evaluation)
@@ -1,18 +1,32 @@
 """Experiment management routes."""
 
 from typing import List
-from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import bindparam, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from src.api.schemas import Experiment, ExperimentCreate, ExperimentUpdate, User
+from src.api.responses import orm_response, stream_response, trusted_response
+from src.api.schemas import Experiment, ExperimentCreate, ExperimentUpdate, User, UUIDStr
 from src.auth.security import get_current_active_user
 from src.database import get_async_db, models
 
 router = APIRouter()
 
+# Statements are built once; per-request values are passed as bound parameters
+_LIST_EXPERIMENTS = (
+    select(models.Experiment)
+    .where(models.Experiment.user_id == bindparam("user_id"))
+    .order_by(models.Experiment.created_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_GET_EXPERIMENT = select(models.Experiment).where(
+    models.Experiment.id == bindparam("experiment_id"),
+    models.Experiment.user_id == bindparam("user_id"),
+)
+
 
 @router.get("/", response_model=List[Experiment])
 async def list_experiments(
@@ -21,16 +35,9 @@ async def list_experiments(
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """List user's experiments."""
-    result = await db.execute(
-        select(models.Experiment)
-        .where(models.Experiment.user_id == current_user.id)
-        .offset(skip)
-        .limit(limit)
-        .order_by(models.Experiment.created_at.desc())
-    )
-    experiments = result.scalars().all()
-    return experiments
+    """List user's experiments, streamed as they are read."""
+    params = {"user_id": current_user.id, "skip": skip, "limit": limit}
+    return stream_response(db, _LIST_EXPERIMENTS, params, Experiment)
 
 
 @router.post("/", response_model=Experiment, status_code=status.HTTP_201_CREATED)
@@ -40,71 +47,71 @@ async def create_experiment(
     current_user: User = Depends(get_current_active_user),
 ):
     """Create a new experiment."""
-    db_experiment = models.Experiment(user_id=current_user.id, **experiment.model_dump())
-    db.add(db_experiment)
+    # INSERT ... RETURNING fetches the stored row in the same round-trip
+    db_experiment = await db.scalar(
+        insert(models.Experiment)
+        .values(user_id=current_user.id, **experiment.model_dump())
+        .returning(models.Experiment)
+    )
     await db.commit()
-    await db.refresh(db_experiment)
-    return db_experiment
+    return orm_response(Experiment, db_experiment, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/{experiment_id}", response_model=Experiment)
 async def get_experiment(
-    experiment_id: UUID,
+    experiment_id: UUIDStr,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Get experiment by ID."""
     result = await db.execute(
-        select(models.Experiment).where(
-            models.Experiment.id == experiment_id,
-            models.Experiment.user_id == current_user.id,
-        )
+        _GET_EXPERIMENT, {"experiment_id": experiment_id, "user_id": current_user.id}
     )
     experiment = result.scalar_one_or_none()
     if not experiment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Experiment not found")
-    return experiment
+    return trusted_response(Experiment, experiment)
 
 
 @router.patch("/{experiment_id}", response_model=Experiment)
 async def update_experiment(
-    experiment_id: UUID,
+    experiment_id: UUIDStr,
     experiment_update: ExperimentUpdate,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Update experiment."""
-    result = await db.execute(
-        select(models.Experiment).where(
-            models.Experiment.id == experiment_id,
-            models.Experiment.user_id == current_user.id,
+    update_data = experiment_update.model_dump(exclude_unset=True)
+    if update_data:
+        # UPDATE ... RETURNING fetches the updated row in the same round-trip
+        experiment = await db.scalar(
+            update(models.Experiment)
+            .where(
+                models.Experiment.id == experiment_id, models.Experiment.user_id == current_user.id
+            )
+            .values(**update_data)
+            .returning(models.Experiment)
+        )
+    else:
+        experiment = await db.scalar(
+            _GET_EXPERIMENT, {"experiment_id": experiment_id, "user_id": current_user.id}
         )
-    )
-    experiment = result.scalar_one_or_none()
     if not experiment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Experiment not found")
 
-    update_data = experiment_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(experiment, field, value)
-
     await db.commit()
-    await db.refresh(experiment)
-    return experiment
+    return orm_response(Experiment, experiment)
 
 
 @router.delete("/{experiment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_experiment(
-    experiment_id: UUID,
+    experiment_id: UUIDStr,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Delete experiment."""
     result = await db.execute(
-        select(models.Experiment).where(
-            models.Experiment.id == experiment_id,
-            models.Experiment.user_id == current_user.id,
-        )
+        _GET_EXPERIMENT, {"experiment_id": experiment_id, "user_id": current_user.id}
     )
     experiment = result.scalar_one_or_none()
     if not experiment:
@@ -1,53 +1,111 @@
 """Health check endpoints."""
 
+import asyncio
+import time
 from datetime import datetime
+from typing import Optional
 
 from fastapi import APIRouter, Depends
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.responses import ORJSONResponse
 from src.database import get_async_db
-from src.utils.config import get_settings
+from src.utils.config import Settings, get_settings
 
 router = APIRouter()
-settings = get_settings()
+
+# Probe timestamps are re-formatted at most once per second
+_TIMESTAMP_TTL = 1.0
+_timestamp_expires = 0.0
+_timestamp_iso = ""
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO string, cached for ``_TIMESTAMP_TTL`` seconds."""
+    global _timestamp_expires, _timestamp_iso
+    now = time.monotonic()
+    if now >= _timestamp_expires:
+        _timestamp_iso = datetime.utcnow().isoformat()
+        _timestamp_expires = now + _TIMESTAMP_TTL
+    return _timestamp_iso
+
+
+# Database probes hit the database at most once per second
+_HEALTH_STMT = text("SELECT 1")
+_DB_CHECK_TTL = 1.0
+_db_check_expires = 0.0
+_db_check_error: Optional[str] = None
+# Created on first use: on Python 3.9 a lock binds to the loop current at
+# construction, which at import time is not the server's loop
+_db_check_lock: Optional[asyncio.Lock] = None
+
+
+async def _check_database(db: AsyncSession) -> Optional[str]:
+    """
+    Run ``SELECT 1``, reusing the outcome for ``_DB_CHECK_TTL`` seconds.
+
+    Concurrent probes wait on a lock, so a burst of requests issues one query.
+
+    Args:
+        db: Database session
+
+    Returns:
+        None if the database answered, otherwise the error message
+    """
+    global _db_check_expires, _db_check_error, _db_check_lock
+    if _db_check_lock is None:
+        _db_check_lock = asyncio.Lock()
+    async with _db_check_lock:
+        if time.monotonic() < _db_check_expires:
+            return _db_check_error
+        try:
+            await db.scalar(_HEALTH_STMT)
+            _db_check_error = None
+        except Exception as e:
+            _db_check_error = str(e)
+        _db_check_expires = time.monotonic() + _DB_CHECK_TTL
+        return _db_check_error
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(settings: Settings = Depends(get_settings)):
     """Basic health check."""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": "0.3.0",
-        "environment": settings.ENVIRONMENT,
-    }
+    return ORJSONResponse(
+        {
+            "status": "healthy",
+            "timestamp": _utc_timestamp(),
+            "version": "0.3.0",
+            "environment": settings.ENVIRONMENT,
+        }
+    )
 
 
 @router.get("/health/db")
 async def database_health(db: AsyncSession = Depends(get_async_db)):
     """Database health check."""
-    try:
-        await db.execute("SELECT 1")
-        return {"status": "healthy", "database": "connected"}
-    except Exception as e:
-        return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
+    error = await _check_database(db)
+    if error is None:
+        return ORJSONResponse({"status": "healthy", "database": "connected"})
+    return ORJSONResponse({"status": "unhealthy", "database": "disconnected", "error": error})
 
 
 @router.get("/health/ready")
 async def readiness_check(db: AsyncSession = Depends(get_async_db)):
     """Readiness probe for Kubernetes."""
-    try:
-        await db.execute("SELECT 1")
-        return {
+    error = await _check_database(db)
+    if error is not None:
+        return ORJSONResponse({"status": "not_ready", "error": error})
+    return ORJSONResponse(
+        {
             "status": "ready",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "checks": {"database": "ok", "redis": "ok"},
         }
-    except Exception as e:
-        return {"status": "not_ready", "error": str(e)}
+    )
 
 
 @router.get("/health/live")
 async def liveness_check():
     """Liveness probe for Kubernetes."""
-    return {"status": "alive", "timestamp": datetime.utcnow().isoformat()}
+    return ORJSONResponse({"status": "alive", "timestamp": _utc_timestamp()})
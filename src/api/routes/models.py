@@ -1,18 +1,32 @@
 """Trained model management routes."""
 
 from typing import List
-from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import bindparam, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from src.api.schemas import TrainedModel, TrainedModelCreate, TrainedModelUpdate, User
+from src.api.responses import orm_response, trusted_response
+from src.api.schemas import TrainedModel, TrainedModelCreate, TrainedModelUpdate, User, UUIDStr
 from src.auth.security import get_current_active_user
 from src.database import get_async_db, models
 
 router = APIRouter()
 
+# Statements are built once; per-request values are passed as bound parameters
+_LIST_MODELS = (
+    select(models.TrainedModel)
+    .where(models.TrainedModel.user_id == bindparam("user_id"))
+    .order_by(models.TrainedModel.created_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_GET_MODEL = select(models.TrainedModel).where(
+    models.TrainedModel.id == bindparam("model_id"),
+    models.TrainedModel.user_id == bindparam("user_id"),
+)
+
 
 @router.get("/", response_model=List[TrainedModel])
 async def list_models(
@@ -23,14 +37,10 @@ async def list_models(
 ):
     """List user's trained models."""
     result = await db.execute(
-        select(models.TrainedModel)
-        .where(models.TrainedModel.user_id == current_user.id)
-        .offset(skip)
-        .limit(limit)
-        .order_by(models.TrainedModel.created_at.desc())
+        _LIST_MODELS, {"user_id": current_user.id, "skip": skip, "limit": limit}
     )
     models_list = result.scalars().all()
-    return models_list
+    return trusted_response(TrainedModel, models_list, many=True)
 
 
 @router.post("/", response_model=TrainedModel, status_code=status.HTTP_201_CREATED)
@@ -40,72 +50,70 @@ async def create_model(
     current_user: User = Depends(get_current_active_user),
 ):
     """Create a new trained model entry."""
-    db_model = models.TrainedModel(user_id=current_user.id, **model.model_dump())
-    db.add(db_model)
+    values = model.model_dump()
+    # ``metadata`` is stored in the ``meta_data`` column
+    values["meta_data"] = values.pop("metadata")
+
+    # INSERT ... RETURNING fetches the stored row in the same round-trip
+    db_model = await db.scalar(
+        insert(models.TrainedModel)
+        .values(user_id=current_user.id, **values)
+        .returning(models.TrainedModel)
+    )
     await db.commit()
-    await db.refresh(db_model)
-    return db_model
+    return orm_response(TrainedModel, db_model, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/{model_id}", response_model=TrainedModel)
 async def get_model(
-    model_id: UUID,
+    model_id: UUIDStr,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Get model by ID."""
-    result = await db.execute(
-        select(models.TrainedModel).where(
-            models.TrainedModel.id == model_id,
-            models.TrainedModel.user_id == current_user.id,
-        )
-    )
+    result = await db.execute(_GET_MODEL, {"model_id": model_id, "user_id": current_user.id})
     model = result.scalar_one_or_none()
     if not model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Model not found")
-    return model
+    return trusted_response(TrainedModel, model)
 
 
 @router.patch("/{model_id}", response_model=TrainedModel)
 async def update_model(
-    model_id: UUID,
+    model_id: UUIDStr,
     model_update: TrainedModelUpdate,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Update model."""
-    result = await db.execute(
-        select(models.TrainedModel).where(
-            models.TrainedModel.id == model_id,
-            models.TrainedModel.user_id == current_user.id,
+    update_data = model_update.model_dump(exclude_unset=True)
+    if update_data:
+        # UPDATE ... RETURNING fetches the updated row in the same round-trip
+        model = await db.scalar(
+            update(models.TrainedModel)
+            .where(
+                models.TrainedModel.id == model_id, models.TrainedModel.user_id == current_user.id
+            )
+            .values(**update_data)
+            .returning(models.TrainedModel)
         )
-    )
-    model = result.scalar_one_or_none()
+    else:
+        model = await db.scalar(_GET_MODEL, {"model_id": model_id, "user_id": current_user.id})
     if not model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Model not found")
 
-    update_data = model_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(model, field, value)
-
     await db.commit()
-    await db.refresh(model)
-    return model
+    return orm_response(TrainedModel, model)
 
 
 @router.delete("/{model_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_model(
-    model_id: UUID,
+    model_id: UUIDStr,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Delete model."""
-    result = await db.execute(
-        select(models.TrainedModel).where(
-            models.TrainedModel.id == model_id,
-            models.TrainedModel.user_id == current_user.id,
-        )
-    )
+    result = await db.execute(_GET_MODEL, {"model_id": model_id, "user_id": current_user.id})
     model = result.scalar_one_or_none()
     if not model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Model not found")
@@ -1,10 +1,22 @@
 """Pydantic schemas for API request/response validation."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, EmailStr, Field, StringConstraints
+
+# IDs in paths are checked against this pattern by pydantic-core and passed to
+# the database as strings, without building a ``uuid.UUID`` per request
+UUID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+UUIDStr = Annotated[str, StringConstraints(pattern=UUID_PATTERN)]
+
+
+class FastSchema(BaseModel):
+    """Response schema read from ORM rows; responses leave out fields that are None."""
+
+    model_config = ConfigDict(from_attributes=True)
+
 
 # ============================================
 # User Schemas
@@ -93,7 +105,10 @@ class Dataset(DatasetBase):
     end_date: Optional[datetime]
     num_samples: Optional[int]
     file_path: Optional[str]
-    metadata: Optional[Dict[str, Any]]
+    # Stored in the ``meta_data`` column
+    metadata: Optional[Dict[str, Any]] = Field(
+        validation_alias=AliasChoices("meta_data", "metadata")
+    )
     created_at: datetime
     updated_at: Optional[datetime]
 
@@ -124,9 +139,7 @@ class ExperimentUpdate(BaseModel):
     metrics: Optional[Dict[str, Any]] = None
 
 
-class Experiment(ExperimentBase):
-    model_config = ConfigDict(from_attributes=True)
-
+class Experiment(ExperimentBase, FastSchema):
     id: UUID
     user_id: UUID
     dataset_id: Optional[UUID]
@@ -173,9 +186,7 @@ class TrainedModelUpdate(BaseModel):
     is_deployed: Optional[bool] = None
 
 
-class TrainedModel(TrainedModelBase):
-    model_config = ConfigDict(from_attributes=True)
-
+class TrainedModel(TrainedModelBase, FastSchema):
     id: UUID
     user_id: UUID
     experiment_id: Optional[UUID]
@@ -185,7 +196,10 @@ class TrainedModel(TrainedModelBase):
     trained_on_dataset: Optional[str]
     training_duration: Optional[float]
     total_parameters: Optional[int]
-    metadata: Optional[Dict[str, Any]]
+    # Stored in the ``meta_data`` column
+    metadata: Optional[Dict[str, Any]] = Field(
+        validation_alias=AliasChoices("meta_data", "metadata")
+    )
     is_deployed: bool
     deployed_at: Optional[datetime]
     created_at: datetime
@@ -214,9 +228,7 @@ class EvaluationUpdate(BaseModel):
     metrics: Optional[Dict[str, Any]] = None
 
 
-class Evaluation(EvaluationBase):
-    model_config = ConfigDict(from_attributes=True)
-
+class Evaluation(EvaluationBase, FastSchema):
     id: UUID
     experiment_id: UUID
     test_start_date: Optional[datetime]
@@ -289,3 +301,10 @@ class PaginatedResponse(BaseModel):
     page: int
     page_size: int
     items: List[Any]
+
+
+class DatasetPage(BaseModel):
+    """Keyset-paginated datasets; pass ``next_cursor`` as ``after`` for the next page."""
+
+    items: List[Dataset]
+    next_cursor: Optional[str] = None
@@ -4,16 +4,35 @@ import asyncio
 import logging
 from typing import Any, Dict
 
+import orjson
 import socketio
 
 logger = logging.getLogger(__name__)
 
-# Create Socket.IO server
+
+class _OrjsonCodec:
+    """``json`` module stand-in so Socket.IO packets are encoded with orjson."""
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs) -> str:
+        # Separator and similar options are ignored: orjson output is always compact
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+    @staticmethod
+    def loads(s: Any, **kwargs) -> Any:
+        return orjson.loads(s)
+
+
+# Create Socket.IO server. Room emits encode the packet once and write the same
+# bytes to every member, so each broadcast costs a single orjson encode.
 sio = socketio.AsyncServer(
     async_mode="asgi",
     cors_allowed_origins="*",  # Configure properly in production
     logger=True,
     engineio_logger=False,
+    json=_OrjsonCodec,
 )
 
 # Wrap with ASGI app
@@ -23,12 +42,17 @@ socket_app = socketio.ASGIApp(sio)
 active_connections: Dict[str, Any] = {}
 
 
+def _room(stream_type: str, identifier: str) -> str:
+    """Socket.IO room holding the subscribers of one data stream."""
+    return f"{stream_type}:{identifier}"
+
+
 @sio.event
 async def connect(sid, environ):
     """Handle client connection."""
     logger.info(f"🔌 WebSocket client connected: {sid}")
     active_connections[sid] = {
-        "connected_at": asyncio.get_event_loop().time(),
+        "connected_at": asyncio.get_running_loop().time(),
         "subscriptions": [],
     }
     await sio.emit("connection_established", {"sid": sid, "status": "connected"}, room=sid)
@@ -38,8 +62,8 @@ async def connect(sid, environ):
 async def disconnect(sid):
     """Handle client disconnection."""
     logger.info(f"❌ WebSocket client disconnected: {sid}")
-    if sid in active_connections:
-        del active_connections[sid]
+    # Socket.IO removes the sid from its rooms on disconnect
+    active_connections.pop(sid, None)
 
 
 @sio.event
@@ -65,6 +89,7 @@ async def subscribe(sid, data):
         }
         if subscription not in active_connections[sid]["subscriptions"]:
             active_connections[sid]["subscriptions"].append(subscription)
+        await sio.enter_room(sid, _room(stream_type, identifier))
 
     await sio.emit(
         "subscribed",
@@ -92,6 +117,7 @@ async def unsubscribe(sid, data):
             for sub in active_connections[sid]["subscriptions"]
             if not (sub["type"] == stream_type and sub["id"] == identifier)
         ]
+        await sio.leave_room(sid, _room(stream_type, identifier))
 
     await sio.emit(
         "unsubscribed",
@@ -108,7 +134,7 @@ async def unsubscribe(sid, data):
 @sio.event
 async def ping(sid):
     """Handle ping requests."""
-    await sio.emit("pong", {"timestamp": asyncio.get_event_loop().time()}, room=sid)
+    await sio.emit("pong", {"timestamp": asyncio.get_running_loop().time()}, room=sid)
 
 
 # Broadcast functions for use throughout the application
@@ -122,18 +148,12 @@ async def broadcast_training_progress(job_id: str, progress: Dict[str, Any]):
         job_id: Training job identifier
         progress: Progress data including metrics, episode number, etc.
     """
-    for sid, conn_data in active_connections.items():
-        for sub in conn_data["subscriptions"]:
-            if sub["type"] == "training_progress" and sub["id"] == job_id:
-                await sio.emit(
-                    "training_progress",
-                    {
-                        "job_id": job_id,
-                        "progress": progress,
-                        "timestamp": asyncio.get_event_loop().time(),
-                    },
-                    room=sid,
-                )
+    payload = {
+        "job_id": job_id,
+        "progress": progress,
+        "timestamp": asyncio.get_running_loop().time(),
+    }
+    await sio.emit("training_progress", payload, room=_room("training_progress", job_id))
 
 
 async def broadcast_market_data(symbol: str, data: Dict[str, Any]):
@@ -144,14 +164,8 @@ async def broadcast_market_data(symbol: str, data: Dict[str, Any]):
         symbol: Stock/option symbol
         data: Market data (price, volume, Greeks, etc.)
     """
-    for sid, conn_data in active_connections.items():
-        for sub in conn_data["subscriptions"]:
-            if sub["type"] == "market_data" and sub["id"] == symbol:
-                await sio.emit(
-                    "market_data",
-                    {"symbol": symbol, "data": data, "timestamp": asyncio.get_event_loop().time()},
-                    room=sid,
-                )
+    payload = {"symbol": symbol, "data": data, "timestamp": asyncio.get_running_loop().time()}
+    await sio.emit("market_data", payload, room=_room("market_data", symbol))
 
 
 async def broadcast_risk_metrics(portfolio_id: str, metrics: Dict[str, Any]):
@@ -162,18 +176,12 @@ async def broadcast_risk_metrics(portfolio_id: str, metrics: Dict[str, Any]):
         portfolio_id: Portfolio identifier
         metrics: Risk metrics (VaR, CVaR, Greeks, etc.)
     """
-    for sid, conn_data in active_connections.items():
-        for sub in conn_data["subscriptions"]:
-            if sub["type"] == "risk_metrics" and sub["id"] == portfolio_id:
-                await sio.emit(
-                    "risk_metrics",
-                    {
-                        "portfolio_id": portfolio_id,
-                        "metrics": metrics,
-                        "timestamp": asyncio.get_event_loop().time(),
-                    },
-                    room=sid,
-                )
+    payload = {
+        "portfolio_id": portfolio_id,
+        "metrics": metrics,
+        "timestamp": asyncio.get_running_loop().time(),
+    }
+    await sio.emit("risk_metrics", payload, room=_room("risk_metrics", portfolio_id))
 
 
 async def broadcast_hedging_signals(strategy_id: str, signals: Dict[str, Any]):
@@ -184,18 +192,12 @@ async def broadcast_hedging_signals(strategy_id: str, signals: Dict[str, Any]):
         strategy_id: Strategy identifier
         signals: Hedging signals (action, hedge_ratio, etc.)
     """
-    for sid, conn_data in active_connections.items():
-        for sub in conn_data["subscriptions"]:
-            if sub["type"] == "hedging_signals" and sub["id"] == strategy_id:
-                await sio.emit(
-                    "hedging_signals",
-                    {
-                        "strategy_id": strategy_id,
-                        "signals": signals,
-                        "timestamp": asyncio.get_event_loop().time(),
-                    },
-                    room=sid,
-                )
+    payload = {
+        "strategy_id": strategy_id,
+        "signals": signals,
+        "timestamp": asyncio.get_running_loop().time(),
+    }
+    await sio.emit("hedging_signals", payload, room=_room("hedging_signals", strategy_id))
 
 
 async def broadcast_to_all(event: str, data: Dict[str, Any]):
@@ -0,0 +1,87 @@
+"""Process pool for CPU-bound work offloaded from API request handlers."""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+import numpy as np
+
+from src.utils.config import get_settings
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # pragma: no cover - threadpoolctl ships with scikit-learn
+    threadpool_limits = None
+
+T = TypeVar("T")
+
+# Shared by all routes and managed by the app lifespan
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _server_workers() -> int:
+    """Number of uvicorn worker processes sharing this machine."""
+    return max(1, int(os.environ.get("WEB_CONCURRENCY", get_settings().WORKERS)))
+
+
+def _init_worker(blas_threads: int) -> None:
+    """
+    Limit BLAS threads in a pool worker and warm up its thread pool.
+
+    Args:
+        blas_threads: Maximum BLAS threads per worker process
+    """
+    if threadpool_limits is not None:
+        threadpool_limits(limits=blas_threads, user_api="blas")
+
+    # Pay BLAS initialization here rather than in the first request
+    np.linalg.svd(np.ones((256, 256)), compute_uv=False)
+
+
+def start_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Start the process pool used to run CPU-bound work off the event loop.
+
+    The machine's cores are split between the uvicorn workers, and each pool
+    worker is limited to a single BLAS thread so concurrent requests do not
+    oversubscribe the CPU.
+
+    Args:
+        max_workers: Number of worker processes (defaults to this server
+            worker's share of the CPU count)
+
+    Returns:
+        The running process pool
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=max_workers or max(1, (os.cpu_count() or 1) // _server_workers()),
+            initializer=_init_worker,
+            initargs=(1,),
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the process pool, cancelling queued work."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=True, cancel_futures=True)
+        _process_pool = None
+
+
+async def run_in_process(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a picklable top-level function in the process pool.
+
+    Args:
+        func: Function to call in a worker process
+        *args: Positional arguments for ``func``
+
+    Returns:
+        The function's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(start_process_pool(), func, *args)
@@ -0,0 +1,381 @@
+"""
+Numba-compiled hedge kernels for the analytic baselines.
+
+These mirror ``DeltaHedging`` and ``DeltaGammaHedging`` as scalar functions so
+the evaluation loop can compute a target position without building strategy
+objects or Greek dictionaries, and ``hedge_episode`` runs a whole backtest
+episode of the analytic strategies in one call. ``sabr_vol`` and
+``sabr_implied_vol`` price a SABR quote or smile for ``advanced_models``. Numba is optional;
+without it the kernels run as plain Python with identical results.
+"""
+
+import math
+
+import numpy as np
+
+from src._numba import NUMBA_AVAILABLE, njit
+from src.pricing.black_scholes import INV_SQRT_2PI
+
+
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+
+
+@njit(cache=True, inline="always")
+def _norm_cdf(x):
+    return 0.5 * (1.0 + math.erf(x * _INV_SQRT_2))
+
+
+@njit(cache=True)
+def _d1(S, K, tau, r, sigma):
+    return (math.log(S / K) + (r + 0.5 * sigma * sigma) * tau) / (sigma * math.sqrt(tau))
+
+
+@njit(cache=True)
+def delta_hedge_action(S, K, tau, r, sigma, is_call):
+    """Target stock position of ``DeltaHedging`` for a short option."""
+    if tau <= 0.0:
+        return 0.0
+
+    d1 = _d1(S, K, tau, r, sigma)
+    if is_call:
+        return _norm_cdf(d1)
+    return -_norm_cdf(-d1)
+
+
+@njit(cache=True)
+def delta_gamma_hedge_action(S, S0, K, tau, r, sigma, is_call):
+    """Target stock position of ``DeltaGammaHedging`` for a short option."""
+    if tau <= 0.0:
+        return 0.0
+
+    d1 = _d1(S, K, tau, r, sigma)
+    delta = _norm_cdf(d1) if is_call else -_norm_cdf(-d1)
+    gamma = math.exp(-0.5 * d1 * d1) * INV_SQRT_2PI / (S * sigma * math.sqrt(tau))
+
+    return delta + gamma * (S - S0) * 0.5
+
+
+# Strategy codes understood by ``hedge_episode``
+DELTA = 0
+DELTA_GAMMA = 1
+DELTA_GAMMA_VEGA = 2
+
+
+@njit(cache=True)
+def _option_price(S, K, tau, r, sigma, is_call):
+    if tau <= 0.0:
+        return max(S - K, 0.0) if is_call else max(K - S, 0.0)
+
+    d1 = _d1(S, K, tau, r, sigma)
+    d2 = d1 - sigma * math.sqrt(tau)
+    discount = K * math.exp(-r * tau)
+    if is_call:
+        return S * _norm_cdf(d1) - discount * _norm_cdf(d2)
+    return discount * _norm_cdf(-d2) - S * _norm_cdf(-d1)
+
+
+@njit(cache=True)
+def _target_position(strategy, S, S0, K, tau, r, sigma, is_call, gamma_weight, vega_weight):
+    if tau <= 0.0:
+        return 0.0
+
+    d1 = _d1(S, K, tau, r, sigma)
+    delta = _norm_cdf(d1) if is_call else -_norm_cdf(-d1)
+    if strategy == DELTA:
+        return delta
+
+    pdf_d1 = math.exp(-0.5 * d1 * d1) * INV_SQRT_2PI
+    gamma = pdf_d1 / (S * sigma * math.sqrt(tau))
+    if strategy == DELTA_GAMMA:
+        return delta + gamma * (S - S0) * 0.5
+
+    vega = S * pdf_d1 * math.sqrt(tau) / 100
+    return delta + gamma_weight * gamma * (S - S0) + vega_weight * vega * (sigma - 0.2)
+
+
+@njit(cache=True)
+def hedge_episode(
+    prices,
+    strategy,
+    S0,
+    K,
+    T,
+    r,
+    sigma,
+    dt,
+    is_call,
+    tc_rate,
+    gamma_weight,
+    vega_weight,
+    positions,
+    pnl,
+):
+    """
+    Hedge a short option along a price path with an analytic baseline.
+
+    Mirrors ``BaseHedgingStrategy.run_episode`` for the delta, delta-gamma and
+    delta-gamma-vega strategies: initial hedge at ``S0``, a rebalance at every
+    later step, and a final valuation at maturity.
+
+    Args:
+        prices: Price path of length ``n_steps + 1``
+        strategy: One of ``DELTA``, ``DELTA_GAMMA``, ``DELTA_GAMMA_VEGA``
+        S0: Initial stock price
+        K: Strike price
+        T: Time to maturity
+        r: Risk-free rate
+        sigma: Volatility
+        dt: Step length
+        is_call: Whether the option is a call
+        tc_rate: Transaction cost as fraction of traded notional
+        gamma_weight: Gamma adjustment weight (delta-gamma-vega only)
+        vega_weight: Vega adjustment weight (delta-gamma-vega only)
+        positions: Buffer of length ``n_steps`` receiving the stock position
+        pnl: Buffer of length ``n_steps`` receiving the PnL at each step
+
+    Returns:
+        Tuple of (initial_premium, final_pnl, cash, stock_position, total_costs)
+    """
+    n_steps = prices.shape[0] - 1
+
+    # Sell the option and put on the initial hedge; like ``initialize`` the
+    # opening trade is charged on its absolute notional
+    premium = _option_price(S0, K, T, r, sigma, is_call)
+    position = _target_position(
+        strategy, S0, S0, K, T, r, sigma, is_call, gamma_weight, vega_weight
+    )
+    total_costs = abs(position) * S0 * tc_rate
+    cash = premium - abs(position) * S0 - total_costs
+
+    for step in range(n_steps):
+        S = prices[step]
+        tau = T - step * dt
+
+        if step > 0:
+            target = _target_position(
+                strategy, S, S0, K, tau, r, sigma, is_call, gamma_weight, vega_weight
+            )
+            trade = target - position
+            cost = abs(trade) * S * tc_rate
+            cash -= trade * S + cost
+            position = target
+            total_costs += cost
+
+        option_value = _option_price(S, K, tau, r, sigma, is_call)
+        positions[step] = position
+        pnl[step] = cash + position * S - option_value - premium
+
+    S_final = prices[n_steps]
+    final_pnl = cash + position * S_final - _option_price(S_final, K, 0.0, r, sigma, is_call)
+
+    return premium, final_pnl - premium, cash, position, total_costs
+
+
+# Fast-math flags minus "nnan"/"ninf": calibration relies on NaN results to
+# penalise parameters the Hagan expansion cannot price
+_SABR_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(cache=True, fastmath=_SABR_FASTMATH)
+def sabr_vol(alpha, beta, rho, nu, f, k, tau):
+    """
+    Hagan's SABR implied volatility for a single quote.
+
+    Mirrors ``SABRHedging.implied_volatility``, including the ATM limit.
+
+    Args:
+        alpha: Initial volatility
+        beta: CEV exponent
+        rho: Correlation between asset and volatility
+        nu: Volatility of volatility
+        f: Forward price
+        k: Strike price
+        tau: Time to maturity
+
+    Returns:
+        Implied volatility
+    """
+    one_beta = 1.0 - beta
+    if abs(f - k) < 1e-10:
+        return alpha / f**one_beta
+
+    log_fk = math.log(f / k)
+    fk_mid = (f * k) ** (0.5 * one_beta)
+    z = (nu / alpha) * fk_mid * log_fk
+    x_z = math.log((math.sqrt(1.0 - 2.0 * rho * z + z * z) + z - rho) / (1.0 - rho))
+
+    log_fk2 = log_fk * log_fk
+    denominator = fk_mid * (
+        1.0 + (one_beta**2 / 24.0) * log_fk2 + (one_beta**4 / 1920.0) * log_fk2 * log_fk2
+    )
+    correction = (
+        1.0
+        + (
+            (one_beta**2 / 24.0) * (alpha * alpha / (fk_mid * fk_mid))
+            + (rho * beta * nu * alpha) / (4.0 * fk_mid)
+            + ((2.0 - 3.0 * rho * rho) / 24.0) * nu * nu
+        )
+        * tau
+    )
+
+    return (alpha / denominator) * (z / x_z) * correction
+
+
+@njit(cache=True, fastmath=_SABR_FASTMATH)
+def sabr_implied_vol(alpha, beta, rho, nu, F, K, T, out):
+    """
+    Hagan's SABR implied volatility for a vector of quotes.
+
+    Applies ``sabr_vol`` element-wise and writes the result into ``out`` in
+    place. The loop is serial: smiles are tens of quotes, too few to pay for
+    starting a parallel region on every call.
+
+    Args:
+        alpha: Initial volatility
+        beta: CEV exponent
+        rho: Correlation between asset and volatility
+        nu: Volatility of volatility
+        F: Forward prices, float64 array
+        K: Strike prices, float64 array of the same length
+        T: Times to maturity, float64 array of the same length
+        out: Float64 buffer of the same length receiving the volatilities
+
+    Returns:
+        ``out``
+    """
+    for i in range(F.shape[0]):
+        out[i] = sabr_vol(alpha, beta, rho, nu, F[i], K[i], T[i])
+
+    return out
+
+
+@njit(cache=True, fastmath=_SABR_FASTMATH)
+def sabr_implied_vol_grad(alpha, beta, rho, nu, F, K, T, out, grad):
+    """
+    SABR implied volatility and its analytic parameter gradient.
+
+    Same volatilities as ``sabr_implied_vol``; additionally writes the partial
+    derivatives of each volatility with respect to (alpha, beta, rho, nu),
+    obtained by differentiating Hagan's expansion in closed form.
+
+    Args:
+        alpha: Initial volatility
+        beta: CEV exponent
+        rho: Correlation between asset and volatility
+        nu: Volatility of volatility
+        F: Forward prices, float64 array
+        K: Strike prices, float64 array of the same length
+        T: Times to maturity, float64 array of the same length
+        out: Float64 buffer of the same length receiving the volatilities
+        grad: Float64 buffer of shape (len(F), 4) receiving the gradients
+
+    Returns:
+        ``out``
+    """
+    one_beta = 1.0 - beta
+    for i in range(F.shape[0]):
+        f = F[i]
+        k = K[i]
+        if abs(f - k) < 1e-10:
+            sigma = alpha / f**one_beta
+            out[i] = sigma
+            grad[i, 0] = sigma / alpha
+            grad[i, 1] = sigma * math.log(f)
+            grad[i, 2] = 0.0
+            grad[i, 3] = 0.0
+            continue
+
+        log_fk = math.log(f / k)
+        log_p = math.log(f * k)
+        fk_mid = (f * k) ** (0.5 * one_beta)
+        z = (nu / alpha) * fk_mid * log_fk
+        root = math.sqrt(1.0 - 2.0 * rho * z + z * z)
+        shifted = root + z - rho
+        x_z = math.log(shifted / (1.0 - rho))
+        ratio = z / x_z
+
+        log_fk2 = log_fk * log_fk
+        series = 1.0 + (one_beta**2 / 24.0) * log_fk2 + (one_beta**4 / 1920.0) * log_fk2 * log_fk2
+        c1 = (one_beta**2 / 24.0) * (alpha * alpha / (fk_mid * fk_mid))
+        c2 = (rho * beta * nu * alpha) / (4.0 * fk_mid)
+        c3 = ((2.0 - 3.0 * rho * rho) / 24.0) * nu * nu
+        tau = T[i]
+        correction = 1.0 + (c1 + c2 + c3) * tau
+        prefactor = alpha / (fk_mid * series)
+        sigma = prefactor * ratio * correction
+        out[i] = sigma
+
+        # d(z / x) / dz, using dx/dz = 1 / root
+        dratio_dz = (x_z - z / root) / (x_z * x_z)
+        # dz/dbeta / z and d(fk_mid)/dbeta / fk_mid
+        dlog_mid_dbeta = -0.5 * log_p
+        dseries_dbeta = -(one_beta / 12.0) * log_fk2 - (one_beta**3 / 480.0) * log_fk2 * log_fk2
+
+        # alpha
+        dprefactor = prefactor / alpha
+        dratio = dratio_dz * (-z / alpha)
+        dcorrection = (2.0 * c1 + c2) / alpha * tau
+        grad[i, 0] = (
+            dprefactor * ratio * correction
+            + prefactor * dratio * correction
+            + prefactor * ratio * dcorrection
+        )
+
+        # beta
+        dprefactor = prefactor * (-dlog_mid_dbeta - dseries_dbeta / series)
+        dratio = dratio_dz * z * dlog_mid_dbeta
+        dc1 = -(one_beta / 12.0) * alpha * alpha / (fk_mid * fk_mid) - 2.0 * c1 * dlog_mid_dbeta
+        dc2 = rho * nu * alpha / (4.0 * fk_mid) - c2 * dlog_mid_dbeta
+        dcorrection = (dc1 + dc2) * tau
+        grad[i, 1] = (
+            dprefactor * ratio * correction
+            + prefactor * dratio * correction
+            + prefactor * ratio * dcorrection
+        )
+
+        # rho: only x(z) and the correction depend on it
+        dx_drho = (-z / root - 1.0) / shifted + 1.0 / (1.0 - rho)
+        dratio = -z * dx_drho / (x_z * x_z)
+        dcorrection = (beta * nu * alpha / (4.0 * fk_mid) - 0.25 * rho * nu * nu) * tau
+        grad[i, 2] = prefactor * dratio * correction + prefactor * ratio * dcorrection
+
+        # nu
+        dratio = dratio_dz * z / nu
+        dcorrection = (c2 + 2.0 * c3) / nu * tau
+        grad[i, 3] = prefactor * dratio * correction + prefactor * ratio * dcorrection
+
+    return out
+
+
+def _warm_up():
+    """Compile (or load from cache) the kernels before the first backtest."""
+    prices = np.linspace(100.0, 101.0, 9)
+    buffer = np.empty(8)
+    for strategy in (DELTA, DELTA_GAMMA, DELTA_GAMMA_VEGA):
+        hedge_episode(
+            prices,
+            strategy,
+            100.0,
+            100.0,
+            1.0,
+            0.05,
+            0.2,
+            0.125,
+            True,
+            0.001,
+            0.5,
+            0.01,
+            buffer,
+            buffer,
+        )
+    quotes = np.linspace(90.0, 110.0, 8)
+    forwards = np.full(8, 100.0)
+    sabr_vol(0.3, 0.5, -0.3, 0.4, 100.0, 105.0, 1.0)
+    sabr_implied_vol(0.3, 0.5, -0.3, 0.4, forwards, quotes, np.ones(8), buffer)
+    sabr_implied_vol_grad(
+        0.3, 0.5, -0.3, 0.4, forwards, quotes, np.ones(8), buffer, np.empty((8, 4))
+    )
+
+
+if NUMBA_AVAILABLE:
+    _warm_up()
@@ -11,12 +11,23 @@ References:
 import logging
 
 import numpy as np
-from scipy.interpolate import interp2d
+from scipy.interpolate import RegularGridInterpolator, griddata
 from scipy.optimize import minimize
-from scipy.stats import norm
+from scipy.special import ndtr
+
+from src.baselines._numba_kernels import sabr_implied_vol, sabr_implied_vol_grad, sabr_vol
+from src.pricing.black_scholes import norm_pdf
 
 logger = logging.getLogger(__name__)
 
+# Inputs taking the scalar SABR path (np.float64 subclasses float)
+_SCALARS = (int, float)
+
+
+def _d1(S, K, T, r, sigma):
+    """Black-Scholes d1; element-wise over broadcastable arrays."""
+    return (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+
 
 class SABRHedging:
     """
@@ -48,57 +59,44 @@ class SABRHedging:
         """
         Calculate SABR implied volatility
 
+        Accepts scalars or arrays (broadcast together), so a whole surface is
+        evaluated in one pass.
+
         Args:
-            F: Forward price
-            K: Strike price
-            T: Time to maturity
+            F: Forward price(s)
+            K: Strike price(s)
+            T: Time(s) to maturity
 
         Returns:
-            Implied volatility
+            Implied volatility, with the broadcast shape of the inputs
         """
-        if abs(F - K) < 1e-10:
-            # ATM approximation
-            sigma_atm = self.alpha / (F ** (1 - self.beta))
-            return sigma_atm
-
-        # Log-moneyness
-        log_FK = np.log(F / K)
-
-        # Intermediate calculations
-        FK_mid = (F * K) ** ((1 - self.beta) / 2)
-        eps = self.nu / self.alpha * FK_mid * log_FK
-
-        # z calculation
-        z = (self.nu / self.alpha) * FK_mid * log_FK
-
-        # x(z) calculation
-        x_z = np.log((np.sqrt(1 - 2 * self.rho * z + z**2) + z - self.rho) / (1 - self.rho))
+        # Hedging asks for one quote per step; skip the array round trip
+        if isinstance(F, _SCALARS) and isinstance(K, _SCALARS) and isinstance(T, _SCALARS):
+            return np.float64(
+                sabr_vol(self.alpha, self.beta, self.rho, self.nu, float(F), float(K), float(T))
+            )
 
-        # SABR formula
-        numerator = self.alpha
-        denominator = FK_mid * (
-            1 + ((1 - self.beta) ** 2 / 24) * log_FK**2 + ((1 - self.beta) ** 4 / 1920) * log_FK**4
+        F, K, T = np.broadcast_arrays(
+            np.asarray(F, dtype=np.float64),
+            np.asarray(K, dtype=np.float64),
+            np.asarray(T, dtype=np.float64),
         )
+        shape = F.shape
+        F, K, T = (np.array(x).ravel() for x in (F, K, T))
 
-        # Time-dependent correction
-        correction = (
-            1
-            + (
-                ((1 - self.beta) ** 2 / 24) * (self.alpha**2 / FK_mid**2)
-                + (self.rho * self.beta * self.nu * self.alpha) / (4 * FK_mid)
-                + ((2 - 3 * self.rho**2) / 24) * self.nu**2
-            )
-            * T
+        sigma = sabr_implied_vol(
+            self.alpha, self.beta, self.rho, self.nu, F, K, T, np.empty(F.shape[0])
         )
 
-        sigma = (numerator / denominator) * (z / x_z) * correction
-
-        return sigma
+        return sigma.reshape(shape)[()]
 
     def delta(self, S, K, T, r, sigma=None):
         """
         Calculate SABR delta
 
+        All inputs may be arrays (broadcast together) to price a book of
+        options in one call.
+
         Args:
             S: Current stock price
             K: Strike price
@@ -110,35 +108,32 @@ class SABRHedging:
             Delta hedge ratio
         """
         if sigma is None:
-            F = S * np.exp(r * T)
-            sigma = self.implied_volatility(F, K, T)
+            sigma = self.implied_volatility(S * np.exp(r * T), K, T)
 
         # Black-Scholes delta with SABR vol
-        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        delta = norm.cdf(d1)
-
-        return delta
+        return ndtr(_d1(S, K, T, r, sigma))
 
     def vega(self, S, K, T, r, sigma=None):
-        """Calculate SABR vega"""
+        """Calculate SABR vega; inputs may be arrays as in ``delta``"""
         if sigma is None:
-            F = S * np.exp(r * T)
-            sigma = self.implied_volatility(F, K, T)
-
-        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        vega = S * norm.pdf(d1) * np.sqrt(T)
+            sigma = self.implied_volatility(S * np.exp(r * T), K, T)
 
-        return vega
+        return S * norm_pdf(_d1(S, K, T, r, sigma)) * np.sqrt(T)
 
     def compute_hedge(self, S, K, T, r, sigma=None):
         """
         Compute complete SABR hedge
 
+        Inputs may be arrays as in ``delta``; the smile and d1 are evaluated
+        once and shared by delta and vega.
+
         Returns:
             dict with delta, vega, and hedge ratio
         """
-        delta = self.delta(S, K, T, r, sigma)
-        vega = self.vega(S, K, T, r, sigma)
+        hedge_vol = sigma if sigma is not None else self.implied_volatility(S * np.exp(r * T), K, T)
+        d1 = _d1(S, K, T, r, hedge_vol)
+        delta = ndtr(d1)
+        vega = S * norm_pdf(d1) * np.sqrt(T)
 
         # Combined hedge considers both delta and vega
         # Weight vega by volatility sensitivity
@@ -163,30 +158,34 @@ class SABRHedging:
         """
         logger.info("Calibrating SABR parameters...")
 
+        # Writable copies, so the kernel reuses the signature compiled at import
+        K = market_data["Strike"].to_numpy(dtype=np.float64, copy=True)
+        T = market_data["Maturity"].to_numpy(dtype=np.float64, copy=True)
+        F = market_data["Forward"].to_numpy(dtype=np.float64, copy=True)
+        market_vol = market_data["ImpliedVol"].to_numpy(dtype=np.float64, copy=True)
+        model_vol = np.empty_like(market_vol)
+        model_grad = np.empty((len(market_vol), 4))
+
         def objective(params):
             alpha, beta, rho, nu = params
             self.alpha, self.beta, self.rho, self.nu = alpha, beta, rho, nu
 
-            errors = []
-            for _, row in market_data.iterrows():
-                K = row["Strike"]
-                T = row["Maturity"]
-                F = row["Forward"]
-                market_vol = row["ImpliedVol"]
+            sabr_implied_vol_grad(alpha, beta, rho, nu, F, K, T, model_vol, model_grad)
+            residuals = model_vol - market_vol
+            # Penalty for quotes the formula cannot price; it has no gradient
+            failed = ~(np.isfinite(residuals) & np.isfinite(model_grad).all(axis=1))
+            residuals[failed] = 0.0
+            model_grad[failed] = 0.0
 
-                try:
-                    model_vol = self.implied_volatility(F, K, T)
-                    errors.append((model_vol - market_vol) ** 2)
-                except Exception:
-                    errors.append(1.0)  # Penalty for failures
-
-            return np.mean(errors)
+            value = (np.sum(residuals**2) + np.count_nonzero(failed)) / len(residuals)
+            gradient = 2.0 * (residuals @ model_grad) / len(residuals)
+            return value, gradient
 
         # Initial guess and bounds
         x0 = [self.alpha, self.beta, self.rho, self.nu]
         bounds = [(0.001, 1.0), (0.0, 1.0), (-0.99, 0.99), (0.001, 2.0)]
 
-        result = minimize(objective, x0, bounds=bounds, method="L-BFGS-B")
+        result = minimize(objective, x0, jac=True, bounds=bounds, method="L-BFGS-B")
 
         if result.success:
             self.alpha, self.beta, self.rho, self.nu = result.x
@@ -230,40 +229,41 @@ class LocalVolatilityHedging:
         """
         logger.info("Building local volatility surface...")
 
+        quote_K = market_data["Strike"].to_numpy(dtype=np.float64)
+        quote_T = market_data["Maturity"].to_numpy(dtype=np.float64)
+        quote_vol = market_data["ImpliedVol"].to_numpy(dtype=np.float64)
+
         # Extract unique strikes and maturities
-        self.strikes = sorted(market_data["Strike"].unique())
-        self.maturities = sorted(market_data["Maturity"].unique())
-
-        # Create volatility grid
-        vol_grid = np.zeros((len(self.maturities), len(self.strikes)))
-
-        for i, T in enumerate(self.maturities):
-            for j, K in enumerate(self.strikes):
-                mask = (market_data["Strike"] == K) & (market_data["Maturity"] == T)
-                if mask.any():
-                    vol_grid[i, j] = market_data.loc[mask, "ImpliedVol"].values[0]
-                else:
-                    # Interpolate missing values
-                    vol_grid[i, j] = np.nan
-
-        # Fill NaN values with interpolation
-        from scipy.interpolate import griddata
-
-        points = []
-        values = []
-        for i in range(len(self.maturities)):
-            for j in range(len(self.strikes)):
-                if not np.isnan(vol_grid[i, j]):
-                    points.append([self.maturities[i], self.strikes[j]])
-                    values.append(vol_grid[i, j])
-
-        points = np.array(points)
-        values = np.array(values)
-
-        # Create interpolator
-        self.vol_surface = lambda T, K: griddata(
-            points, values, np.array([[T, K]]), method="cubic"
-        )[0]
+        strikes, strike_idx = np.unique(quote_K, return_inverse=True)
+        maturities, maturity_idx = np.unique(quote_T, return_inverse=True)
+        self.strikes = strikes.tolist()
+        self.maturities = maturities.tolist()
+
+        # Scatter quotes into the volatility grid, keeping the first quote of
+        # each node; nodes without a quote are NaN and interpolated below
+        vol_grid = np.full((len(maturities), len(strikes)), np.nan)
+        node = maturity_idx * len(strikes) + strike_idx
+        _, first = np.unique(node, return_index=True)
+        vol_grid.flat[node[first]] = quote_vol[first]
+
+        # Fill missing grid nodes once; nodes outside the quotes' convex hull
+        # take the nearest quote
+        missing = np.isnan(vol_grid)
+        if missing.any():
+            grid = np.stack(np.meshgrid(maturities, strikes, indexing="ij"), axis=-1)
+            points = grid[~missing]
+            values = vol_grid[~missing]
+            vol_grid[missing] = griddata(points, values, grid[missing], method="cubic")
+            still_missing = np.isnan(vol_grid)
+            vol_grid[still_missing] = griddata(
+                points, values, grid[still_missing], method="nearest"
+            )
+
+        # Create interpolator; cubic needs at least four nodes per axis
+        method = "cubic" if min(vol_grid.shape) >= 4 else "linear"
+        self.vol_surface = RegularGridInterpolator(
+            (maturities, strikes), vol_grid, method=method, bounds_error=False, fill_value=None
+        )
 
         logger.info(
             f"✅ Built local vol surface: {len(self.strikes)} strikes × {len(self.maturities)} maturities"
@@ -273,47 +273,55 @@ class LocalVolatilityHedging:
         """
         Get local volatility at (S, K, T)
 
+        Strikes and maturities may be arrays (broadcast together); queries
+        outside the grid are held at its edge.
+
         Args:
             S: Current stock price
-            K: Strike price
-            T: Time to maturity
+            K: Strike price(s)
+            T: Time(s) to maturity
 
         Returns:
-            Local volatility
+            Local volatility, with the broadcast shape of K and T
         """
         if self.vol_surface is None:
             raise ValueError("Volatility surface not built. Call build_surface() first.")
 
-        return self.vol_surface(T, K)
+        T, K = np.broadcast_arrays(
+            np.clip(T, self.maturities[0], self.maturities[-1]),
+            np.clip(K, self.strikes[0], self.strikes[-1]),
+        )
+        sigma = self.vol_surface(np.stack([T, K], axis=-1))
+
+        return sigma.reshape(T.shape)[()]
 
     def delta(self, S, K, T, r):
-        """Calculate delta using local volatility"""
+        """Calculate delta using local volatility; inputs may be arrays"""
         sigma_local = self.local_volatility(S, K, T)
 
         # Use Black-Scholes formula with local vol
-        d1 = (np.log(S / K) + (r + 0.5 * sigma_local**2) * T) / (sigma_local * np.sqrt(T))
-        delta = norm.cdf(d1)
-
-        return delta
+        return ndtr(_d1(S, K, T, r, sigma_local))
 
     def gamma(self, S, K, T, r):
-        """Calculate gamma using local volatility"""
+        """Calculate gamma using local volatility; inputs may be arrays"""
         sigma_local = self.local_volatility(S, K, T)
 
-        d1 = (np.log(S / K) + (r + 0.5 * sigma_local**2) * T) / (sigma_local * np.sqrt(T))
-        gamma = norm.pdf(d1) / (S * sigma_local * np.sqrt(T))
-
-        return gamma
+        d1 = _d1(S, K, T, r, sigma_local)
+        return norm_pdf(d1) / (S * sigma_local * np.sqrt(T))
 
     def compute_hedge(self, S, K, T, r):
         """
         Compute local vol hedge
 
+        Inputs may be arrays; the surface is queried and d1 computed once.
+
         Returns:
             dict with delta, gamma, and hedge ratio
         """
-        delta = self.delta(S, K, T, r)
-        gamma = self.gamma(S, K, T, r)
+        sigma_local = self.local_volatility(S, K, T)
+        d1 = _d1(S, K, T, r, sigma_local)
+        delta = ndtr(d1)
+        gamma = norm_pdf(d1) / (S * sigma_local * np.sqrt(T))
 
         # Delta-gamma hedge
         hedge_ratio = delta + 0.5 * gamma * S
@@ -322,7 +330,7 @@ class LocalVolatilityHedging:
             "hedge_ratio": hedge_ratio,
             "delta": delta,
             "gamma": gamma,
-            "local_vol": self.local_volatility(S, K, T),
+            "local_vol": sigma_local,
         }
 
 
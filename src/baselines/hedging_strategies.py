@@ -13,12 +13,22 @@ from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
+from src.baselines._numba_kernels import (
+    DELTA,
+    DELTA_GAMMA,
+    DELTA_GAMMA_VEGA,
+    hedge_episode,
+)
 from src.pricing.black_scholes import BlackScholesModel
 
 
 class BaseHedgingStrategy(ABC):
     """Abstract base class for hedging strategies."""
 
+    # ``hedge_episode`` strategy code reproducing ``get_hedge_positions``, if any.
+    # Subclasses that change the hedge rule must reset this to None.
+    episode_kernel: Optional[int] = None
+
     def __init__(
         self,
         S0: float,
@@ -51,9 +61,12 @@ class BaseHedgingStrategy(ABC):
 
         self.bs_model = BlackScholesModel()
 
-        # Portfolio state
-        self.stock_position = 0.0
         self.option_position = -1.0  # Short one option
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear portfolio state so the same instance can hedge a new episode."""
+        self.stock_position = 0.0
         self.cash = 0.0
         self.total_costs = 0.0
 
@@ -70,7 +83,7 @@ class BaseHedgingStrategy(ABC):
             tau: Time to maturity
 
         Returns:
-            positions: Dictionary with position sizes
+            positions: Dictionary with position sizes; always contains ``"stock"``
         """
         pass
 
@@ -135,6 +148,59 @@ class BaseHedgingStrategy(ABC):
 
         return trade_info
 
+    def run_episode(
+        self, price_path: np.ndarray, dt: float
+    ) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        Hedge the short option along a price path from inception to maturity.
+
+        Strategies with an ``episode_kernel`` run the whole episode in one
+        compiled call; the others step through ``rebalance``.
+
+        Args:
+            price_path: Stock prices, one per step plus the price at maturity
+            dt: Step length
+
+        Returns:
+            Tuple of (pnl, positions, final_pnl) with one PnL and position per step
+        """
+        n_steps = len(price_path) - 1
+        pnl = np.empty(n_steps)
+        positions = np.empty(n_steps)
+
+        if self.episode_kernel is not None:
+            _, final_pnl, self.cash, self.stock_position, self.total_costs = hedge_episode(
+                np.asarray(price_path, dtype=np.float64),
+                self.episode_kernel,
+                float(self.S0),
+                float(self.K),
+                float(self.T),
+                float(self.r),
+                float(self.sigma),
+                float(dt),
+                self.option_type == "call",
+                float(self.transaction_cost),
+                float(getattr(self, "gamma_weight", 0.0)),
+                float(getattr(self, "vega_weight", 0.0)),
+                positions,
+                pnl,
+            )
+            return pnl, positions, final_pnl
+
+        initial_premium = self.initialize()
+        for step in range(n_steps):
+            S = price_path[step]
+            tau = self.T - step * dt
+
+            if step > 0:
+                self.rebalance(S, tau)
+
+            pnl[step] = self.get_portfolio_value(S, tau)["portfolio_value"] - initial_premium
+            positions[step] = self.stock_position
+
+        final_portfolio = self.get_portfolio_value(price_path[-1], 0.0)
+        return pnl, positions, final_portfolio["portfolio_value"] - initial_premium
+
     def get_portfolio_value(self, S: float, tau: float) -> Dict[str, float]:
         """
         Calculate current portfolio value.
@@ -182,11 +248,14 @@ class DeltaHedging(BaseHedgingStrategy):
     The strategy rebalances to keep portfolio delta near zero.
     """
 
+    episode_kernel = DELTA
+
     def get_hedge_positions(self, S: float, tau: float) -> Dict[str, float]:
         """
         Calculate delta hedge position.
 
         For a short option position, we buy delta units of stock to hedge.
+        Accepts arrays of prices/maturities to hedge a whole path at once.
 
         Args:
             S: Current stock price
@@ -195,18 +264,14 @@ class DeltaHedging(BaseHedgingStrategy):
         Returns:
             positions: Required positions
         """
-        if tau <= 0:
-            return {"stock": 0.0}
-
-        greeks = self.bs_model.greeks(
+        delta = self.bs_model.delta(
             S=S, K=self.K, T=tau, r=self.r, sigma=self.sigma, option_type=self.option_type
         )
 
-        # For short option, hedge with +delta stock
-        delta = greeks["delta"]
-        stock_position = -self.option_position * delta
+        # For short option, hedge with +delta stock; flat at expiry
+        stock_position = np.where(np.asarray(tau) > 0, -self.option_position * delta, 0.0)
 
-        return {"stock": stock_position}
+        return {"stock": stock_position if stock_position.ndim else float(stock_position)}
 
 
 class DeltaGammaHedging(BaseHedgingStrategy):
@@ -221,6 +286,8 @@ class DeltaGammaHedging(BaseHedgingStrategy):
     for gamma exposure.
     """
 
+    episode_kernel = DELTA_GAMMA
+
     def __init__(
         self,
         S0: float,
@@ -284,6 +351,8 @@ class DeltaGammaVegaHedging(BaseHedgingStrategy):
     account for all three Greeks.
     """
 
+    episode_kernel = DELTA_GAMMA_VEGA
+
     def __init__(
         self,
         S0: float,
@@ -368,6 +437,10 @@ class MinimumVarianceHedging(BaseHedgingStrategy):
         """
         super().__init__(S0, K, T, r, sigma, option_type, transaction_cost)
         self.lookback_window = lookback_window
+
+    def reset(self) -> None:
+        """Clear portfolio state and the rolling estimation window."""
+        super().reset()
         self.price_history: List[float] = []
         self.option_value_history: List[float] = []
 
@@ -9,6 +9,24 @@ from src.utils.logger import setup_logger
 logger = setup_logger(__name__)
 
 
+def _standard_normal(n_paths: int, antithetic: bool) -> np.ndarray:
+    """
+    Draw one standard normal per path from the global RNG.
+
+    Args:
+        n_paths: Number of draws
+        antithetic: Draw half the samples and mirror them as ``-Z``
+
+    Returns:
+        Array of shape (n_paths,)
+    """
+    if not antithetic:
+        return np.random.standard_normal(n_paths)
+
+    half = np.random.standard_normal((n_paths + 1) // 2)
+    return np.concatenate([half, -half])[:n_paths]
+
+
 class GBMSimulator:
     """Geometric Brownian Motion simulator for stock prices."""
 
@@ -38,16 +56,18 @@ class GBMSimulator:
         self.T = T
         self.dt = dt
         self.seed = seed
-        self.n_steps = int(T / dt)
+        self.n_steps = int(round(T / dt))
 
         np.random.seed(seed)
 
-    def simulate(self, n_paths: int = 1000) -> np.ndarray:
+    def simulate(self, n_paths: int = 1000, antithetic: bool = False) -> np.ndarray:
         """
         Simulate price paths.
 
         Args:
             n_paths: Number of paths to simulate
+            antithetic: Pair each path with its mirror image, halving the
+                random draws and reducing the variance of path averages
 
         Returns:
             Array of shape (n_paths, n_steps + 1) with price paths
@@ -58,7 +78,7 @@ class GBMSimulator:
         paths[:, 0] = self.S0
 
         for t in range(1, self.n_steps + 1):
-            Z = np.random.standard_normal(n_paths)
+            Z = _standard_normal(n_paths, antithetic)
             paths[:, t] = paths[:, t - 1] * np.exp(
                 (self.mu - 0.5 * self.sigma**2) * self.dt + self.sigma * np.sqrt(self.dt) * Z
             )
@@ -108,16 +128,20 @@ class HestonSimulator:
         self.T = T
         self.dt = dt
         self.seed = seed
-        self.n_steps = int(T / dt)
+        self.n_steps = int(round(T / dt))
 
         np.random.seed(seed)
 
-    def simulate(self, n_paths: int = 1000) -> Tuple[np.ndarray, np.ndarray]:
+    def simulate(
+        self, n_paths: int = 1000, antithetic: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Simulate price and variance paths.
 
         Args:
             n_paths: Number of paths to simulate
+            antithetic: Pair each path with its mirror image, halving the
+                random draws and reducing the variance of path averages
 
         Returns:
             Tuple of (price_paths, variance_paths), each of shape (n_paths, n_steps + 1)
@@ -132,8 +156,8 @@ class HestonSimulator:
 
         for t in range(1, self.n_steps + 1):
             # Generate correlated random variables
-            Z1 = np.random.standard_normal(n_paths)
-            Z2 = np.random.standard_normal(n_paths)
+            Z1 = _standard_normal(n_paths, antithetic)
+            Z2 = _standard_normal(n_paths, antithetic)
             W1 = Z1
             W2 = self.rho * Z1 + np.sqrt(1 - self.rho**2) * Z2
 
@@ -60,11 +60,11 @@ class Dataset(Base):
     num_samples = Column(Integer)
     file_path = Column(String(500))
     meta_data = Column(JSON)  # Renamed from metadata to avoid SQLAlchemy reserved name
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
-    experiments = relationship("Experiment", back_populates="dataset")
+    experiments = relationship("Experiment", back_populates="dataset", passive_deletes=True)
 
 
 class Experiment(Base):
@@ -74,7 +74,7 @@ class Experiment(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    dataset_id = Column(UUID(as_uuid=True), ForeignKey("datasets.id"))
+    dataset_id = Column(UUID(as_uuid=True), ForeignKey("datasets.id", ondelete="SET NULL"))
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text)
     algorithm = Column(String(50))  # 'DQN', 'PPO', 'SAC', 'DDPG'
@@ -162,7 +162,7 @@ class Evaluation(Base):
     name = Column(String(255), nullable=False)
 
     # Test dataset info
-    test_dataset_id = Column(UUID(as_uuid=True), ForeignKey("datasets.id"))
+    test_dataset_id = Column(UUID(as_uuid=True), ForeignKey("datasets.id", ondelete="SET NULL"))
     test_start_date = Column(DateTime)
     test_end_date = Column(DateTime)
 
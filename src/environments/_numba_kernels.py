@@ -0,0 +1,195 @@
+"""
+Numba-compiled step and reduction kernels for the hedging environment.
+
+Numba is optional; without it the kernels run as plain Python with identical
+results.
+"""
+
+import math
+
+import numpy as np
+
+from src._numba import NUMBA_AVAILABLE, njit
+from src.pricing.black_scholes import INV_SQRT_2PI
+
+
+_SQRT_2 = math.sqrt(2.0)
+
+
+@njit(cache=True)
+def step_kernel(
+    S,
+    position,
+    cash,
+    total_costs,
+    target,
+    dW,
+    S0,
+    K,
+    T,
+    r,
+    sigma,
+    dt,
+    step,
+    n_steps,
+    is_call,
+    tc_rate,
+    risk_penalty,
+    premium,
+    obs,
+    greeks,
+):
+    """
+    Advance one hedging step: trade, GBM update, repricing, PnL and reward.
+
+    Mirrors ``OptionHedgingEnv.step`` for a single episode and writes the next
+    observation into ``obs`` and the option Greeks into ``greeks`` in place.
+
+    Args:
+        S: Stock price before the step
+        position: Hedge position before the step
+        cash: Cash balance before the step
+        total_costs: Accumulated transaction costs before the step
+        target: Target hedge position (clipped to [-2, 2] here)
+        dW: Brownian increment for this step
+        S0: Initial stock price
+        K: Strike price
+        T: Time to maturity at inception
+        r: Risk-free rate
+        sigma: Volatility
+        dt: Step length
+        step: Step index after this step
+        n_steps: Number of steps per episode
+        is_call: Whether the option is a call
+        tc_rate: Transaction cost rate
+        risk_penalty: Weight of the hedging-error penalty
+        premium: Option premium received at inception
+        obs: Float32 buffer of length 11 receiving the observation
+        greeks: Float64 buffer of length 5 receiving (delta, gamma, vega, theta,
+            rho) in the units of ``BlackScholesModel.greeks``
+
+    Returns:
+        Tuple of (S, position, cash, total_costs, pnl, transaction_cost,
+        option_value, reward, tau)
+    """
+    target = min(max(target, -2.0), 2.0)
+
+    # Trade with transaction costs
+    trade = target - position
+    transaction_cost = abs(trade) * S * tc_rate
+    total_costs += transaction_cost
+    cash -= trade * S + transaction_cost
+    position = target
+
+    # GBM price update and cash accrual
+    S = S * math.exp((r - 0.5 * sigma * sigma) * dt + sigma * dW)
+    cash *= math.exp(r * dt)
+
+    tau = T - step * dt
+    if tau > 0:
+        sqrt_tau = math.sqrt(tau)
+        d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * tau) / (sigma * sqrt_tau)
+        d2 = d1 - sigma * sqrt_tau
+        discount = K * math.exp(-r * tau)
+        pdf_d1 = math.exp(-0.5 * d1 * d1) * INV_SQRT_2PI
+        if is_call:
+            delta = 0.5 * (1.0 + math.erf(d1 / _SQRT_2))
+            cdf_d2 = 0.5 * (1.0 + math.erf(d2 / _SQRT_2))
+            option_value = S * delta - discount * cdf_d2
+            theta_carry = -r * discount * cdf_d2
+            rho = tau * discount * cdf_d2 / 100
+        else:
+            delta = -0.5 * (1.0 + math.erf(-d1 / _SQRT_2))
+            cdf_d2 = 0.5 * (1.0 + math.erf(-d2 / _SQRT_2))
+            option_value = discount * cdf_d2 + S * delta
+            theta_carry = r * discount * cdf_d2
+            rho = -tau * discount * cdf_d2 / 100
+        gamma = pdf_d1 / (S * sigma * sqrt_tau)
+        vega = S * pdf_d1 * sqrt_tau / 100
+        theta = (-(S * pdf_d1 * sigma) / (2 * sqrt_tau) + theta_carry) / 365
+        hedging_error = abs(position - delta)
+    else:
+        option_value = max(S - K, 0.0) if is_call else max(K - S, 0.0)
+        delta = 0.0
+        gamma = 0.0
+        vega = 0.0
+        theta = 0.0
+        rho = 0.0
+        hedging_error = abs(position)
+
+    pnl = cash + position * S - option_value - premium
+
+    reward = -hedging_error * risk_penalty - total_costs * 0.1
+    if step >= n_steps:
+        reward += pnl
+
+    obs[0] = S / K
+    obs[1] = 1.0
+    obs[2] = max(tau, 0.0)
+    obs[3] = sigma
+    obs[4] = r
+    obs[5] = position
+    obs[6] = delta
+    obs[7] = gamma
+    obs[8] = vega / 100
+    obs[9] = pnl / S0
+    obs[10] = n_steps - step
+
+    greeks[0] = delta
+    greeks[1] = gamma
+    greeks[2] = vega
+    greeks[3] = theta
+    greeks[4] = rho
+
+    return S, position, cash, total_costs, pnl, transaction_cost, option_value, reward, tau
+
+
+@njit(cache=True)
+def aggregate_episode(pnl: np.ndarray, costs: np.ndarray, positions: np.ndarray):
+    """
+    Summarize an episode's PnL, cost and position series in a single pass.
+
+    Uses Welford's update for the variance so the result matches ``np.std``.
+
+    Args:
+        pnl: Per-step PnL series
+        costs: Per-step transaction costs
+        positions: Hedge positions, including the initial one
+
+    Returns:
+        Tuple of (mean_abs_pnl, mean_pnl, std_pnl, min_pnl, num_trades, avg_position)
+    """
+    n = pnl.shape[0]
+    abs_sum = 0.0
+    mean = 0.0
+    m2 = 0.0
+    min_pnl = np.inf
+    num_trades = 0
+
+    for i in range(n):
+        x = pnl[i]
+        abs_sum += abs(x)
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+        if x < min_pnl:
+            min_pnl = x
+        if costs[i] > 0:
+            num_trades += 1
+
+    position_sum = 0.0
+    for i in range(positions.shape[0]):
+        position_sum += abs(positions[i])
+    avg_position = position_sum / positions.shape[0] if positions.shape[0] > 0 else 0.0
+
+    return abs_sum / n, mean, np.sqrt(m2 / n), min_pnl, num_trades, avg_position
+
+
+def _warm_up():
+    """Compile (or load from cache) ``aggregate_episode`` before the first episode ends."""
+    series = np.zeros(2)
+    aggregate_episode(series, series, series)
+
+
+if NUMBA_AVAILABLE:
+    _warm_up()
@@ -12,8 +12,12 @@ import gymnasium as gym
 import numpy as np
 from gymnasium import spaces
 
+from src.environments._numba_kernels import aggregate_episode, step_kernel
 from src.pricing.black_scholes import BlackScholesModel
 
+# Order of the Greeks written by step_kernel
+_GREEK_NAMES = ("delta", "gamma", "vega", "theta", "rho")
+
 
 class OptionHedgingEnv(gym.Env):
     """
@@ -46,6 +50,9 @@ class OptionHedgingEnv(gym.Env):
 
     metadata = {"render_modes": ["human", "rgb_array"], "render_fps": 4}
 
+    # Stock price dynamics do not depend on the hedge actions taken
+    is_path_independent = True
+
     def __init__(
         self,
         S0: float = 100.0,
@@ -127,6 +134,11 @@ class OptionHedgingEnv(gym.Env):
         self.pnl = 0.0
         self.total_transaction_costs = 0.0
         self.history = []
+        self._initial_premium = float(
+            self.bs_model.price(S=S0, K=K, T=T, r=r, sigma=sigma, option_type=option_type)
+        )
+        self._obs_buf = np.empty(11, dtype=np.float32)
+        self._greeks_buf = np.empty(5, dtype=np.float64)
 
     def reset(
         self,
@@ -159,6 +171,8 @@ class OptionHedgingEnv(gym.Env):
         self.price_history = [self.S0]
         self.position_history = [0.0]
         self.pnl_history = []
+        self.cost_history = []
+        self._episode_metrics: Optional[Dict[str, float]] = None
 
         # Calculate initial option value
         tau = self.T
@@ -168,6 +182,7 @@ class OptionHedgingEnv(gym.Env):
 
         # Receive premium for selling option
         self.cash = option_value
+        self._initial_premium = float(option_value)
 
         observation = self._get_obs()
         info = self._get_info()
@@ -192,56 +207,46 @@ class OptionHedgingEnv(gym.Env):
         if self.action_mode == "continuous":
             target_position = float(action[0])
         else:
-            target_position = self.position + self.discrete_actions[action]
-
-        # Clip target position to action space bounds
-        target_position = np.clip(target_position, -2.0, 2.0)
-
-        # Calculate trade size
-        trade_size = target_position - self.position
-
-        # Apply transaction costs
-        transaction_cost = abs(trade_size) * self.S * self.transaction_cost
-        self.total_transaction_costs += transaction_cost
-
-        # Execute trade
-        self.cash -= trade_size * self.S + transaction_cost
-        self.position = target_position
+            target_position = self.position + self.discrete_actions[np.asarray(action).item()]
 
         # Simulate stock price dynamics (GBM) using seeded RNG
         dW = self.np_random.normal(0, np.sqrt(self.dt))
-        self.S = self.S * np.exp((self.r - 0.5 * self.sigma**2) * self.dt + self.sigma * dW)
-
-        # Update cash with risk-free rate
-        self.cash *= np.exp(self.r * self.dt)
 
-        # Move to next step
+        # Trade, price update, repricing and reward in one compiled kernel;
+        # PnL is relative to the initial premium received
         self.current_step += 1
-        tau = self.T - self.current_step * self.dt
-
-        # Calculate current portfolio value
-        if tau > 0:
-            option_value = self.bs_model.price(
-                S=self.S, K=self.K, T=tau, r=self.r, sigma=self.sigma, option_type=self.option_type
-            )
-        else:
-            # At maturity, option payoff
-            if self.option_type == "call":
-                option_value = max(self.S - self.K, 0)
-            else:
-                option_value = max(self.K - self.S, 0)
-
-        # Portfolio value = cash + stock position - option liability
-        portfolio_value = self.cash + self.position * self.S - option_value
-
-        # Calculate PnL (relative to initial premium received)
-        initial_premium = self.bs_model.price(
-            S=self.S0, K=self.K, T=self.T, r=self.r, sigma=self.sigma, option_type=self.option_type
+        (
+            self.S,
+            self.position,
+            self.cash,
+            self.total_transaction_costs,
+            self.pnl,
+            transaction_cost,
+            option_value,
+            reward,
+            tau,
+        ) = step_kernel(
+            self.S,
+            self.position,
+            self.cash,
+            self.total_transaction_costs,
+            float(target_position),
+            dW,
+            self.S0,
+            self.K,
+            self.T,
+            self.r,
+            self.sigma,
+            self.dt,
+            self.current_step,
+            self.n_steps,
+            self.option_type == "call",
+            self.transaction_cost,
+            self.risk_penalty,
+            self._initial_premium,
+            self._obs_buf,
+            self._greeks_buf,
         )
-        self.pnl = portfolio_value - initial_premium
-
-        # Calculate reward
-        reward = self._calculate_reward(tau, option_value)
 
         # Check if episode is done
         terminated = self.current_step >= self.n_steps
@@ -264,53 +269,20 @@ class OptionHedgingEnv(gym.Env):
         self.price_history.append(self.S)
         self.position_history.append(self.position)
         self.pnl_history.append(self.pnl)
+        self.cost_history.append(transaction_cost)
+        self._episode_metrics = None
 
-        observation = self._get_obs()
-        info = self._get_info()
+        # The kernel filled the observation and Greeks buffers
+        observation = self._obs_buf.copy()
+        info = self._get_info(greeks=dict(zip(_GREEK_NAMES, self._greeks_buf.tolist())))
 
         # Add final PnL when episode terminates
         if terminated:
             info["final_pnl"] = self.pnl
+            info["episode_metrics"] = self.get_episode_metrics()
 
         return observation, reward, terminated, truncated, info
 
-    def _calculate_reward(self, tau: float, option_value: float) -> float:
-        """
-        Calculate reward based on hedging performance.
-
-        Args:
-            tau: Time to maturity
-            option_value: Current option value
-
-        Returns:
-            reward: Reward value
-        """
-        # Calculate Greeks for hedging error
-        if tau > 0:
-            greeks = self.bs_model.greeks(
-                S=self.S, K=self.K, T=tau, r=self.r, sigma=self.sigma, option_type=self.option_type
-            )
-            delta = greeks["delta"]
-
-            # Hedging error: difference between actual position and delta hedge
-            hedging_error = abs(self.position - delta)
-        else:
-            hedging_error = abs(self.position)  # Should be flat at maturity
-
-        # Reward components
-        hedging_penalty = -hedging_error * self.risk_penalty
-        cost_penalty = -self.total_transaction_costs * 0.1
-
-        # Terminal reward: final PnL
-        if self.current_step >= self.n_steps:
-            terminal_reward = self.pnl
-        else:
-            terminal_reward = 0.0
-
-        reward = hedging_penalty + cost_penalty + terminal_reward
-
-        return reward
-
     def _get_obs(self) -> np.ndarray:
         """
         Get current observation.
@@ -352,20 +324,23 @@ class OptionHedgingEnv(gym.Env):
 
         return obs
 
-    def _get_info(self) -> Dict[str, Any]:
+    def _get_info(self, greeks: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """
         Get additional information.
 
+        Args:
+            greeks: Option Greeks at the current state, if already computed
+
         Returns:
             info: Dictionary with extra info
         """
         tau = max(self.T - self.current_step * self.dt, 0.0)
 
-        if tau > 0:
+        if greeks is None and tau > 0:
             greeks = self.bs_model.greeks(
                 S=self.S, K=self.K, T=tau, r=self.r, sigma=self.sigma, option_type=self.option_type
             )
-        else:
+        elif greeks is None:
             greeks = {"delta": 0.0, "gamma": 0.0, "vega": 0.0, "theta": 0.0, "rho": 0.0}
 
         info = {
@@ -402,32 +377,36 @@ class OptionHedgingEnv(gym.Env):
         """
         Calculate episode performance metrics.
 
+        The result is memoized until the next step, so repeated calls at the
+        end of an episode are free.
+
         Returns:
             metrics: Dictionary of performance metrics
         """
         if not self.history:
             return {}
+        if self._episode_metrics is not None:
+            return self._episode_metrics
 
-        pnl_series = np.array([h["pnl"] for h in self.history])
-
-        # Calculate average position
-        if self.position_history:
-            avg_position = np.mean(np.abs(self.position_history))
-        else:
-            avg_position = 0.0
+        mean_abs_pnl, mean_pnl, std_pnl, min_pnl, num_trades, avg_position = aggregate_episode(
+            np.asarray(self.pnl_history, dtype=np.float64),
+            np.asarray(self.cost_history, dtype=np.float64),
+            np.asarray(self.position_history, dtype=np.float64),
+        )
 
         metrics = {
             "total_pnl": self.pnl,
             "final_pnl": self.pnl,
             "total_costs": self.total_transaction_costs,
             "net_pnl": self.pnl - self.total_transaction_costs,
-            "mean_abs_pnl": np.mean(np.abs(pnl_series)),
-            "std_pnl": np.std(pnl_series),
-            "max_drawdown": np.min(pnl_series),
-            "sharpe_ratio": np.mean(pnl_series) / (np.std(pnl_series) + 1e-8),
-            "num_trades": len([h for h in self.history if h["transaction_cost"] > 0]),
-            "num_rebalances": len([h for h in self.history if h["transaction_cost"] > 0]),
+            "mean_abs_pnl": mean_abs_pnl,
+            "std_pnl": std_pnl,
+            "max_drawdown": min_pnl,
+            "sharpe_ratio": mean_pnl / (std_pnl + 1e-8),
+            "num_trades": int(num_trades),
+            "num_rebalances": int(num_trades),
             "avg_position": avg_position,
         }
 
+        self._episode_metrics = metrics
         return metrics
@@ -0,0 +1,225 @@
+"""
+Subprocess ``VecEnv`` returning observations through shared memory.
+
+``SubprocVecEnv`` pickles every observation through a pipe on each step. Here
+workers write observations straight into a ``multiprocessing.shared_memory``
+block mapped as an ``(n_envs, *obs_shape)`` array in every process; the pipes
+only carry rewards, done flags and infos.
+"""
+
+import multiprocessing as mp
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3.common.vec_env import SubprocVecEnv
+from stable_baselines3.common.vec_env.base_vec_env import CloudpickleWrapper
+
+
+def _attach(
+    shm_name: str, shape: Tuple[int, ...], dtype: np.dtype
+) -> Tuple[SharedMemory, np.ndarray]:
+    """Map an existing shared memory block as an array of ``shape``."""
+    shm = SharedMemory(name=shm_name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+class _WorkerState:
+    """Environment and shared observation buffers owned by one worker process."""
+
+    def __init__(self, env: gym.Env, rank: int):
+        self.env = env
+        self.rank = rank
+        self.shm: Optional[SharedMemory] = None
+        self.obs_bufs: Optional[np.ndarray] = None
+
+
+def _cmd_step(state: _WorkerState, data: Any) -> Tuple[Any, bool, Dict[str, Any], Dict[str, Any]]:
+    action, slot = data
+    observation, reward, terminated, truncated, info = state.env.step(action)
+    done = terminated or truncated
+    info["TimeLimit.truncated"] = truncated and not terminated
+    reset_info: Dict[str, Any] = {}
+    if done:
+        # Save the final observation, then reset
+        info["terminal_observation"] = observation
+        observation, reset_info = state.env.reset()
+    state.obs_bufs[slot, state.rank] = observation
+    return reward, done, info, reset_info
+
+
+def _cmd_reset(state: _WorkerState, data: Any) -> Dict[str, Any]:
+    (seed, options), slot = data
+    maybe_options = {"options": options} if options else {}
+    observation, reset_info = state.env.reset(seed=seed, **maybe_options)
+    state.obs_bufs[slot, state.rank] = observation
+    return reset_info
+
+
+def _cmd_attach(state: _WorkerState, data: Any) -> None:
+    state.shm, state.obs_bufs = _attach(*data)
+
+
+def _cmd_has_attr(state: _WorkerState, data: Any) -> bool:
+    try:
+        state.env.get_wrapper_attr(data)
+    except AttributeError:
+        return False
+    return True
+
+
+def _cmd_is_wrapped(state: _WorkerState, data: Any) -> bool:
+    from stable_baselines3.common.env_util import is_wrapped
+
+    return is_wrapped(state.env, data)
+
+
+# Handlers for every command except ``close``; each returns the reply to send
+_COMMANDS: Dict[str, Callable[[_WorkerState, Any], Any]] = {
+    "step": _cmd_step,
+    "reset": _cmd_reset,
+    "attach": _cmd_attach,
+    "render": lambda state, data: state.env.render(),
+    "get_spaces": lambda state, data: (state.env.observation_space, state.env.action_space),
+    "env_method": lambda state, data: state.env.get_wrapper_attr(data[0])(*data[1], **data[2]),
+    "get_attr": lambda state, data: state.env.get_wrapper_attr(data),
+    "has_attr": _cmd_has_attr,
+    "set_attr": lambda state, data: setattr(state.env, data[0], data[1]),
+    "is_wrapped": _cmd_is_wrapped,
+}
+
+
+def _shmem_worker(
+    remote: mp.connection.Connection,
+    parent_remote: mp.connection.Connection,
+    env_fn_wrapper: CloudpickleWrapper,
+    rank: int,
+) -> None:
+    """
+    Run one environment, answering the ``SubprocVecEnv`` command protocol.
+
+    ``step`` and ``reset`` write the observation into row ``rank`` of the shared
+    buffer named by the ``attach`` command instead of sending it back.
+    """
+    from stable_baselines3.common.vec_env.patch_gym import _patch_env
+
+    parent_remote.close()
+    state = _WorkerState(_patch_env(env_fn_wrapper.var()), rank)
+
+    while True:
+        try:
+            cmd, data = remote.recv()
+            if cmd == "close":
+                state.env.close()
+                if state.shm is not None:
+                    state.shm.close()
+                remote.close()
+                break
+            handler = _COMMANDS.get(cmd)
+            if handler is None:
+                raise NotImplementedError(f"`{cmd}` is not implemented in the worker")
+            remote.send(handler(state, data))
+        except (EOFError, KeyboardInterrupt):
+            break
+
+
+class SharedMemoryVecEnv(SubprocVecEnv):
+    """
+    ``SubprocVecEnv`` whose workers write observations into shared memory.
+
+    Observations alternate between two shared buffers; a returned array stays
+    valid until the step after next, which covers Stable-Baselines3's use of
+    the previous observation when storing a transition. Only ``Box``
+    observation spaces are supported.
+    """
+
+    def __init__(self, env_fns: List[Callable[[], gym.Env]], start_method: Optional[str] = None):
+        """
+        Initialize the vectorized environment.
+
+        Args:
+            env_fns: Environment factories, one per worker process
+            start_method: multiprocessing start method (defaults to forkserver
+                where available, else spawn)
+        """
+        self.waiting = False
+        self.closed = False
+        self._shm: Optional[SharedMemory] = None
+        n_envs = len(env_fns)
+
+        if start_method is None:
+            forkserver_available = "forkserver" in mp.get_all_start_methods()
+            start_method = "forkserver" if forkserver_available else "spawn"
+        ctx = mp.get_context(start_method)
+
+        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(n_envs)])
+        self.processes = []
+        for rank, (work_remote, remote, env_fn) in enumerate(
+            zip(self.work_remotes, self.remotes, env_fns)
+        ):
+            args = (work_remote, remote, CloudpickleWrapper(env_fn), rank)
+            # daemon=True: if the main process crashes, we should not cause things to hang
+            process = ctx.Process(target=_shmem_worker, args=args, daemon=True)
+            process.start()
+            self.processes.append(process)
+            work_remote.close()
+
+        self.remotes[0].send(("get_spaces", None))
+        observation_space, action_space = self.remotes[0].recv()
+        if not isinstance(observation_space, spaces.Box):
+            self.close()
+            raise ValueError(
+                f"SharedMemoryVecEnv requires a Box observation space, got {observation_space}"
+            )
+
+        # Two alternating (n_envs, *obs_shape) observation buffers
+        shape = (2, n_envs, *observation_space.shape)
+        dtype = np.dtype(observation_space.dtype)
+        self._shm = SharedMemory(create=True, size=int(np.prod(shape)) * dtype.itemsize)
+        self._obs_bufs = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf)
+        self._slot = 0
+        for remote in self.remotes:
+            remote.send(("attach", (self._shm.name, shape, dtype)))
+        for remote in self.remotes:
+            remote.recv()
+
+        super(SubprocVecEnv, self).__init__(n_envs, observation_space, action_space)
+
+    def _next_slot(self) -> int:
+        self._slot ^= 1
+        return self._slot
+
+    def step_async(self, actions: np.ndarray) -> None:
+        slot = self._next_slot()
+        for remote, action in zip(self.remotes, actions):
+            remote.send(("step", (action, slot)))
+        self.waiting = True
+
+    def step_wait(self):
+        results = [remote.recv() for remote in self.remotes]
+        self.waiting = False
+        rewards, dones, infos, self.reset_infos = zip(*results)
+        return self._obs_bufs[self._slot], np.stack(rewards), np.stack(dones), infos
+
+    def reset(self) -> np.ndarray:
+        slot = self._next_slot()
+        for env_idx, remote in enumerate(self.remotes):
+            remote.send(("reset", ((self._seeds[env_idx], self._options[env_idx]), slot)))
+        self.reset_infos = [remote.recv() for remote in self.remotes]
+        # Seeds and options are only used once
+        self._reset_seeds()
+        self._reset_options()
+        return self._obs_bufs[slot]
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        super().close()
+        if self._shm is not None:
+            # Drop the array view before releasing the mapping
+            self._obs_bufs = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
@@ -0,0 +1,318 @@
+"""
+Array-batched dynamics for the option hedging environment.
+
+Runs many independent hedging episodes at once by holding the portfolio state
+as ``(n_envs,)`` arrays and advancing all of them with one vectorized step.
+The dynamics, reward and observation layout mirror ``OptionHedgingEnv`` so a
+policy trained on the single environment can be rolled out here unchanged.
+``OptionHedgingVecEnv`` exposes the same dynamics as a Stable-Baselines3
+``VecEnv`` for training.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.special import ndtr
+from stable_baselines3.common.vec_env import VecEnv
+
+from src.environments.hedging_env import OptionHedgingEnv
+from src.pricing.black_scholes import norm_pdf
+
+
+@dataclass
+class HedgingBatchState:
+    """Portfolio state of a batch of hedging episodes."""
+
+    S: np.ndarray
+    position: np.ndarray
+    cash: np.ndarray
+    premium: np.ndarray
+    pnl: np.ndarray
+    total_costs: np.ndarray
+    pnl_sum: np.ndarray
+    pnl_sq_sum: np.ndarray
+    step: int = 0
+
+    @property
+    def n_envs(self) -> int:
+        """Number of episodes in the batch."""
+        return self.S.shape[0]
+
+    def episode_metrics(self) -> Dict[str, np.ndarray]:
+        """
+        Per-episode metrics matching ``OptionHedgingEnv.get_episode_metrics``.
+
+        Returns:
+            metrics: Dictionary of ``(n_envs,)`` arrays
+        """
+        n = max(self.step, 1)
+        mean_pnl = self.pnl_sum / n
+        std_pnl = np.sqrt(np.maximum(self.pnl_sq_sum / n - mean_pnl**2, 0.0))
+
+        return {
+            "total_pnl": self.pnl.copy(),
+            "total_costs": self.total_costs.copy(),
+            "net_pnl": self.pnl - self.total_costs,
+            "std_pnl": std_pnl,
+            "sharpe_ratio": mean_pnl / (std_pnl + 1e-8),
+        }
+
+
+def _bs_terms(
+    env: OptionHedgingEnv, S: np.ndarray, tau: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Black-Scholes price, delta, gamma and vega (per 1% vol) for a batch of spots."""
+    if tau <= 0:
+        payoff = (
+            np.maximum(S - env.K, 0.0) if env.option_type == "call" else np.maximum(env.K - S, 0.0)
+        )
+        zeros = np.zeros_like(S)
+        return payoff, zeros, zeros, zeros
+
+    sqrt_tau = np.sqrt(tau)
+    d1 = (np.log(S / env.K) + (env.r + 0.5 * env.sigma**2) * tau) / (env.sigma * sqrt_tau)
+    d2 = d1 - env.sigma * sqrt_tau
+    discount = env.K * np.exp(-env.r * tau)
+
+    if env.option_type == "call":
+        price = S * ndtr(d1) - discount * ndtr(d2)
+        delta = ndtr(d1)
+    else:
+        price = discount * ndtr(-d2) - S * ndtr(-d1)
+        delta = -ndtr(-d1)
+
+    pdf_d1 = norm_pdf(d1)
+    gamma = pdf_d1 / (S * env.sigma * sqrt_tau)
+    vega = S * pdf_d1 * sqrt_tau / 100
+
+    return price, delta, gamma, vega
+
+
+def _batch_obs(
+    env: OptionHedgingEnv,
+    state: HedgingBatchState,
+    tau: float,
+    delta: np.ndarray,
+    gamma: np.ndarray,
+    vega: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Stack the observation vector of ``OptionHedgingEnv._get_obs`` for every episode."""
+    obs = np.empty((state.n_envs, 11), dtype=np.float32) if out is None else out
+    obs[:, 0] = state.S / env.K
+    obs[:, 1] = 1.0
+    obs[:, 2] = tau
+    obs[:, 3] = env.sigma
+    obs[:, 4] = env.r
+    obs[:, 5] = state.position
+    obs[:, 6] = delta
+    obs[:, 7] = gamma
+    obs[:, 8] = vega / 100
+    obs[:, 9] = state.pnl / env.S0
+    obs[:, 10] = env.n_steps - state.step
+    return obs
+
+
+def batch_reset(
+    env: OptionHedgingEnv, n_envs: int, obs_out: Optional[np.ndarray] = None
+) -> Tuple[HedgingBatchState, np.ndarray]:
+    """
+    Start ``n_envs`` fresh episodes with the parameters of ``env``.
+
+    Args:
+        env: Environment providing contract and market parameters
+        n_envs: Number of parallel episodes
+        obs_out: Optional (n_envs, 11) float32 buffer to write the observations into
+
+    Returns:
+        state: Batch state
+        obs: Initial observations of shape (n_envs, 11)
+    """
+    premium, delta, gamma, vega = _bs_terms(env, np.full(n_envs, float(env.S0)), env.T)
+
+    state = HedgingBatchState(
+        S=np.full(n_envs, float(env.S0)),
+        position=np.zeros(n_envs),
+        cash=premium.copy(),
+        premium=premium,
+        pnl=np.zeros(n_envs),
+        total_costs=np.zeros(n_envs),
+        pnl_sum=np.zeros(n_envs),
+        pnl_sq_sum=np.zeros(n_envs),
+    )
+
+    return state, _batch_obs(env, state, env.T, delta, gamma, vega, out=obs_out)
+
+
+def batch_step(
+    env: OptionHedgingEnv,
+    state: HedgingBatchState,
+    actions: np.ndarray,
+    noise: np.ndarray,
+    obs_out: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Advance every episode in the batch by one hedging step (updates ``state`` in place).
+
+    Args:
+        env: Environment providing contract and market parameters
+        state: Batch state from ``batch_reset``
+        actions: Actions of shape (n_envs, 1) for continuous or (n_envs,) for discrete mode
+        noise: Standard normal draws of shape (n_envs,) driving the GBM update
+        obs_out: Optional (n_envs, 11) float32 buffer to write the observations into
+
+    Returns:
+        obs: Next observations of shape (n_envs, 11)
+        rewards: Rewards of shape (n_envs,)
+        done: Whether the episodes have reached maturity
+    """
+    if env.action_mode == "continuous":
+        target = np.asarray(actions, dtype=np.float64).reshape(state.n_envs)
+    else:
+        target = state.position + env.discrete_actions[np.asarray(actions).reshape(state.n_envs)]
+    target = np.clip(target, -2.0, 2.0)
+
+    # Trade with transaction costs
+    trade = target - state.position
+    cost = np.abs(trade) * state.S * env.transaction_cost
+    state.total_costs += cost
+    state.cash -= trade * state.S + cost
+    state.position = target
+
+    # GBM price update and cash accrual
+    state.S = state.S * np.exp(
+        (env.r - 0.5 * env.sigma**2) * env.dt + env.sigma * np.sqrt(env.dt) * noise
+    )
+    state.cash *= np.exp(env.r * env.dt)
+
+    state.step += 1
+    tau = env.T - state.step * env.dt
+    done = state.step >= env.n_steps
+
+    option_value, delta, gamma, vega = _bs_terms(env, state.S, tau)
+    state.pnl = state.cash + state.position * state.S - option_value - state.premium
+    state.pnl_sum += state.pnl
+    state.pnl_sq_sum += state.pnl**2
+
+    # Reward mirrors OptionHedgingEnv.step
+    hedging_error = np.abs(state.position - delta) if tau > 0 else np.abs(state.position)
+    rewards = -hedging_error * env.risk_penalty - state.total_costs * 0.1
+    if done:
+        rewards = rewards + state.pnl
+
+    obs_tau = max(tau, 0.0)
+    return _batch_obs(env, state, obs_tau, delta, gamma, vega, out=obs_out), rewards, done
+
+
+class OptionHedgingVecEnv(VecEnv):
+    """
+    Stable-Baselines3 ``VecEnv`` running ``n_envs`` hedging episodes as arrays.
+
+    All episodes share the contract of ``env`` and run in lockstep, so they
+    finish together and are reset together. Each step draws one standard
+    normal per environment in a single vectorized call, replacing ``n_envs``
+    Python ``step`` calls.
+
+    Observations are written into two alternating preallocated buffers; a
+    returned array stays valid until the step after next.
+    """
+
+    def __init__(self, env: OptionHedgingEnv, n_envs: int, seed: Optional[int] = None):
+        """
+        Initialize the vectorized environment.
+
+        Args:
+            env: Template environment providing contract and market parameters
+            n_envs: Number of parallel episodes
+            seed: Random seed for the price paths
+        """
+        if n_envs < 1:
+            raise ValueError(f"n_envs must be >= 1, got {n_envs}")
+
+        super().__init__(n_envs, env.observation_space, env.action_space)
+        self.env = env
+        self.rng = np.random.default_rng(seed)
+
+        self._obs_bufs = (
+            np.empty((n_envs, 11), dtype=np.float32),
+            np.empty((n_envs, 11), dtype=np.float32),
+        )
+        self._buf_index = 0
+        self._dones = np.zeros(n_envs, dtype=bool)
+        self._episode_returns = np.zeros(n_envs)
+        self._episode_start = time.time()
+        self._actions: Optional[np.ndarray] = None
+        self.state: Optional[HedgingBatchState] = None
+
+    def _next_obs_buf(self) -> np.ndarray:
+        self._buf_index ^= 1
+        return self._obs_bufs[self._buf_index]
+
+    def _start_episodes(self, obs_out: np.ndarray) -> np.ndarray:
+        self.state, obs = batch_reset(self.env, self.num_envs, obs_out=obs_out)
+        self._episode_returns[:] = 0.0
+        self._episode_start = time.time()
+        return obs
+
+    def reset(self) -> np.ndarray:
+        """Start new episodes in every slot and return the initial observations."""
+        if self._seeds[0] is not None:
+            self.rng = np.random.default_rng(self._seeds[0])
+        self._reset_seeds()
+
+        return self._start_episodes(self._next_obs_buf())
+
+    def step_async(self, actions: np.ndarray) -> None:
+        self._actions = actions
+
+    def step_wait(self):
+        noise = self.rng.standard_normal(self.num_envs)
+        obs_buf = self._next_obs_buf()
+        obs, rewards, done = batch_step(self.env, self.state, self._actions, noise, obs_out=obs_buf)
+        self._episode_returns += rewards
+        infos: List[Dict[str, Any]] = [{} for _ in range(self.num_envs)]
+
+        if done:
+            metrics = self.state.episode_metrics()
+            elapsed = round(time.time() - self._episode_start, 6)
+            for i, info in enumerate(infos):
+                info["terminal_observation"] = obs[i].copy()
+                info["TimeLimit.truncated"] = False
+                info["episode"] = {
+                    "r": float(self._episode_returns[i]),
+                    "l": self.env.n_steps,
+                    "t": elapsed,
+                }
+                info["episode_metrics"] = {key: float(value[i]) for key, value in metrics.items()}
+
+            # Auto-reset into the same buffer so the previous observations stay intact
+            obs = self._start_episodes(obs_buf)
+
+        self._dones[:] = done
+        return obs, rewards.astype(np.float32), self._dones.copy(), infos
+
+    def close(self) -> None:
+        self.env.close()
+
+    def get_attr(self, attr_name: str, indices=None) -> List[Any]:
+        return [getattr(self.env, attr_name)] * len(self._get_indices(indices))
+
+    def set_attr(self, attr_name: str, value: Any, indices=None) -> None:
+        # Every slot shares the template environment's parameters
+        setattr(self.env, attr_name, value)
+
+    def env_method(self, method_name: str, *method_args, indices=None, **method_kwargs) -> List:
+        result = getattr(self.env, method_name)(*method_args, **method_kwargs)
+        return [result] * len(self._get_indices(indices))
+
+    def env_is_wrapped(self, wrapper_class, indices=None) -> List[bool]:
+        return [False] * len(self._get_indices(indices))
+
+    def _get_indices(self, indices) -> Sequence[int]:
+        if indices is None:
+            return range(self.num_envs)
+        if isinstance(indices, int):
+            return [indices]
+        return indices
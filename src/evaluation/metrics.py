@@ -166,45 +166,27 @@ class HedgingEvaluator:
         Returns:
             result: Episode evaluation result
         """
-        # Initialize strategy
-        initial_premium = strategy.initialize()
-
-        # Track metrics
-        pnl_history = []
-        position_history = []
-        hedge_errors = []
-
-        # Simulate hedging over the price path
-        for step in range(self.n_steps):
-            S = price_path[step]
-            tau = self.T - step * self.dt
-
-            # Rebalance hedge
-            if step > 0:
-                strategy.rebalance(S, tau)
-
-            # Calculate current portfolio value and PnL
-            portfolio_info = strategy.get_portfolio_value(S, tau)
-            pnl = portfolio_info["portfolio_value"] - initial_premium
-            pnl_history.append(pnl)
-            position_history.append(strategy.stock_position)
-
-            # Calculate hedge error vs delta hedge
-            if tau > 0:
-                greeks = self.bs_model.greeks(
-                    S=S, K=self.K, T=tau, r=self.r, sigma=self.sigma, option_type=self.option_type
-                )
-                optimal_delta = greeks["delta"]
-                hedge_error = abs(strategy.stock_position - optimal_delta)
-                hedge_errors.append(hedge_error)
-
-        # Final evaluation at maturity
+        # Hedge along the path
+        pnl_array, position_history, final_pnl = strategy.run_episode(price_path, self.dt)
+
+        # Reference deltas for the whole path in one vectorized call
+        taus = self.T - np.arange(self.n_steps) * self.dt
+        optimal_deltas = self.bs_model.delta(
+            S=price_path[: self.n_steps],
+            K=self.K,
+            T=taus,
+            r=self.r,
+            sigma=self.sigma,
+            option_type=self.option_type,
+        )
+
+        # Hedge error vs delta hedge (only while the option is alive)
+        live = taus > 0
+        hedge_errors = np.abs(position_history[live] - optimal_deltas[live])
+
         S_final = price_path[-1]
-        final_portfolio = strategy.get_portfolio_value(S_final, 0.0)
-        final_pnl = final_portfolio["portfolio_value"] - initial_premium
 
         # Calculate metrics
-        pnl_array = np.array(pnl_history)
         sharpe_ratio = np.mean(pnl_array) / (np.std(pnl_array) + 1e-8)
         max_drawdown = np.min(pnl_array)
 
@@ -215,8 +197,8 @@ class HedgingEvaluator:
             net_pnl=final_pnl - strategy.total_costs,
             sharpe_ratio=sharpe_ratio,
             max_drawdown=max_drawdown,
-            hedge_error_mean=np.mean(hedge_errors) if hedge_errors else 0.0,
-            hedge_error_std=np.std(hedge_errors) if hedge_errors else 0.0,
+            hedge_error_mean=np.mean(hedge_errors) if hedge_errors.size else 0.0,
+            hedge_error_std=np.std(hedge_errors) if hedge_errors.size else 0.0,
             num_rebalances=self.n_steps,
             avg_position=np.mean(position_history),
             final_stock_price=S_final,
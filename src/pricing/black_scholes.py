@@ -1,9 +1,49 @@
 """Black-Scholes option pricing model."""
 
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple, Union
 
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
+
+ArrayLike = Union[float, np.ndarray]
+
+# Normalizing constant of the standard normal density, shared by the pricing
+# code and the compiled kernels
+INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+
+def norm_pdf(x: ArrayLike) -> ArrayLike:
+    """Standard normal density, without scipy.stats' per-call overhead."""
+    return np.exp(-0.5 * x * x) * INV_SQRT_2PI
+
+
+def _compute_d1_d2(
+    S: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, sigma: ArrayLike
+) -> Tuple[ArrayLike, ArrayLike]:
+    sqrt_T = np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+    return d1, d1 - sigma * sqrt_T
+
+
+@lru_cache(maxsize=1024)
+def _cached_d1_d2(S: float, K: float, T: float, r: float, sigma: float) -> Tuple[float, float]:
+    return _compute_d1_d2(S, K, T, r, sigma)
+
+
+def _d1_d2(
+    S: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, sigma: ArrayLike
+) -> Tuple[ArrayLike, ArrayLike]:
+    """
+    Black-Scholes d1/d2 terms, cached for repeated scalar (S, K, T) lookups.
+
+    The hedging environment prices and takes Greeks at the same state several
+    times per step, so identical keys are common. Array inputs bypass the
+    cache and are computed element-wise.
+    """
+    if all(np.ndim(x) == 0 for x in (S, K, T, r, sigma)):
+        return _cached_d1_d2(float(S), float(K), float(T), float(r), float(sigma))
+    return _compute_d1_d2(S, K, T, r, sigma)
 
 
 class BlackScholesModel:
@@ -33,13 +73,12 @@ class BlackScholesModel:
             else:
                 return max(K - S, 0)
 
-        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
+        d1, d2 = _d1_d2(S, K, T, r, sigma)
 
         if option_type == "call":
-            price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+            price = S * ndtr(d1) - K * np.exp(-r * T) * ndtr(d2)
         elif option_type == "put":
-            price = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+            price = K * np.exp(-r * T) * ndtr(-d2) - S * ndtr(-d1)
         else:
             raise ValueError(f"Invalid option_type: {option_type}")
 
@@ -72,35 +111,37 @@ class BlackScholesModel:
                 "rho": 0.0,
             }
 
-        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
+        d1, d2 = _d1_d2(S, K, T, r, sigma)
 
         # Delta
         if option_type == "call":
-            delta = norm.cdf(d1)
+            delta = ndtr(d1)
         else:
-            delta = -norm.cdf(-d1)
+            delta = -ndtr(-d1)
+
+        # Standard normal density at d1
+        pdf_d1 = norm_pdf(d1)
 
         # Gamma (same for calls and puts)
-        gamma = norm.pdf(d1) / (S * sigma * np.sqrt(T))
+        gamma = pdf_d1 / (S * sigma * np.sqrt(T))
 
         # Vega (same for calls and puts)
-        vega = S * norm.pdf(d1) * np.sqrt(T) / 100  # Divided by 100 for 1% change
+        vega = S * pdf_d1 * np.sqrt(T) / 100  # Divided by 100 for 1% change
 
         # Theta
-        term1 = -(S * norm.pdf(d1) * sigma) / (2 * np.sqrt(T))
+        term1 = -(S * pdf_d1 * sigma) / (2 * np.sqrt(T))
         if option_type == "call":
-            term2 = -r * K * np.exp(-r * T) * norm.cdf(d2)
+            term2 = -r * K * np.exp(-r * T) * ndtr(d2)
             theta = (term1 + term2) / 365  # Per day
         else:
-            term2 = r * K * np.exp(-r * T) * norm.cdf(-d2)
+            term2 = r * K * np.exp(-r * T) * ndtr(-d2)
             theta = (term1 + term2) / 365  # Per day
 
         # Rho
         if option_type == "call":
-            rho = K * T * np.exp(-r * T) * norm.cdf(d2) / 100  # For 1% rate change
+            rho = K * T * np.exp(-r * T) * ndtr(d2) / 100  # For 1% rate change
         else:
-            rho = -K * T * np.exp(-r * T) * norm.cdf(-d2) / 100
+            rho = -K * T * np.exp(-r * T) * ndtr(-d2) / 100
 
         return {
             "delta": delta,
@@ -110,6 +151,46 @@ class BlackScholesModel:
             "rho": rho,
         }
 
+    @staticmethod
+    def delta(
+        S: ArrayLike,
+        K: float,
+        T: ArrayLike,
+        r: float,
+        sigma: float,
+        option_type: str = "call",
+    ) -> np.ndarray:
+        """
+        Vectorized Black-Scholes delta over arrays of spots and maturities.
+
+        Entries with T <= 0 follow the same expiry convention as ``greeks``.
+
+        Args:
+            S: Spot price(s)
+            K: Strike price
+            T: Time(s) to maturity (years)
+            r: Risk-free rate
+            sigma: Volatility
+            option_type: 'call' or 'put'
+
+        Returns:
+            Array of deltas broadcast over S and T
+        """
+        S, T = np.broadcast_arrays(np.asarray(S, dtype=float), np.asarray(T, dtype=float))
+        live = T > 0
+        safe_T = np.where(live, T, 1.0)
+
+        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * safe_T) / (sigma * np.sqrt(safe_T))
+
+        if option_type == "call":
+            delta = ndtr(d1)
+            expired = (S > K).astype(float)
+        else:
+            delta = -ndtr(-d1)
+            expired = np.zeros_like(S)
+
+        return np.where(live, delta, expired)
+
 
 def compute_greeks(
     S: float, K: float, T: float, r: float, sigma: float, option_type: str = "call"
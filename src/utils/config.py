@@ -24,6 +24,9 @@ class Settings(BaseSettings):
     # API Server
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    WORKERS: int = 1
+    ENV_STORE_MAXSIZE: int = 1024  # Live environments kept per worker
+    ENV_STORE_TTL_SECONDS: int = 3600
 
     # Security
     SECRET_KEY: str = Field(
@@ -84,9 +87,14 @@ class Settings(BaseSettings):
             os.makedirs(dir_path, exist_ok=True)
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get cached settings instance."""
+    """
+    Get cached settings instance.
+
+    Environment parsing happens once; routes receive the same instance via
+    ``Depends(get_settings)``.
+    """
     return Settings()
 
 
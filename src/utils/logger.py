@@ -1,8 +1,14 @@
 """Logging configuration."""
 
+import atexit
 import logging
+import multiprocessing.util
+import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, WatchedFileHandler
 from pathlib import Path
+from typing import List, Optional
 
 from pythonjsonlogger import jsonlogger
 
@@ -10,24 +16,16 @@ from src.utils.config import get_settings
 
 settings = get_settings()
 
+# Records from every configured logger go through one queue; a background
+# listener thread does the formatting for and writing to the real handlers
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+_queue_handlers: List[QueueHandler] = []
 
-def setup_logger(name: str) -> logging.Logger:
-    """
-    Set up logger with JSON formatting.
 
-    Args:
-        name: Logger name (usually __name__)
-
-    Returns:
-        Configured logger instance
-    """
-    logger = logging.getLogger(name)
-
-    # Avoid duplicate handlers
-    if logger.handlers:
-        return logger
-
-    logger.setLevel(getattr(logging, settings.LOG_LEVEL.upper()))
+def _start_listener() -> None:
+    """Create the console and file handlers and start the queue listener."""
+    global _listener
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -47,16 +45,79 @@ def setup_logger(name: str) -> logging.Logger:
         )
 
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
-    # File handler
+    # File handler; every worker process appends to the same file, so rotation
+    # is left to an external tool and the handler reopens the file when it moves
     log_dir = Path(settings.LOGS_DIR)
     log_dir.mkdir(exist_ok=True)
     log_file = log_dir / f"{settings.APP_NAME.lower().replace(' ', '_')}.log"
 
-    file_handler = logging.FileHandler(log_file)
+    file_handler = WatchedFileHandler(log_file)
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    _listener = QueueListener(_log_queue, console_handler, file_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    """Flush and stop the queue listener if its thread is still running."""
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
+
+
+def _restart_listener_in_child() -> None:
+    """
+    Give a forked process its own log queue and listener thread.
+
+    The child inherits ``_listener`` and the queue handlers but not the
+    listener thread, so without this its records would never be written.
+    """
+    global _log_queue
+    if _listener is None:
+        return
+
+    _log_queue = queue.SimpleQueue()
+    for handler in _queue_handlers:
+        handler.queue = _log_queue
+    _start_listener()
+    # Pool workers leave through os._exit, which skips atexit; multiprocessing
+    # still runs its own finalizers, so flush the queue from one of those
+    multiprocessing.util.Finalize(None, _stop_listener, exitpriority=10)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_in_child)
+
+
+def setup_logger(name: str) -> logging.Logger:
+    """
+    Set up logger with JSON formatting.
+
+    The logger only enqueues records; console and file output happen on a
+    background thread so logging never blocks the caller on I/O.
+
+    Args:
+        name: Logger name (usually __name__)
+
+    Returns:
+        Configured logger instance
+    """
+    logger = logging.getLogger(name)
+
+    # Avoid duplicate handlers
+    if logger.handlers:
+        return logger
+
+    logger.setLevel(getattr(logging, settings.LOG_LEVEL.upper()))
+
+    if _listener is None:
+        _start_listener()
+    handler = QueueHandler(_log_queue)
+    _queue_handlers.append(handler)
+    logger.addHandler(handler)
 
     return logger
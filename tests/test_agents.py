@@ -2,16 +2,22 @@
 Tests for RL agent implementations.
 """
 
+import os
 import tempfile
 from pathlib import Path
 
 import numpy as np
+import optuna
 import pytest
+import torch
+from stable_baselines3.common.monitor import Monitor
 
+from src.agents.config import ENV_CONFIGS
 from src.agents.evaluator import AgentEvaluator
 from src.agents.ppo_agent import PPOHedgingAgent
+from src.agents.replay_buffer import TorchReplayBuffer
 from src.agents.sac_agent import SACHedgingAgent
-from src.agents.trainer import AgentTrainer
+from src.agents.trainer import AgentTrainer, _TrialPruningCallback
 from src.environments.hedging_env import OptionHedgingEnv
 
 
@@ -71,6 +77,58 @@ class TestPPOAgent:
 
             np.testing.assert_array_almost_equal(action1, action2)
 
+    def test_predict_batch(self):
+        """Test batched prediction matches per-observation predict."""
+        env = OptionHedgingEnv()
+        agent = PPOHedgingAgent(env=env, seed=42)
+
+        obs_batch = np.stack([env.reset(seed=seed)[0] for seed in range(4)])
+        actions = agent.predict_batch(obs_batch)
+        expected = np.stack([agent.predict(obs)[0] for obs in obs_batch])
+
+        assert actions.shape == (4, 1)
+        np.testing.assert_array_almost_equal(actions, expected)
+
+        # Smaller batches reuse the existing buffer
+        buffer = agent._obs_buf
+        np.testing.assert_array_almost_equal(agent.predict_batch(obs_batch[:2]), expected[:2])
+        assert agent._obs_buf is buffer
+
+    def test_compile_policy(self):
+        """Test compiled inference matches the eager policy."""
+        env = OptionHedgingEnv()
+        agent = PPOHedgingAgent(env=env, seed=42, device="cpu")
+
+        obs_batch = np.stack([env.reset(seed=seed)[0] for seed in range(4)])
+        expected = agent.predict_batch(obs_batch)
+
+        agent.compile_policy(mode=None, backend="eager")
+        np.testing.assert_array_almost_equal(agent.predict_batch(obs_batch), expected)
+
+    def test_build_eval_policy(self):
+        """Test traced actor matches the full deterministic policy."""
+        env = OptionHedgingEnv()
+        agent = PPOHedgingAgent(env=env, seed=42, device="cpu")
+
+        obs_batch = np.stack([env.reset(seed=seed)[0] for seed in range(4)])
+        expected = agent.predict_batch(obs_batch)
+        expected_single, _ = agent.predict(obs_batch[0])
+
+        agent.build_eval_policy()
+        np.testing.assert_array_almost_equal(agent.predict_batch(obs_batch), expected)
+
+        action, _ = agent.predict(obs_batch[0])
+        assert action.shape == expected_single.shape
+        np.testing.assert_array_almost_equal(action, expected_single)
+
+    def test_enable_cuda_graph_requires_cuda(self):
+        """Test CUDA graph capture is rejected for CPU models."""
+        env = OptionHedgingEnv()
+        agent = PPOHedgingAgent(env=env, seed=42, device="cpu")
+
+        with pytest.raises(ValueError):
+            agent.enable_cuda_graph(batch_size=4)
+
     def test_get_parameters(self):
         """Test getting agent hyperparameters."""
         env = OptionHedgingEnv()
@@ -106,6 +164,82 @@ class TestSACAgent:
         assert action.shape == (1,)  # Single continuous action
         assert -2.0 <= action[0] <= 2.0  # Within action space
 
+    def test_amp_ignored_on_cpu(self):
+        """Test SAC agent leaves critics in float32 when AMP is requested on CPU."""
+        env = OptionHedgingEnv(n_steps=10)
+        agent = SACHedgingAgent(env=env, seed=42, verbose=0, device="cpu", amp=True)
+
+        assert "forward" not in vars(agent.model.critic)
+        assert "forward" not in vars(agent.model.critic_target)
+        agent.train(total_timesteps=20)
+
+    def test_replay_buffer_shares_observations(self):
+        """Test SAC replay buffer keeps a single observation ring."""
+        env = OptionHedgingEnv(n_steps=10)
+        agent = SACHedgingAgent(env=env, seed=42, verbose=0, buffer_size=1000, learning_starts=20)
+        agent.train(total_timesteps=40)
+
+        buffer = agent.model.replay_buffer
+        assert buffer.optimize_memory_usage
+        assert not hasattr(buffer, "next_observations")
+        batch = buffer.sample(8)
+        assert batch.next_observations.shape == batch.observations.shape
+
+    def test_predict_batch(self):
+        """Test batched SAC predictions match SB3's predict."""
+        env = OptionHedgingEnv()
+        agent = SACHedgingAgent(env=env, seed=42, device="cpu")
+        obs_batch = np.stack([env.reset(seed=i)[0] for i in range(4)])
+
+        expected, _ = agent.model.predict(obs_batch, deterministic=True)
+        actions = agent.predict_batch(obs_batch)
+
+        assert actions.shape == (4, 1)
+        np.testing.assert_allclose(actions, expected, atol=1e-6)
+        np.testing.assert_allclose(agent.predict(obs_batch[0])[0], expected[0], atol=1e-6)
+
+    def test_compile_networks(self):
+        """Test compiled SAC networks match eager outputs, train and keep their parameter names."""
+        env = OptionHedgingEnv(n_steps=10)
+        agent = SACHedgingAgent(env=env, seed=42, verbose=0, device="cpu", learning_starts=20)
+        policy = agent.model.policy
+        keys = set(policy.state_dict())
+
+        obs_batch = np.stack([env.reset(seed=seed)[0] for seed in range(4)])
+        obs = torch.as_tensor(obs_batch)
+        with torch.no_grad():
+            actions = policy.actor(obs, deterministic=True)
+            expected_q = [q.numpy() for q in policy.critic(obs, actions)]
+
+        agent.compile_networks(mode=None)
+
+        with torch.no_grad():
+            np.testing.assert_allclose(
+                policy.actor(obs, deterministic=True).numpy(), actions.numpy(), atol=1e-6
+            )
+            for q, expected in zip(policy.critic(obs, actions), expected_q):
+                np.testing.assert_allclose(q.numpy(), expected, atol=1e-6)
+
+        agent.train(total_timesteps=30)
+        assert set(agent.model.policy.state_dict()) == keys
+
+    def test_torch_replay_buffer(self):
+        """Test SAC can keep its replay buffer in torch tensors on the training device."""
+        env = OptionHedgingEnv(n_steps=10)
+        agent = SACHedgingAgent(
+            env=env, seed=42, verbose=0, device="cpu", buffer_device="cpu", learning_starts=20
+        )
+        agent.train(total_timesteps=40)
+
+        buffer = agent.model.replay_buffer
+        assert isinstance(buffer, TorchReplayBuffer)
+        assert isinstance(buffer.observations, torch.Tensor)
+
+        batch = buffer.sample(16)
+        assert batch.observations.shape == (16, 11)
+        assert batch.rewards.shape == (16, 1)
+        assert batch.observations.device == agent.model.device
+
     def test_train_quick(self):
         """Test SAC agent can train for a few steps."""
         env = OptionHedgingEnv(n_steps=10)
@@ -154,6 +288,56 @@ class TestSACAgent:
         assert params["gamma"] == 0.99
 
 
+class TestAgentConfig:
+    """Test cases for agent configuration presets."""
+
+    def test_get_config_returns_independent_copy(self):
+        """Test mutating a returned config does not leak into the preset."""
+        from src.agents.config import get_config
+
+        config = get_config("PPO", "default")
+        config["learning_rate"] = 1.0
+        config["policy_kwargs"]["net_arch"]["pi"].append(8)
+
+        fresh = get_config("PPO", "default")
+        assert fresh["learning_rate"] == 3e-4
+        assert fresh["policy_kwargs"]["net_arch"]["pi"] == [256, 256]
+
+    def test_get_config_overrides(self):
+        """Test overrides are applied on top of the preset."""
+        from src.agents.config import get_config
+
+        config = get_config("SAC", "deep", learning_rate=1e-3)
+
+        assert config["learning_rate"] == 1e-3
+        assert config["policy_kwargs"]["net_arch"] == [512, 512, 256]
+
+        with pytest.raises(ValueError):
+            get_config("INVALID")
+
+    def test_compiled_search_spaces(self):
+        """Test compiled samplers draw every parameter within its bounds."""
+        import optuna
+
+        from src.agents.config import COMPILED_SEARCH_SPACES, OPTUNA_SEARCH_SPACES
+
+        trial = optuna.create_study().ask()
+        params = {name: sample(trial) for name, sample in COMPILED_SEARCH_SPACES["PPO"]}
+
+        assert set(params) == set(OPTUNA_SEARCH_SPACES["PPO"])
+        assert 1e-5 <= params["learning_rate"] <= 1e-3
+        assert params["n_steps"] in OPTUNA_SEARCH_SPACES["PPO"]["n_steps"]["choices"]
+
+    def test_invalid_search_space_rejected(self):
+        """Test malformed search-space specs fail at compile time."""
+        from src.agents.config import _compile_param
+
+        with pytest.raises(ValueError):
+            _compile_param("lr", {"type": "loguniform", "low": 1e-3, "high": 1e-5})
+        with pytest.raises(ValueError):
+            _compile_param("lr", {"type": "gaussian", "low": 0.0, "high": 1.0})
+
+
 class TestAgentTrainer:
     """Test cases for agent trainer."""
 
@@ -180,6 +364,46 @@ class TestAgentTrainer:
         assert env_easy.n_steps == 50
         assert env_hard.n_steps == 252
 
+    def test_create_vec_env(self):
+        """Test batched training environments share the difficulty settings."""
+        trainer = AgentTrainer(agent_type="PPO", seed=42, n_envs=3, use_subprocess=False)
+
+        vec_env = trainer.create_vec_env(difficulty="easy", monitor_wrapper=False)
+
+        assert vec_env.num_envs == 3
+        assert vec_env.get_attr("sigma") == [0.15] * 3
+        assert vec_env.reset().shape == (3, 11)
+        vec_env.close()
+
+        with pytest.raises(ValueError):
+            AgentTrainer(agent_type="PPO", n_envs=0)
+
+    def test_eval_env_reused(self):
+        """Test evaluation environments are reused and reconfigured in place."""
+        trainer = AgentTrainer(agent_type="PPO", seed=42)
+
+        easy = trainer._eval_env({**ENV_CONFIGS["easy"], "n_steps": 252})
+        hard = trainer._eval_env({**ENV_CONFIGS["hard"], "n_steps": 252})
+
+        assert hard is easy
+        assert hard.unwrapped.sigma == ENV_CONFIGS["hard"]["sigma"]
+        assert hard.unwrapped.risk_penalty == ENV_CONFIGS["hard"]["risk_penalty"]
+        assert trainer._eval_env(ENV_CONFIGS["easy"]) is not hard
+
+    @pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+    def test_subprocess_workers_pinned(self):
+        """Test environment worker processes are pinned to distinct CPUs."""
+        trainer = AgentTrainer(agent_type="PPO", seed=42, n_envs=2, torch_threads=2)
+        vec_env = trainer.create_vec_env(difficulty="easy", monitor_wrapper=False)
+
+        try:
+            cpus = sorted(os.sched_getaffinity(0))
+            for rank, process in enumerate(vec_env.processes):
+                assert os.sched_getaffinity(process.pid) == {cpus[rank % len(cpus)]}
+            assert torch.get_num_threads() == min(2, os.cpu_count())
+        finally:
+            vec_env.close()
+
     def test_quick_train_ppo(self):
         """Test quick training for PPO."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -205,6 +429,54 @@ class TestAgentTrainer:
             assert isinstance(agent, SACHedgingAgent)
             assert agent.model is not None
 
+    def test_hyperparameter_search_parallel(self):
+        """Test parallel Optuna trials are recorded in a persistent study."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            trainer = AgentTrainer(agent_type="SAC", output_dir=tmpdir, seed=42)
+
+            best_params = trainer.hyperparameter_search(
+                n_trials=2, n_startup_trials=2, n_timesteps=200, study_name="test", n_jobs=2
+            )
+
+            study = optuna.load_study(
+                study_name="test", storage=f"sqlite:///{tmpdir}/optuna_test.db"
+            )
+            assert len(study.trials) == 2
+            assert best_params == study.best_params
+
+    def test_hyperparameter_search_reuses_train_env(self, monkeypatch):
+        """Test sequential trials share one training environment."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            trainer = AgentTrainer(agent_type="SAC", output_dir=tmpdir, seed=42)
+            created = []
+            create_vec_env = trainer.create_vec_env
+
+            def counting_create_vec_env(*args, **kwargs):
+                created.append(create_vec_env(*args, **kwargs))
+                return created[-1]
+
+            monkeypatch.setattr(trainer, "create_vec_env", counting_create_vec_env)
+            trainer.hyperparameter_search(
+                n_trials=2, n_startup_trials=2, n_timesteps=100, study_name="reuse", n_jobs=1
+            )
+
+            assert len(created) == 1
+
+    def test_trial_pruning_callback(self):
+        """Test a trial reporting a poor reward is stopped early."""
+        study = optuna.create_study(
+            direction="maximize", pruner=optuna.pruners.ThresholdPruner(lower=1e9)
+        )
+        trial = study.ask()
+        agent = PPOHedgingAgent(env=OptionHedgingEnv(n_steps=10), seed=42, n_steps=64, verbose=0)
+        callback = _TrialPruningCallback(trial, Monitor(OptionHedgingEnv(n_steps=10)), eval_freq=64)
+
+        agent.train(total_timesteps=640, callbacks=[callback])
+
+        assert callback.is_pruned
+        assert agent.model.num_timesteps < 640
+        assert list(study.trials[0].intermediate_values) == [64]
+
     def test_invalid_agent_type(self):
         """Test trainer raises error for invalid agent type."""
         trainer = AgentTrainer(agent_type="INVALID")
@@ -241,6 +513,40 @@ class TestAgentEvaluator:
         assert "sharpe_ratio" in results
         assert len(results["episode_rewards"]) == 3
 
+    def test_evaluate_rl_agent_parallel_envs(self):
+        """Test evaluation with several environment copies stepped together."""
+        env = OptionHedgingEnv(n_steps=10)
+        evaluator = AgentEvaluator(
+            env=env,
+            n_episodes=5,
+            seed=42,
+            env_fn=lambda: OptionHedgingEnv(n_steps=10),
+            n_envs=2,
+        )
+        agent = PPOHedgingAgent(env=env, seed=42, verbose=0)
+
+        results = evaluator.evaluate_rl_agent(agent, agent_name="Parallel PPO")
+        evaluator.close()
+
+        assert len(results["episode_rewards"]) == 5
+        assert len(results["episode_pnls"]) == 5
+        assert np.isfinite(results["mean_reward"])
+
+        with pytest.raises(ValueError):
+            AgentEvaluator(env=env, n_envs=2)
+
+    def test_evaluate_rl_agent_batched(self):
+        """Test batched evaluation rolls out every episode in chunks."""
+        env = OptionHedgingEnv(n_steps=10)
+        evaluator = AgentEvaluator(env=env, n_episodes=5, seed=42)
+        agent = PPOHedgingAgent(env=env, seed=42, verbose=0)
+
+        results = evaluator.evaluate_rl_agent_batched(agent, "Batched PPO", n_parallel=2)
+
+        assert len(results["episode_rewards"]) == 5
+        assert np.isfinite(results["episode_pnls"]).all()
+        assert 0.0 <= results["success_rate"] <= 1.0
+
     def test_evaluate_baseline(self):
         """Test evaluation of baseline strategy."""
         from src.baselines.hedging_strategies import DeltaHedging
@@ -256,6 +562,47 @@ class TestAgentEvaluator:
         assert "sharpe_ratio" in results
         assert len(results["episode_rewards"]) == 3
 
+    @pytest.mark.parametrize("strategy_name", ["delta", "delta_gamma_vega", "min_variance"])
+    def test_shared_paths_match_env_rollout(self, strategy_name):
+        """Test baselines on cached shared paths match stepping the environment."""
+        from src.baselines.hedging_strategies import (
+            DeltaGammaVegaHedging,
+            DeltaHedging,
+            MinimumVarianceHedging,
+        )
+
+        strategy_class = {
+            "delta": DeltaHedging,
+            "delta_gamma_vega": DeltaGammaVegaHedging,
+            "min_variance": MinimumVarianceHedging,
+        }[strategy_name]
+
+        env = OptionHedgingEnv(n_steps=10)
+        evaluator = AgentEvaluator(env=env, n_episodes=3, seed=42)
+
+        stepped = evaluator.evaluate_baseline(strategy_class, "stepped")
+        cached = evaluator.evaluate_baseline(
+            strategy_class, "cached", cached_paths=evaluator._simulate_shared_paths()
+        )
+
+        np.testing.assert_allclose(cached["episode_pnls"], stepped["episode_pnls"], rtol=1e-4)
+        np.testing.assert_allclose(cached["episode_rewards"], stepped["episode_rewards"], rtol=1e-4)
+
+    def test_parallel_baselines_match_sequential(self):
+        """Test baselines evaluated in worker processes match sequential results."""
+        env = OptionHedgingEnv(n_steps=10)
+
+        sequential = AgentEvaluator(env=env, n_episodes=3, seed=42).evaluate_all_baselines()
+        parallel = AgentEvaluator(env=env, n_episodes=3, seed=42).evaluate_all_baselines(
+            n_workers=2
+        )
+
+        assert list(parallel) == list(sequential)
+        for name, results in sequential.items():
+            np.testing.assert_allclose(
+                parallel[name]["episode_rewards"], results["episode_rewards"]
+            )
+
     def test_compare_all(self):
         """Test comparison of multiple strategies."""
         env = OptionHedgingEnv(n_steps=10)
@@ -271,6 +618,44 @@ class TestAgentEvaluator:
         assert "Strategy" in df.columns
         assert "Mean Reward" in df.columns
         assert "Sharpe Ratio" in df.columns
+        assert df["Mean Reward"].is_monotonic_decreasing
+        assert set(df["Strategy"]) == set(evaluator.results)
+
+    def test_plot_comparison_reuses_figure(self):
+        """Test saving comparison plots reuses one figure across calls."""
+        import matplotlib
+
+        matplotlib.use("Agg")
+        from src.baselines.hedging_strategies import DeltaHedging
+
+        env = OptionHedgingEnv(n_steps=10)
+        evaluator = AgentEvaluator(env=env, n_episodes=2, seed=42)
+        evaluator.evaluate_baseline(DeltaHedging, "Delta Hedging")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            save_path = Path(tmpdir) / "comparison.png"
+            evaluator.plot_comparison(save_path=str(save_path))
+            figure = evaluator._figure
+            evaluator.plot_comparison(save_path=str(save_path), dpi=72)
+
+            assert save_path.exists()
+            assert evaluator._figure is figure
+
+    def test_generate_report_ranking(self):
+        """Test report ranks strategies by mean reward and tracks new results."""
+        from src.baselines.hedging_strategies import DeltaGammaHedging, DeltaHedging
+
+        env = OptionHedgingEnv(n_steps=10)
+        evaluator = AgentEvaluator(env=env, n_episodes=2, seed=42)
+        evaluator.evaluate_baseline(DeltaHedging, "Delta Hedging")
+        evaluator.generate_report()
+
+        evaluator.evaluate_baseline(DeltaGammaHedging, "Delta-Gamma Hedging")
+        report = evaluator.generate_report()
+
+        best = max(evaluator.results, key=lambda name: evaluator.results[name]["mean_reward"])
+        assert f"BEST STRATEGY: {best}" in report
+        assert "Delta-Gamma Hedging:" in report
 
 
 class TestEndToEnd:
@@ -0,0 +1,71 @@
+"""
+Tests for the API response helpers.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+responses = pytest.importorskip("src.api.responses")
+schemas = pytest.importorskip("src.api.schemas")
+
+
+def _evaluation_row(**overrides):
+    """ORM-like evaluation row with aware and naive timestamps."""
+    row = {
+        "id": uuid.uuid4(),
+        "experiment_id": uuid.uuid4(),
+        "name": "backtest",
+        "test_dataset_id": None,
+        "test_start_date": datetime(2024, 1, 2, 9, 30),
+        "test_end_date": None,
+        "sharpe_ratio": 1.25,
+        "max_drawdown": -0.1,
+        "total_pnl": 42.0,
+        "win_rate": None,
+        "avg_trade_pnl": None,
+        "value_at_risk": None,
+        "conditional_var": None,
+        "hedge_error_mean": 0.01,
+        "hedge_error_std": 0.02,
+        "transaction_cost_total": 1.5,
+        "num_rebalances": 252,
+        "metrics": {"note": None},
+        "results_path": None,
+        "created_at": datetime(2024, 1, 3, 12, 0, 0, 123456, tzinfo=timezone.utc),
+        "updated_at": None,
+    }
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+class TestResponseSerialization:
+    """Validated and trusted responses must serialize a record identically."""
+
+    def test_single_record_matches(self):
+        """Test orm_response and trusted_response write the same bytes for one row."""
+        row = _evaluation_row()
+
+        validated = responses.orm_response(schemas.Evaluation, row)
+        trusted = responses.trusted_response(schemas.Evaluation, row)
+
+        assert validated.body == trusted.body
+        body = orjson.loads(validated.body)
+        assert body["created_at"] == "2024-01-03T12:00:00.123456+00:00"
+        assert "test_end_date" not in body
+
+    def test_many_records_match(self):
+        """Test list serialization agrees between the two paths."""
+        rows = [_evaluation_row(), _evaluation_row(sharpe_ratio=None)]
+
+        validated = responses.orm_response(schemas.Evaluation, rows, many=True)
+        trusted = responses.trusted_response(schemas.Evaluation, rows, many=True)
+
+        assert validated.body == trusted.body
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
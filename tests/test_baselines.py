@@ -3,8 +3,10 @@ Tests for baseline hedging strategies.
 """
 
 import numpy as np
+import pandas as pd
 import pytest
 
+from src.baselines.advanced_models import LocalVolatilityHedging, SABRHedging
 from src.baselines.hedging_strategies import (
     DeltaGammaHedging,
     DeltaGammaVegaHedging,
@@ -69,6 +71,34 @@ class TestDeltaHedging:
         # Portfolio value should be close to zero (hedged)
         assert abs(portfolio_info["portfolio_value"]) < premium
 
+    def test_vectorized_positions_match_scalar(self):
+        """Test hedging a whole path at once matches step-by-step hedging."""
+        strategy = DeltaHedging(S0=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2, option_type="call")
+
+        S_path = np.array([90.0, 100.0, 110.0, 105.0])
+        tau_grid = np.array([1.0, 0.5, 0.1, 0.0])
+
+        batch = strategy.get_hedge_positions(S_path, tau_grid)["stock"]
+        scalar = [strategy.get_hedge_positions(S, tau)["stock"] for S, tau in zip(S_path, tau_grid)]
+
+        np.testing.assert_allclose(batch, scalar)
+        assert batch[-1] == 0.0
+        for S, tau, position in zip(S_path[:-1], tau_grid[:-1], batch[:-1]):
+            delta = BlackScholesModel.greeks(S, 100.0, tau, 0.05, 0.2, "call")["delta"]
+            assert position == pytest.approx(delta)
+
+    def test_reset_reuses_instance(self):
+        """Test reset restores the freshly constructed state."""
+        strategy = DeltaHedging(S0=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2, option_type="call")
+        strategy.initialize()
+        strategy.rebalance(S=110.0, tau=0.9)
+
+        strategy.reset()
+
+        assert strategy.stock_position == 0.0
+        assert strategy.cash == 0.0
+        assert strategy.total_costs == 0.0
+
 
 class TestDeltaGammaHedging:
     """Test cases for Delta-Gamma hedging strategy."""
@@ -294,6 +324,172 @@ class TestStrategyComparison:
             assert strategy.total_costs > initial_costs
 
 
+class TestCompiledKernels:
+    """Test the compiled hedge kernels agree with the strategy classes."""
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_kernels_match_strategies(self, option_type):
+        """Test kernel positions equal the strategy hedge positions."""
+        from src.baselines._numba_kernels import delta_gamma_hedge_action, delta_hedge_action
+
+        params = dict(S0=100.0, K=105.0, T=1.0, r=0.05, sigma=0.25, option_type=option_type)
+        delta_strategy = DeltaHedging(**params)
+        gamma_strategy = DeltaGammaHedging(**params)
+        is_call = option_type == "call"
+
+        for S, tau in [(90.0, 0.9), (100.0, 0.5), (120.0, 0.05), (110.0, 0.0)]:
+            assert delta_hedge_action(S, 105.0, tau, 0.05, 0.25, is_call) == pytest.approx(
+                delta_strategy.get_hedge_positions(S, tau)["stock"]
+            )
+            assert delta_gamma_hedge_action(
+                S, 100.0, 105.0, tau, 0.05, 0.25, is_call
+            ) == pytest.approx(gamma_strategy.get_hedge_positions(S, tau)["stock"])
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    @pytest.mark.parametrize(
+        "strategy_class", [DeltaHedging, DeltaGammaHedging, DeltaGammaVegaHedging]
+    )
+    def test_episode_kernel_matches_stepped_episode(self, strategy_class, option_type):
+        """Test the compiled episode reproduces the rebalance-by-rebalance episode."""
+        params = dict(S0=100.0, K=105.0, T=0.5, r=0.05, sigma=0.25, option_type=option_type)
+        rng = np.random.default_rng(0)
+        price_path = 100.0 * np.exp(np.cumsum(np.r_[0.0, rng.normal(0, 0.02, 40)]))
+
+        compiled = strategy_class(**params)
+        stepped = strategy_class(**params)
+        stepped.episode_kernel = None
+
+        pnl, positions, final_pnl = compiled.run_episode(price_path, 0.5 / 40)
+        ref_pnl, ref_positions, ref_final_pnl = stepped.run_episode(price_path, 0.5 / 40)
+
+        np.testing.assert_allclose(pnl, ref_pnl, atol=1e-9)
+        np.testing.assert_allclose(positions, ref_positions, atol=1e-12)
+        assert final_pnl == pytest.approx(ref_final_pnl, abs=1e-9)
+        assert compiled.total_costs == pytest.approx(stepped.total_costs)
+        assert compiled.stock_position == pytest.approx(stepped.stock_position)
+
+
+class TestSABR:
+    """Test cases for the SABR smile model."""
+
+    def test_vectorized_matches_scalar(self):
+        """Test array inputs give the same vols as scalar calls, including ATM."""
+        model = SABRHedging(alpha=0.3, beta=0.5, rho=-0.3, nu=0.4)
+        strikes = np.array([80.0, 90.0, 100.0, 110.0, 120.0])
+
+        vols = model.implied_volatility(100.0, strikes, 0.5)
+
+        assert vols.shape == strikes.shape
+        for K, vol in zip(strikes, vols):
+            assert np.isclose(vol, model.implied_volatility(100.0, K, 0.5))
+        assert np.isclose(vols[2], 0.3 / 100.0**0.5)
+
+    def test_compute_hedge_batches_strikes(self):
+        """Test a hedge over a strike/maturity book matches per-option hedges."""
+        model = SABRHedging(alpha=0.3, beta=0.5, rho=-0.3, nu=0.4)
+        strikes = np.linspace(80.0, 120.0, 5)
+        maturities = np.linspace(0.25, 2.0, 5)
+
+        hedge = model.compute_hedge(100.0, strikes, maturities, 0.05)
+
+        for i, (K, T) in enumerate(zip(strikes, maturities)):
+            single = model.compute_hedge(100.0, K, T, 0.05)
+            for key in ("hedge_ratio", "delta", "vega"):
+                assert np.isclose(hedge[key][i], single[key])
+
+    def test_calibrate_recovers_smile(self):
+        """Test calibration fits quotes generated by the model itself."""
+        strikes = np.linspace(80.0, 120.0, 9)
+        target = SABRHedging(alpha=0.3, beta=0.5, rho=-0.3, nu=0.4)
+        market_data = pd.DataFrame(
+            {
+                "Strike": strikes,
+                "Maturity": 0.5,
+                "Forward": 100.0,
+                "ImpliedVol": target.implied_volatility(100.0, strikes, 0.5),
+            }
+        )
+
+        result = SABRHedging().calibrate(market_data)
+
+        assert result["rmse"] < 1e-3
+
+    def test_analytic_gradient_matches_finite_differences(self):
+        """Test the closed-form SABR gradient against central differences."""
+        from src.baselines._numba_kernels import sabr_implied_vol, sabr_implied_vol_grad
+
+        strikes = np.linspace(70.0, 130.0, 13)
+        forwards = np.full_like(strikes, 100.0)
+        maturities = np.linspace(0.25, 2.0, 13)
+        params = np.array([0.3, 0.5, -0.3, 0.4])
+        vols = np.empty_like(strikes)
+        grad = np.empty((len(strikes), 4))
+
+        sabr_implied_vol_grad(*params, forwards, strikes, maturities, vols, grad)
+
+        h = 1e-6
+        for j in range(4):
+            up, down = params.copy(), params.copy()
+            up[j] += h
+            down[j] -= h
+            expected = (
+                sabr_implied_vol(*up, forwards, strikes, maturities, np.empty_like(strikes))
+                - sabr_implied_vol(*down, forwards, strikes, maturities, np.empty_like(strikes))
+            ) / (2 * h)
+            np.testing.assert_allclose(grad[:, j], expected, atol=1e-8)
+
+
+class TestLocalVolatility:
+    """Test cases for the local volatility surface."""
+
+    @pytest.fixture
+    def model(self):
+        """Surface built from a smile grid with two quotes missing."""
+        rows = [
+            (K, T, 0.2 + 1e-4 * (K - 100.0) ** 2 + 0.01 * T)
+            for K in np.linspace(80.0, 120.0, 9)
+            for T in (0.25, 0.5, 1.0, 2.0)
+        ]
+        market_data = pd.DataFrame(rows, columns=["Strike", "Maturity", "ImpliedVol"])
+        model = LocalVolatilityHedging()
+        model.build_surface(market_data.drop(index=[5, 17]))
+        return model
+
+    def test_reproduces_quoted_nodes(self, model):
+        """Test the surface passes through the quoted volatilities."""
+        assert np.isclose(model.local_volatility(100.0, 90.0, 0.5), 0.2 + 1e-2 + 0.005)
+
+    def test_vectorized_matches_scalar(self, model):
+        """Test array queries match scalar queries and stay finite off the grid."""
+        strikes = np.array([85.0, 100.0, 150.0])
+        maturities = np.array([0.3, 1.5, 5.0])
+
+        vols = model.local_volatility(100.0, strikes, maturities)
+
+        assert vols.shape == strikes.shape
+        assert np.all(np.isfinite(vols))
+        for K, T, vol in zip(strikes, maturities, vols):
+            assert np.isclose(vol, model.local_volatility(100.0, K, T))
+
+
+class TestBlackScholesModel:
+    """Test cases for Black-Scholes pricing with array inputs."""
+
+    def test_price_and_greeks_accept_array_spot(self):
+        """Test an array of spots prices element-wise like scalar calls."""
+        spots = np.array([90.0, 100.0, 110.0])
+
+        prices = BlackScholesModel.price(spots, 100.0, 1.0, 0.05, 0.2, "call")
+        greeks = BlackScholesModel.greeks(spots, 100.0, 1.0, 0.05, 0.2, "put")
+
+        assert prices.shape == spots.shape
+        for i, S in enumerate(spots):
+            assert np.isclose(prices[i], BlackScholesModel.price(S, 100.0, 1.0, 0.05, 0.2))
+            single = BlackScholesModel.greeks(S, 100.0, 1.0, 0.05, 0.2, "put")
+            for name, value in single.items():
+                assert np.isclose(greeks[name][i], value)
+
+
 class TestEdgeCases:
     """Test edge cases for hedging strategies."""
 
@@ -8,6 +8,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from src.data.synthetic_data import GBMSimulator, HestonSimulator
 from src.data.validation import (
     DatasetValidator,
     MarketDataValidator,
@@ -363,3 +364,31 @@ class TestConvenienceFunctions:
 
         report = validate_synthetic_paths(paths, "GBM")
         assert report.is_valid
+
+
+class TestAntitheticSimulation:
+    """Test antithetic path generation in the synthetic simulators."""
+
+    def test_gbm_antithetic_paths_mirror(self):
+        """Test each GBM path is paired with its mirrored-shock partner."""
+        simulator = GBMSimulator(S0=100.0, mu=0.05, sigma=0.2, T=1.0, dt=1 / 50)
+        paths = simulator.simulate(200, antithetic=True)
+
+        assert paths.shape == (200, 51)
+        # Log returns of the pairs are symmetric around the drift
+        log_returns = np.diff(np.log(paths), axis=1)
+        drift = (0.05 - 0.5 * 0.2**2) / 50
+        np.testing.assert_allclose(log_returns[:100] - drift, drift - log_returns[100:])
+
+    def test_heston_antithetic_odd_path_count(self):
+        """Test Heston antithetic sampling handles an odd number of paths."""
+        simulator = HestonSimulator(T=1.0, dt=1 / 50)
+        prices, variances = simulator.simulate(101, antithetic=True)
+
+        assert prices.shape == variances.shape == (101, 51)
+        assert np.all(prices > 0)
+        assert np.all(variances >= 0)
+
+    def test_step_count_from_dt(self):
+        """Test the step count is not truncated by floating-point division."""
+        assert GBMSimulator(T=1.0, dt=1.0 / 93).n_steps == 93
@@ -6,7 +6,12 @@ import gymnasium as gym
 import numpy as np
 import pytest
 
+from stable_baselines3.common.env_util import make_vec_env
+from stable_baselines3.common.vec_env import DummyVecEnv
+
 from src.environments.hedging_env import OptionHedgingEnv
+from src.environments.shmem_vec_env import SharedMemoryVecEnv
+from src.environments.vectorized import OptionHedgingVecEnv, batch_reset, batch_step
 
 
 class TestOptionHedgingEnv:
@@ -67,6 +72,25 @@ class TestOptionHedgingEnv:
         assert isinstance(info, dict)
         assert env.current_step == 1
 
+    def test_step_matches_pricing_model(self):
+        """Test the compiled step agrees with the Black-Scholes model."""
+        env = OptionHedgingEnv(n_steps=10, option_type="put")
+        env.reset(seed=3)
+
+        first_obs, _, _, _, info = env.step(np.array([-0.4]))
+        second_obs, *_ = env.step(np.array([-0.4]))
+
+        tau = env.T - env.dt
+        greeks = env.bs_model.greeks(
+            S=info["S"], K=env.K, T=tau, r=env.r, sigma=env.sigma, option_type="put"
+        )
+        assert first_obs[6] == pytest.approx(greeks["delta"], rel=1e-6)
+        assert first_obs[7] == pytest.approx(greeks["gamma"], rel=1e-6)
+        assert first_obs is not second_obs
+        assert first_obs[0] == pytest.approx(info["S"] / env.K, rel=1e-6)
+        for name, value in greeks.items():
+            assert info["greeks"][name] == pytest.approx(value, rel=1e-9, abs=1e-12)
+
     def test_step_discrete(self):
         """Test step with discrete action."""
         env = OptionHedgingEnv(action_mode="discrete")
@@ -168,6 +192,30 @@ class TestOptionHedgingEnv:
         assert isinstance(metrics["total_pnl"], (int, float))
         assert metrics["num_rebalances"] >= 0
 
+    def test_episode_metrics_single_pass(self):
+        """Test fused aggregation matches NumPy reductions and is memoized."""
+        env = OptionHedgingEnv(n_steps=20)
+        env.reset(seed=7)
+
+        for _ in range(20):
+            env.step(env.action_space.sample())
+
+        metrics = env.get_episode_metrics()
+        pnl = np.array([h["pnl"] for h in env.history])
+        n_trades = sum(h["transaction_cost"] > 0 for h in env.history)
+
+        np.testing.assert_allclose(metrics["std_pnl"], np.std(pnl), rtol=1e-10)
+        np.testing.assert_allclose(metrics["mean_abs_pnl"], np.mean(np.abs(pnl)), rtol=1e-10)
+        np.testing.assert_allclose(
+            metrics["sharpe_ratio"], np.mean(pnl) / (np.std(pnl) + 1e-8), rtol=1e-8
+        )
+        assert metrics["max_drawdown"] == pnl.min()
+        assert metrics["num_trades"] == n_trades
+        np.testing.assert_allclose(
+            metrics["avg_position"], np.mean(np.abs(env.position_history)), rtol=1e-12
+        )
+        assert env.get_episode_metrics() is metrics
+
     def test_different_option_types(self):
         """Test environment works with both call and put options."""
         env_call = OptionHedgingEnv(option_type="call")
@@ -296,5 +344,116 @@ class TestEnvironmentEdgeCases:
             OptionHedgingEnv(option_type="invalid")
 
 
+class TestBatchedDynamics:
+    """Test the array-batched hedging dynamics."""
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_matches_single_env(self, option_type):
+        """Test a batch of one reproduces the environment under the same seed."""
+        env = OptionHedgingEnv(n_steps=20, option_type=option_type, transaction_cost=0.01)
+        obs, _ = env.reset(seed=7)
+
+        state, batch_obs = batch_reset(env, 1)
+        rng = np.random.default_rng(7)
+        np.testing.assert_allclose(batch_obs[0], obs, rtol=1e-6)
+
+        actions = np.linspace(-0.5, 1.5, env.n_steps)
+        for action in actions:
+            obs, reward, terminated, _, _ = env.step(np.array([action]))
+            batch_obs, rewards, done = batch_step(
+                env, state, np.array([[action]]), rng.standard_normal(1)
+            )
+
+            np.testing.assert_allclose(batch_obs[0], obs, rtol=1e-5, atol=1e-6)
+            assert rewards[0] == pytest.approx(reward, rel=1e-9)
+            assert done == terminated
+
+        metrics = env.get_episode_metrics()
+        batch_metrics = state.episode_metrics()
+        assert batch_metrics["total_pnl"][0] == pytest.approx(metrics["total_pnl"])
+        assert batch_metrics["total_costs"][0] == pytest.approx(metrics["total_costs"])
+        assert batch_metrics["sharpe_ratio"][0] == pytest.approx(metrics["sharpe_ratio"])
+
+    def test_discrete_actions(self):
+        """Test discrete actions adjust the position incrementally."""
+        env = OptionHedgingEnv(n_steps=5, action_mode="discrete")
+        state, _ = batch_reset(env, 3)
+
+        batch_step(env, state, np.array([4, 2, 0]), np.zeros(3))
+
+        np.testing.assert_allclose(state.position, [0.5, 0.0, -0.5])
+
+    def test_vec_env_episode_cycle(self):
+        """Test the VecEnv wrapper reports finished episodes and auto-resets."""
+        env = OptionHedgingEnv(n_steps=5)
+        vec_env = OptionHedgingVecEnv(env, n_envs=4)
+        vec_env.seed(0)
+
+        obs = vec_env.reset()
+        first_obs = obs.copy()
+        assert obs.shape == (4, 11)
+
+        for step in range(env.n_steps):
+            prev_obs = obs
+            obs, rewards, dones, infos = vec_env.step(np.full((4, 1), 0.5, dtype=np.float32))
+            assert rewards.shape == (4,)
+            # The previous observations are not overwritten by the next step
+            if step == 0:
+                np.testing.assert_array_equal(prev_obs, first_obs)
+
+        assert dones.all()
+        assert all("episode" in info and "terminal_observation" in info for info in infos)
+        assert infos[0]["episode"]["l"] == env.n_steps
+        np.testing.assert_allclose(obs, first_obs)
+
+    def test_vec_env_trains_ppo(self):
+        """Test Stable-Baselines3 can collect rollouts from the VecEnv."""
+        from stable_baselines3 import PPO
+
+        vec_env = OptionHedgingVecEnv(OptionHedgingEnv(n_steps=10), n_envs=4, seed=0)
+        model = PPO("MlpPolicy", vec_env, n_steps=16, batch_size=32, n_epochs=1, verbose=0)
+        model.learn(total_timesteps=128)
+
+        assert model.num_timesteps >= 128
+        assert len(model.ep_info_buffer) > 0
+
+    def test_shared_memory_vec_env_matches_dummy(self):
+        """Test shared-memory worker environments step like in-process ones."""
+        env_kwargs = {"n_steps": 5}
+        shm_env = make_vec_env(
+            OptionHedgingEnv,
+            n_envs=2,
+            seed=1,
+            env_kwargs=env_kwargs,
+            vec_env_cls=SharedMemoryVecEnv,
+        )
+        ref_env = make_vec_env(
+            OptionHedgingEnv, n_envs=2, seed=1, env_kwargs=env_kwargs, vec_env_cls=DummyVecEnv
+        )
+        rng = np.random.default_rng(0)
+
+        try:
+            obs, ref_obs = shm_env.reset(), ref_env.reset()
+            np.testing.assert_array_equal(obs, ref_obs)
+            for _ in range(7):
+                actions = rng.uniform(-1, 1, size=(2, 1)).astype(np.float32)
+                previous, previous_copy = obs, obs.copy()
+                obs, rewards, dones, infos = shm_env.step(actions)
+                ref_obs, ref_rewards, ref_dones, ref_infos = ref_env.step(actions)
+
+                # The previous step's observations are left untouched
+                np.testing.assert_array_equal(previous, previous_copy)
+                np.testing.assert_array_equal(obs, ref_obs)
+                np.testing.assert_allclose(rewards, ref_rewards)
+                np.testing.assert_array_equal(dones, ref_dones)
+                if dones[0]:
+                    np.testing.assert_array_equal(
+                        infos[0]["terminal_observation"], ref_infos[0]["terminal_observation"]
+                    )
+        finally:
+            shm_env.close()
+            ref_env.close()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])